@@ -1,12 +1,66 @@
-from .core import ZplCommandSender, FontDotsProperties, ZebraProperties, ZplDump, ZplCommand, ZplCommandParams
-from .core import ZplCommandsBlock
+import importlib
 
-from .enums import GraphicSymbol, ZplPrintOrientation, DiagonalOrientation, ZplOrientation, ZplDirection
-from .enums import ZplJustification, ZplFont, ZplCharSets
-from .enums import ZplStandardFonts6Dots, ZplStandardFonts8Dots, ZplStandardFonts12Dots, ZplStandardFonts24Dots
+# Os módulos são importados somente no primeiro acesso ao nome (PEP 562), reduzindo o tempo de inicialização
+_LAZY_ATTRIBUTES = {
+    'ZplCommandSender': '.core', 'FontDotsProperties': '.core', 'ZebraProperties': '.core', 'ZplDump': '.core',
+    'ZplCommand': '.core', 'ZplCommandParams': '.core', 'ZplCommandsBlock': '.core',
 
-from .commands import ZplCommands
+    'ZplLoweredBlock': '.lowering',
 
-from .printers import ZebraPrinter, ZebraPromptFakePrinter, ZebraNetworkPrinter
+    'GraphicSymbol': '.enums', 'ZplPrintOrientation': '.enums', 'DiagonalOrientation': '.enums',
+    'ZplOrientation': '.enums', 'ZplDirection': '.enums', 'ZplJustification': '.enums', 'ZplFont': '.enums',
+    'ZplCharSets': '.enums', 'ZplStandardFonts6Dots': '.enums', 'ZplStandardFonts8Dots': '.enums',
+    'ZplStandardFonts12Dots': '.enums', 'ZplStandardFonts24Dots': '.enums', 'ZPL_STANDARD_FONTS': '.enums',
 
-from .label import ZplLabel, ZplLabelField
+    'ZplCommands': '.commands',
+
+    'ZplSpoolWriter': '.spool', 'ZplSpoolFile': '.spool',
+
+    'ZebraResourceCache': '.resources', 'ZplStoredResource': '.resources',
+
+    'ZplFileSender': '.senders',
+
+    'ZebraPrinter': '.printers', 'ZebraPromptFakePrinter': '.printers', 'ZebraNetworkPrinter': '.printers',
+    'ZebraSerialPrinter': '.printers',
+
+    'ZplPrinterPoller': '.poller', 'ZplPrinterHealth': '.poller',
+
+    'ZplTraceRecorder': '.trace', 'ZplTraceReplayer': '.trace', 'ZplTraceRecord': '.trace',
+    'ZplReplayResult': '.trace', 'read_trace': '.trace',
+
+    'ZplValidator': '.validation', 'ZplValidationError': '.validation', 'ZplValidationIssue': '.validation',
+    'compile_command_validator': '.validation',
+
+    'ZplGraphic': '.graphics',
+
+    'ZplLabel': '.label', 'ZplLabelField': '.label', 'ZplSerial': '.label',
+
+    'ZplStoredFormat': '.formats',
+
+    'ZplColumnRenderer': '.columns',
+
+    'ZplRasterizer': '.raster',
+
+    'ZplBatchRenderer': '.batch',
+
+    'ZplPrintQueue': '.jobs',
+
+    'ZplTextMetrics': '.metrics', 'ZplTextFit': '.metrics',
+
+    'ZplTemplateCache': '.cache', 'layout_fingerprint': '.cache', 'template_cache': '.cache',
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,316 @@
+"""Linha de comando do pyzplcommander.
+
+Uso:
+    python -m pyzplcommander send ARQUIVO_OU_PASTA... --printer HOST[:PORTA]
+    python -m pyzplcommander query --inventory impressoras.txt --query HS
+    python -m pyzplcommander bench --labels 10000
+    python -m pyzplcommander replay trace.zpltrace --speed 0
+"""
+from __future__ import annotations
+from concurrent.futures import ThreadPoolExecutor
+import argparse
+import os
+import socket
+import statistics
+import sys
+import threading
+import time
+
+from pyzplcommander.batch import ZplBatchRenderer
+from pyzplcommander.label import ZplLabel
+from pyzplcommander.poller import ZplPrinterPoller
+from pyzplcommander.printers import ZebraNetworkPrinter, ZebraPromptFakePrinter
+from pyzplcommander.trace import ZplTraceReplayer
+
+
+_QUERIES = ('HS', 'ES', 'HA', 'JT', 'MA', 'MI', 'OD', 'PH', 'PP', 'SN', 'UI')
+
+
+def _parse_printer(spec: str, timeout: float) -> tuple[str, ZebraNetworkPrinter]:
+    """Cria a impressora a partir de 'host[:porta]', retorna o nome e a impressora."""
+    host, _, port = spec.partition(':')
+    return spec, ZebraNetworkPrinter(host, int(port) if port else 9100, timeout=timeout)
+
+
+def _load_printers(args: argparse.Namespace) -> dict[str, ZebraNetworkPrinter]:
+    """Retorna as impressoras informadas com --printer e no arquivo de inventário.
+
+    O inventário tem uma impressora por linha, 'host[:porta] [nome]', linhas vazias e comentários (#) são ignorados.
+    """
+    printers = dict(_parse_printer(spec, args.timeout) for spec in args.printer or ())
+    if args.inventory:
+        with open(args.inventory, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.split('#', 1)[0].split()
+                if not line:
+                    continue
+                spec, printer = _parse_printer(line[0], args.timeout)
+                printers[line[1] if len(line) > 1 else spec] = printer
+    if not printers:
+        raise SystemExit('Informe ao menos uma impressora com --printer ou --inventory.')
+    return printers
+
+
+def _zpl_files(paths: list[str]) -> list[str]:
+    """Expande as pastas de spool nos arquivos .zpl, em ordem de nome, ignorando os temporários ocultos."""
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            files.extend(os.path.join(path, name) for name in sorted(os.listdir(path))
+                         if name.endswith('.zpl') and not name.startswith('.'))
+        else:
+            files.append(path)
+    return files
+
+
+def _report(title: str, latencies: list[float], count: int, total_bytes: int, elapsed: float) -> None:
+    """Imprime a vazão e as latências (em milissegundos) de uma operação."""
+    elapsed = max(elapsed, 1e-9)
+    print(f'{title}: {count} em {elapsed:.3f} s, {count / elapsed:.1f}/s, {total_bytes / elapsed / 1e6:.2f} MB/s')
+    if not latencies:
+        return
+    latencies = sorted(latency * 1000 for latency in latencies)
+    p95 = statistics.quantiles(latencies, n=20, method='inclusive')[-1] if len(latencies) > 1 else latencies[0]
+    print(f'  latência ms: min {latencies[0]:.2f}  p50 {statistics.median(latencies):.2f}  p95 {p95:.2f}  '
+          f'max {latencies[-1]:.2f}')
+
+
+def _send(args: argparse.Namespace) -> int:
+    """Envia arquivos ZPL ou pastas de spool para as impressoras."""
+    printers = _load_printers(args)
+    files = _zpl_files(args.paths)
+    names = list(printers)
+    if args.split:
+        jobs = {name: files[index::len(names)] for index, name in enumerate(names)}
+    else:
+        jobs = {name: files for name in names}
+
+    def send_files(name: str) -> tuple[str, list[float], int, str | None]:
+        printer = printers[name]
+        latencies, sent = [], 0
+        try:
+            for file_name in jobs[name]:
+                start = time.perf_counter()
+                sent += printer.send_file(file_name)
+                latencies.append(time.perf_counter() - start)
+        except OSError as error:
+            return name, latencies, sent, str(error)
+        return name, latencies, sent, None
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.workers) as executor:
+        results = list(executor.map(send_files, names))
+    elapsed = time.perf_counter() - start
+
+    failures = 0
+    all_latencies, total_bytes = [], 0
+    for name, latencies, sent, error in results:
+        print(f'{name}: {len(latencies)} arquivo(s), {sent} bytes' + (f', erro: {error}' if error else ''))
+        failures += error is not None
+        all_latencies.extend(latencies)
+        total_bytes += sent
+    _report('arquivos enviados', all_latencies, len(all_latencies), total_bytes, elapsed)
+    return 1 if failures else 0
+
+
+def _query(args: argparse.Namespace) -> int:
+    """Consulta o status (~HS) ou informações (~HQ) das impressoras em paralelo.
+
+    Retorna 1 se alguma impressora não responder ou, no ~HS, reportar uma falha (ex: paper_out).
+    """
+    printers = _load_printers(args)
+    poller = ZplPrinterPoller(printers, workers=args.workers)
+
+    def run(name: str) -> tuple[str, float, str, bool]:
+        start = time.perf_counter()
+        if args.query == 'HS':
+            health = poller.poll(name)
+            detail = health.state + (f' ({", ".join(health.errors)})' if health.errors else '')
+            if health.failure:
+                detail += f': {health.failure}'
+            failed = health.state in ('error', 'offline')
+        else:
+            try:
+                detail = ' '.join(printers[name].host_query(args.query).split())
+                failed = False
+            except OSError as error:
+                detail, failed = f'offline: {error}', True
+        return name, time.perf_counter() - start, detail, failed
+
+    start = time.perf_counter()
+    try:
+        with ThreadPoolExecutor(max_workers=args.workers) as executor:
+            results = list(executor.map(run, printers))
+    finally:
+        poller.stop()
+    elapsed = time.perf_counter() - start
+
+    for name, latency, detail, _ in results:
+        print(f'{name}: {detail} [{latency * 1000:.1f} ms]')
+    _report(f'consultas ~{args.query}', [latency for _, latency, _, _ in results], len(results), 0, elapsed)
+    return 1 if any(failed for _, _, _, failed in results) else 0
+
+
+class _LoopbackPrinter:
+    """Emulador de impressora local para o teste de vazão, conta os bytes recebidos e responde ao ~HS."""
+
+    def __init__(self):
+        self.received = 0
+        self._lock = threading.Lock()
+        self._server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._server.bind(('127.0.0.1', 0))
+        self._server.listen(16)
+        self.port = self._server.getsockname()[1]
+        self._status = ZebraPromptFakePrinter.load_cmd_file('hs').encode('UTF-8')
+        threading.Thread(target=self._accept, daemon=True).start()
+
+    def _accept(self) -> None:
+        while True:
+            try:
+                connection, _ = self._server.accept()
+            except OSError:
+                return
+            threading.Thread(target=self._serve, args=(connection,), daemon=True).start()
+
+    def _serve(self, connection: socket.socket) -> None:
+        with connection:
+            tail = b''
+            while True:
+                data = connection.recv(1 << 20)
+                if not data:
+                    return
+                with self._lock:
+                    self.received += len(data)
+                if b'~HS' in tail + data:
+                    connection.sendall(self._status)
+                tail = data[-2:]
+
+    def close(self) -> None:
+        self._server.close()
+
+
+def _bench_label(number: int) -> ZplLabel:
+    """Etiqueta usada no teste de vazão."""
+    label = ZplLabel(None)
+    label.font('0', 30, 30)
+    label.draw_text(f'ITEM {number:08d}', 20, 20)
+    label.draw_text(f'LOTE {number // 100:06d}', 20, 60, height=20, width=20)
+    label.new_field(20, 100).data(f'{number * 7919 % 1000003:07d}')
+    return label
+
+
+def _bench(args: argparse.Namespace) -> int:
+    """Renderiza etiquetas em lote e envia para uma impressora ou para o emulador local."""
+    emulator = None
+    if args.printer:
+        _, printer = _parse_printer(args.printer, args.timeout)
+    else:
+        emulator = _LoopbackPrinter()
+        printer = ZebraNetworkPrinter('127.0.0.1', emulator.port, timeout=args.timeout)
+    printer.auto_close_conn_on_send = False
+
+    renderer = ZplBatchRenderer(_bench_label, workers=args.workers, chunk_size=args.chunk_size)
+    latencies, total_bytes = [], 0
+    start = time.perf_counter()
+    try:
+        for chunk in renderer.render(range(args.labels)):
+            chunk_start = time.perf_counter()
+            printer.send_command(chunk.decode('UTF-8'))
+            latencies.append(time.perf_counter() - chunk_start)
+            total_bytes += len(chunk)
+        status_start = time.perf_counter()
+        status = printer.host_status_dict()
+        status_latency = time.perf_counter() - status_start
+    finally:
+        if printer.connection is not None:
+            printer.disconnect()
+    elapsed = time.perf_counter() - start
+
+    _report('etiquetas', [], args.labels, total_bytes, elapsed)
+    _report('blocos enviados', latencies, len(latencies), total_bytes, sum(latencies))
+    print(f'~HS: {"ok" if status else "sem resposta"} [{status_latency * 1000:.1f} ms]')
+    if emulator is not None:
+        emulator.close()
+        print(f'emulador: {emulator.received} bytes recebidos')
+    return 0
+
+
+def _replay(args: argparse.Namespace) -> int:
+    """Reproduz um trace gravado com ZplTraceRecorder em uma impressora ou no emulador local."""
+    replayer = ZplTraceReplayer(args.trace, speed=args.speed or None)
+    emulator = None
+    if args.printer:
+        _, printer = _parse_printer(args.printer, args.timeout)
+    else:
+        emulator = _LoopbackPrinter()
+        printer = ZebraNetworkPrinter('127.0.0.1', emulator.port, timeout=args.timeout)
+    printer.auto_close_conn_on_send = False
+
+    try:
+        result = replayer.replay(printer)
+    finally:
+        if printer.connection is not None:
+            printer.disconnect()
+
+    print(f'trace: {len(replayer.records)} comando(s) gravados em {result.recorded:.3f} s')
+    _report('comandos reproduzidos', [], result.commands, result.sent_bytes, result.elapsed)
+    if result.latencies:
+        _report('consultas', list(result.latencies), result.queries, 0, sum(result.latencies))
+    if emulator is not None:
+        emulator.close()
+        print(f'emulador: {emulator.received} bytes recebidos')
+    return 0
+
+
+def main(argv: list[str] = None) -> int:
+    """Executa a linha de comando.
+
+    Args:
+        argv (list[str], optional): Argumentos, por padrão os da linha de comando.
+
+    Returns:
+        int: Código de saída.
+    """
+    parser = argparse.ArgumentParser(prog='python -m pyzplcommander', description='Ferramentas de impressão ZPL.')
+    parser.add_argument('--timeout', type=float, default=5, help='Tempo limite da conexão em segundos (default: 5)')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    def add_printer_args(subparser: argparse.ArgumentParser) -> None:
+        subparser.add_argument('--printer', '-p', action='append', help='Impressora HOST[:PORTA], pode repetir')
+        subparser.add_argument('--inventory', '-i', help='Arquivo com uma impressora HOST[:PORTA] [NOME] por linha')
+        subparser.add_argument('--workers', '-w', type=int, default=16,
+                               help='Impressoras atendidas em paralelo (default: 16)')
+
+    send = subparsers.add_parser('send', help='Envia arquivos ZPL ou pastas de spool')
+    send.add_argument('paths', nargs='+', help='Arquivos .zpl ou pastas de spool')
+    add_printer_args(send)
+    send.add_argument('--split', action='store_true',
+                      help='Distribui os arquivos entre as impressoras em vez de enviar todos para cada uma')
+    send.set_defaults(handler=_send)
+
+    query = subparsers.add_parser('query', help='Consulta o status (~HS) ou informações (~HQ) das impressoras')
+    add_printer_args(query)
+    query.add_argument('--query', '-q', choices=_QUERIES, default='HS', help='Consulta (default: HS)')
+    query.set_defaults(handler=_query)
+
+    bench = subparsers.add_parser('bench', help='Teste de vazão com o emulador local ou uma impressora')
+    bench.add_argument('--printer', '-p', help='Impressora HOST[:PORTA], por padrão usa o emulador local')
+    bench.add_argument('--labels', '-n', type=int, default=10000, help='Quantidade de etiquetas (default: 10000)')
+    bench.add_argument('--workers', '-w', type=int, default=None,
+                       help='Processos de renderização (default: quantidade de CPUs)')
+    bench.add_argument('--chunk-size', type=int, default=1000, help='Etiquetas por bloco (default: 1000)')
+    bench.set_defaults(handler=_bench)
+
+    replay = subparsers.add_parser('replay', help='Reproduz um trace gravado com ZplTraceRecorder')
+    replay.add_argument('trace', help='Arquivo do trace')
+    replay.add_argument('--printer', '-p', help='Impressora HOST[:PORTA], por padrão usa o emulador local')
+    replay.add_argument('--speed', '-s', type=float, default=1,
+                        help='Fator de velocidade, 0 para a velocidade máxima (default: 1)')
+    replay.set_defaults(handler=_replay)
+
+    args = parser.parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,326 @@
+from __future__ import annotations
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, Executor
+from itertools import islice
+from typing import Callable, Iterable, Iterator
+import os
+import re
+
+from pyzplcommander.core import ZebraProperties, ZplCommandSender, ZplDump
+from pyzplcommander.commands import ZplCommands
+from pyzplcommander.formats import ZplStoredFormat
+from pyzplcommander.label import ZplSerial
+from pyzplcommander.spool import ZplSpoolWriter
+
+
+_LABEL_END = str(ZplCommands.LABEL_END_BLOCK)
+_LABEL_QUANTITY = str(ZplCommands.LABEL_QUANTITY)
+_QUANTITY_REG = re.compile(re.escape(_LABEL_QUANTITY) + r'([^\^~]*)')
+_SERIALIZATION = (str(ZplCommands.SERIALIZATION_DATA), str(ZplCommands.SERIALIZATION_FIELD))
+
+
+def _render_record(builder: Callable[[any], ZplDump] | ZplStoredFormat, record: any) -> ZplDump:
+    """Cria a etiqueta de um registro usando a função construtora ou o formato armazenado."""
+    if isinstance(builder, ZplStoredFormat):
+        return builder.recall(record)
+    return builder(record)
+
+
+def apply_label_quantity(zpl: str, count: int) -> str:
+    """Multiplica a quantidade (^PQ) de uma etiqueta renderizada, mantendo os demais parâmetros do ^PQ.
+    Caso a etiqueta não possua ^PQ, ele é adicionado antes do ^XZ.
+
+    Em etiquetas serializadas (^SN/^SF) a impressora incrementa o valor a cada etiqueta, então as cópias de cada
+    valor são mantidas com as réplicas do ^PQ: ^PQn vira ^PQ{n * count},,{n}, imprimindo count valores com n
+    cópias cada.
+
+    Args:
+        zpl (str): Etiqueta renderizada.
+        count (int): Multiplicador da quantidade.
+
+    Raises:
+        ValueError: Se a etiqueta serializada já imprimir mais de um valor, ex: ^PQ3 sem réplicas.
+    """
+    if count <= 1:
+        return zpl
+    match = _QUANTITY_REG.search(zpl)
+    if match is not None:
+        params = match.group(1).split(',')
+        quantity = int(params[0] or 1)
+        params[0] = str(quantity * count)
+        if quantity > 1 and any(command in zpl for command in _SERIALIZATION):
+            params += [''] * (3 - len(params))
+            if int(params[2] or 0) < quantity:
+                raise ValueError('Serialized label already prints more than one value per record.')
+            params[2] = str(quantity)
+        return zpl[:match.start(1)] + ','.join(params) + zpl[match.end(1):]
+    end = zpl.rfind(_LABEL_END)
+    if end < 0:
+        raise ValueError('Label end (^XZ) not found.')
+    return zpl[:end] + _LABEL_QUANTITY + str(count) + zpl[end:]
+
+
+def _render_items(builder: Callable[[any], ZplDump] | ZplStoredFormat, items: list[tuple[any, int]],
+                  zebra_props: ZebraProperties | None, break_lines: bool) -> list[list[str | int | bool]]:
+    """Renderiza um lote agrupando etiquetas idênticas consecutivas, executado dentro dos processos de trabalho.
+
+    Returns:
+        list[list[str | int | bool]]: Etiqueta, quantidade e se pode ser agrupada com as etiquetas seguintes.
+    """
+    result = []
+    previous = None
+    for record, count in items:
+        zpl = _render_record(builder, record).dump_zpl(zebra_props, break_lines)
+        # Etiquetas serializadas (^SN/^SF ou quantidade > 1) não podem ser somadas, cada uma recomeça do valor
+        # inicial e no ^PQ somado a impressora incrementaria o valor a cada cópia
+        mergeable = count == 1 and not any(command in zpl for command in _SERIALIZATION)
+        if mergeable and previous is not None and previous[2] and previous[0] == zpl:
+            previous[1] += 1
+            continue
+        previous = [zpl, count, mergeable]
+        result.append(previous)
+    return result
+
+
+def _render_chunk(builder: Callable[[any], ZplDump] | ZplStoredFormat, items: list[tuple[any, int]],
+                  zebra_props: ZebraProperties | None, break_lines: bool) -> bytes:
+    """Renderiza um lote de registros com as suas quantidades, executado dentro dos processos de trabalho."""
+    separator = '\r\n' if break_lines else ''
+    labels = []
+    for record, count in items:
+        labels.append(apply_label_quantity(_render_record(builder, record).dump_zpl(zebra_props, break_lines),
+                                           count))
+    return separator.join(labels).encode('UTF-8') + separator.encode('UTF-8')
+
+
+def _serial_number(value: any) -> int | None:
+    """Converte o valor serializável do registro em inteiro, None se não for um número não negativo."""
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, int):
+        return value if value >= 0 else None
+    if isinstance(value, str) and value.isdigit() and len(value) <= 12:
+        return int(value)
+    return None
+
+
+def _replace_key(record: any, key: str | int, value: any) -> any:
+    """Retorna uma cópia do registro com a chave substituída."""
+    if isinstance(record, dict):
+        record = dict(record)
+    else:
+        record = list(record)
+    record[key] = value
+    return record
+
+
+def fold_serial_runs(records: Iterable[any], key: str | int) -> Iterator[tuple[any, int]]:
+    """Agrupa sequências de registros que só diferem por um número sequencial.
+
+    Registros consecutivos iguais exceto pela chave, cujo valor aumenta ou diminui sempre do mesmo incremento,
+    são agrupados em um único registro com um ZplSerial na chave e a quantidade de etiquetas da sequência.
+    Valores com zeros à esquerda só são agrupados com valores de mesmo tamanho.
+
+    Args:
+        records (Iterable[any]): Registros, dicionários ou sequências.
+        key (str | int): Chave ou índice do número sequencial.
+
+    Returns:
+        Iterator[tuple[any, int]]: Registro e quantidade de etiquetas.
+    """
+    first = first_raw = rest = None
+    last = step = None
+    count = 0
+    padded = False
+
+    def flush():
+        if count == 1:
+            return first, 1
+        serial = ZplSerial(first_raw, step, padded)
+        return _replace_key(first, key, serial), count
+
+    for record in records:
+        raw = record[key]
+        value = _serial_number(raw)
+        record_rest = _replace_key(record, key, None) if value is not None else None
+
+        if count and value is not None and record_rest == rest:
+            # Troca de tipo entre texto e inteiro encerra a sequência, como uma mudança de formato
+            same_format = raw.__class__ is first_raw.__class__ and (
+                len(raw) == len(first_raw) if padded else str(raw) == str(value))
+            if same_format and ((count == 1 and value != last) or (count > 1 and value - last == step)):
+                step = value - last if count == 1 else step
+                last = value
+                count += 1
+                continue
+
+        if count:
+            yield flush()
+
+        first, first_raw, rest, last, step, count = record, raw, record_rest, value, None, 1
+        padded = isinstance(raw, str) and len(raw) > 1 and raw[0] == '0'
+        if value is None:
+            yield first, 1
+            count = 0
+
+    if count:
+        yield flush()
+
+
+class ZplBatchRenderer:
+    """Renderizador de etiquetas em lote, distribuindo os registros entre processos.
+
+    Cada processo de trabalho cria as suas próprias etiquetas a partir dos registros, o resultado é devolvido em
+    blocos de bytes na mesma ordem dos registros.
+
+    A função construtora precisa ser serializável com pickle (definida no nível do módulo), ela recebe um registro e
+    retorna a etiqueta, ex: ZplLabel. Também pode ser informado um ZplStoredFormat, nesse caso cada registro são os
+    valores dos campos variáveis, o formato é enviado aos processos sem a impressora do template.
+
+    Args:
+        builder (Callable[[any], ZplDump] | ZplStoredFormat): Função construtora da etiqueta ou formato armazenado.
+        zebra_props (ZebraProperties, optional): Propriedades da impressora usadas na renderização.
+        workers (int, optional): Quantidade de processos, 1 renderiza no processo atual (default: os.cpu_count()).
+        chunk_size (int, optional): Quantidade de registros por bloco enviado aos processos (default: 1000).
+        break_lines (bool, optional): Quebra de linha no ZPL gerado (default: False).
+        serial_key (str | int, optional): Chave do número sequencial dos registros, as sequências são agrupadas em
+                                          uma única etiqueta serializada pela impressora (^SN) com quantidade (^PQ),
+                                          considerando um único valor impresso por registro. Cópias do
+                                          valor (^PQn com réplicas n) são mantidas com as réplicas do ^PQ.
+        collapse_duplicates (bool, optional): Agrupa etiquetas renderizadas idênticas e consecutivas em uma única
+                                              etiqueta, multiplicando a quantidade do ^PQ, exceto etiquetas
+                                              serializadas com ^SN ou ^SF (default: False).
+    """
+
+    builder: Callable[[any], ZplDump] | ZplStoredFormat
+    zebra_props: ZebraProperties | None
+    workers: int
+    chunk_size: int
+    break_lines: bool
+    serial_key: str | int | None
+    collapse_duplicates: bool
+
+    formats_saved: int  # Etiquetas agrupadas pelo ^PQ na última renderização
+
+    def __init__(self, builder: Callable[[any], ZplDump] | ZplStoredFormat, zebra_props: ZebraProperties = None,
+                 workers: int = None, chunk_size: int = 1000, break_lines: bool = False,
+                 serial_key: str | int = None, collapse_duplicates: bool = False):
+        self.builder = builder
+        self.zebra_props = zebra_props
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self.break_lines = break_lines
+        self.serial_key = serial_key
+        self.collapse_duplicates = collapse_duplicates
+        self.formats_saved = 0
+
+    def _chunks(self, records: Iterable[any]) -> Iterator[list[tuple[any, int]]]:
+        if self.serial_key is not None:
+            iterator = fold_serial_runs(records, self.serial_key)
+        else:
+            iterator = ((record, 1) for record in records)
+        while True:
+            chunk = list(islice(iterator, self.chunk_size))
+            if not chunk:
+                return
+            yield chunk
+
+    def _results(self, records: Iterable[any], executor: Executor = None) -> Iterator[any]:
+        """Executa a renderização dos lotes, no processo atual ou no executor, retornando os resultados em ordem."""
+        render_function = _render_items if self.collapse_duplicates else _render_chunk
+
+        if executor is None and self.workers <= 1:
+            for chunk in self._chunks(records):
+                yield render_function(self.builder, chunk, self.zebra_props, self.break_lines)
+            return
+
+        own_executor = executor is None
+        executor = executor or ProcessPoolExecutor(max_workers=self.workers)
+        try:
+            pending = deque()
+            for chunk in self._chunks(records):
+                pending.append(executor.submit(render_function, self.builder, chunk, self.zebra_props,
+                                               self.break_lines))
+                if len(pending) >= self.workers * 2:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            if own_executor:
+                executor.shutdown(cancel_futures=True)
+
+    def _encode_items(self, items: list[list[str | int | bool]]) -> bytes:
+        """Aplica as quantidades das etiquetas agrupadas e codifica o bloco."""
+        separator = '\r\n' if self.break_lines else ''
+        labels = []
+        for zpl, count, duplicates in items:
+            if duplicates:
+                self.formats_saved += count - 1
+            labels.append(apply_label_quantity(zpl, count))
+        return separator.join(labels).encode('UTF-8') + separator.encode('UTF-8')
+
+    def render(self, records: Iterable[any], executor: Executor = None) -> Iterator[bytes]:
+        """Renderiza os registros e retorna os blocos de ZPL em ordem.
+
+        Os registros são consumidos sob demanda, mantendo no máximo dois blocos por processo em andamento.
+        Com collapse_duplicates, a quantidade de etiquetas economizadas fica em formats_saved.
+
+        Args:
+            records (Iterable[any]): Registros das etiquetas.
+            executor (Executor, optional): Executor já criado, por padrão é criado um ProcessPoolExecutor.
+
+        Returns:
+            Iterator[bytes]: Blocos de ZPL codificados em UTF-8, um por lote de registros.
+        """
+        self.formats_saved = 0
+        if not self.collapse_duplicates:
+            yield from self._results(records, executor)
+            return
+
+        # A última etiqueta de cada lote é mantida até o próximo, para agrupar duplicadas entre lotes
+        carry = None
+        for items in self._results(records, executor):
+            if not items:
+                continue
+            first = items[0]
+            if carry is not None and carry[2] and first[2] and carry[0] == first[0]:
+                first[1] += carry[1]
+                carry = None
+            output = ([carry] if carry is not None else []) + items[:-1]
+            carry = items[-1]
+            if output:
+                yield self._encode_items(output)
+        if carry is not None:
+            yield self._encode_items([carry])
+
+    def render_to_file(self, records: Iterable[any], file_name: str) -> int:
+        """Renderiza os registros diretamente para um arquivo de spool, com o índice das etiquetas.
+
+        Args:
+            records (Iterable[any]): Registros das etiquetas.
+            file_name (str): Caminho do arquivo de spool.
+
+        Returns:
+            int: Quantidade de bytes escritos.
+        """
+        written = 0
+        with ZplSpoolWriter(file_name) as spool:
+            for chunk in self.render(records):
+                written += spool.write(chunk)
+        return written
+
+    def send(self, records: Iterable[any], printer: ZplCommandSender) -> int:
+        """Renderiza os registros e envia os blocos para a impressora conforme ficam prontos.
+
+        Args:
+            records (Iterable[any]): Registros das etiquetas.
+            printer (ZplCommandSender): Impressora de destino.
+
+        Returns:
+            int: Quantidade de etiquetas economizadas pelo agrupamento de duplicadas.
+        """
+        if isinstance(self.builder, ZplStoredFormat):
+            self.builder.store(printer)
+        for chunk in self.render(records):
+            printer.send_command(chunk.decode('UTF-8'))
+        return self.formats_saved
@@ -0,0 +1,186 @@
+from __future__ import annotations
+from collections import OrderedDict
+from dataclasses import astuple
+from typing import Callable, Hashable
+import hashlib
+import threading
+
+from pyzplcommander.core import ZebraProperties, ZplCommandsBlock, ZplCommandParams, ZplDump
+
+
+def _update_fingerprint(digest, command: ZplCommandsBlock | ZplCommandParams | ZplDump | str) -> None:
+    """Adiciona a estrutura de um comando ao hash."""
+    if isinstance(command, ZplCommandsBlock):
+        digest.update(b'\x01' + type(command).__qualname__.encode('UTF-8') + b'\x00' +
+                      str(command.start_block).encode('UTF-8') + b'\x00' + str(command.end_block).encode('UTF-8'))
+        for position in sorted(command.commands.keys()):
+            digest.update(b'\x02' + position.encode('UTF-8'))
+            for child in command.commands[position]:
+                _update_fingerprint(digest, child)
+        digest.update(b'\x03')
+    elif isinstance(command, ZplCommandParams):
+        digest.update(b'\x04' + str(command.command).encode('UTF-8'))
+        for param in command.params or ():
+            digest.update(b'\x05' if param is None else b'\x06' + param.encode('UTF-8'))
+    elif isinstance(command, ZplDump):
+        digest.update(b'\x07' + type(command).__qualname__.encode('UTF-8') + b'\x00' +
+                      command.dump_zpl(None, False).encode('UTF-8'))
+    else:
+        digest.update(b'\x08' + str(command).encode('UTF-8'))
+    digest.update(b'\x00')
+
+
+def layout_fingerprint(block: ZplDump, zebra_props: ZebraProperties = None, break_lines: bool = True) -> str:
+    """Retorna a impressão digital estrutural de um bloco de comandos ZPL.
+
+    Dois blocos com a mesma estrutura de comandos e parâmetros e as mesmas propriedades da impressora têm a mesma
+    impressão digital, mesmo sendo objetos diferentes.
+
+    Args:
+        block (ZplDump): Bloco de comandos, ex: ZplLabel.
+        zebra_props (ZebraProperties, optional): Propriedades da impressora.
+        break_lines (bool, optional): Quebra de linha.
+
+    Returns:
+        str: Hash hexadecimal da estrutura.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(repr(astuple(zebra_props)).encode('UTF-8') if zebra_props is not None else b'-')
+    digest.update(b'1' if break_lines else b'0')
+    _update_fingerprint(digest, block)
+    return digest.hexdigest()
+
+
+class ZplTemplateCache:
+    """Cache LRU de layouts renderizados.
+
+    Com get_or_build() a chave é informada pelo chamador, ex: nome do template e os argumentos do construtor, e um
+    acerto não constrói nem percorre a árvore de comandos. dump() indexa pela impressão digital estrutural de um
+    bloco já construído, que percorre a árvore inteira a cada chamada.
+
+    O cache é seguro para uso entre threads e remove os layouts usados há mais tempo ao exceder a quantidade
+    máxima de layouts ou de bytes armazenados.
+
+    Args:
+        max_entries (int, optional): Quantidade máxima de layouts (default: 256).
+        max_bytes (int, optional): Tamanho máximo dos layouts armazenados, em caracteres (default: 16 MiB).
+    """
+
+    max_entries: int
+    max_bytes: int
+
+    hits: int
+    misses: int
+    evictions: int
+
+    def __init__(self, max_entries: int = 256, max_bytes: int = 16 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[Hashable, str] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> str | None:
+        """Retorna o layout armazenado na chave, None se não existir.
+
+        Args:
+            key (Hashable): Chave do layout, ex: impressão digital.
+        """
+        with self._lock:
+            zpl = self._entries.get(key)
+            if zpl is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return zpl
+
+    def put(self, key: Hashable, zpl: str) -> None:
+        """Armazena um layout, removendo os usados há mais tempo se necessário.
+
+        Args:
+            key (Hashable): Chave do layout.
+            zpl (str): Código ZPL renderizado.
+        """
+        if len(zpl) > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= len(previous)
+            self._entries[key] = zpl
+            self._bytes += len(zpl)
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= len(evicted)
+                self.evictions += 1
+
+    def get_or_build(self, key: Hashable, builder: Callable[..., ZplDump], *args, zebra_props: ZebraProperties = None,
+                     break_lines: bool = True) -> str:
+        """Retorna o ZPL do template, construindo e renderizando o bloco somente se a chave não estiver no cache.
+
+        A chave do cache combina key, args, zebra_props e break_lines, então key deve identificar o template e o
+        construtor, ex: 'etiqueta-produto' ou o próprio construtor.
+
+        Args:
+            key (Hashable): Chave do template.
+            builder (Callable[..., ZplDump]): Função que constrói o bloco, chamada com args somente na falha.
+            *args: Argumentos do construtor, devem ser hashable.
+            zebra_props (ZebraProperties, optional): Propriedades da impressora.
+            break_lines (bool, optional): Quebra de linha.
+
+        Returns:
+            str: Código ZPL do template.
+        """
+        cache_key = (key, args, None if zebra_props is None else astuple(zebra_props), break_lines)
+        zpl = self.get(cache_key)
+        if zpl is None:
+            zpl = builder(*args).dump_zpl(zebra_props, break_lines)
+            self.put(cache_key, zpl)
+        return zpl
+
+    def dump(self, block: ZplDump, zebra_props: ZebraProperties = None, break_lines: bool = True) -> str:
+        """Retorna o ZPL do bloco, renderizando somente se o layout ainda não estiver no cache.
+
+        Note:
+            A impressão digital percorre a árvore inteira a cada chamada e o bloco já precisa estar construído,
+            para evitar os dois custos use get_or_build().
+
+        Args:
+            block (ZplDump): Bloco de comandos, ex: ZplLabel.
+            zebra_props (ZebraProperties, optional): Propriedades da impressora.
+            break_lines (bool, optional): Quebra de linha.
+        """
+        key = layout_fingerprint(block, zebra_props, break_lines)
+        zpl = self.get(key)
+        if zpl is None:
+            zpl = block.dump_zpl(zebra_props, break_lines)
+            self.put(key, zpl)
+        return zpl
+
+    def clear(self) -> None:
+        """Remove todos os layouts e zera as estatísticas."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> dict[str, int]:
+        """Retorna as estatísticas do cache: acertos, falhas, remoções, layouts e bytes armazenados."""
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'entries': len(self._entries),
+                'bytes': self._bytes,
+            }
+
+
+template_cache = ZplTemplateCache()  # Cache compartilhado pelo processo
@@ -0,0 +1,207 @@
+from __future__ import annotations
+from itertools import islice, repeat
+from typing import Callable, IO, Iterable, Iterator, Mapping
+import io
+
+from pyzplcommander.core import ZplCommandSender
+from pyzplcommander.commands import ZplCommands
+from pyzplcommander.formats import ZplStoredFormat
+from pyzplcommander.label import ZplLabelField, field_escape_table
+
+
+_SEPARATOR = '\x00'  # Separador das colunas unidas para o escape, não pertence à tabela de escape
+
+
+_MISSING_TYPES = frozenset(('NAType', 'NaTType'))  # pd.NA e pd.NaT, identificados sem importar o pandas
+
+
+def _is_missing(value: any) -> bool:
+    """Indica se o valor é ausente: None, NaN, pd.NA ou pd.NaT."""
+    if value is None:
+        return True
+    if value.__class__ is float:
+        return value != value
+    return value.__class__.__name__ in _MISSING_TYPES
+
+
+def _column_values(column: any, start: int, stop: int) -> list:
+    """Retorna os valores de um trecho da coluna como lista, aceita listas, arrays NumPy e séries do pandas.
+
+    Os valores ausentes (NaN, pd.NA, pd.NaT) são convertidos para None, não enviando o campo.
+    """
+    if hasattr(column, 'to_numpy'):
+        column = column.to_numpy()
+    values = column[start:stop]
+    values = values.tolist() if hasattr(values, 'tolist') else list(values)
+    if all(value.__class__ is str for value in values):
+        return values
+    return [None if _is_missing(value) else value for value in values]
+
+
+def _to_text(values: list, value_format: str | Callable[[any], str] | None) -> list[str | None]:
+    """Converte os valores de uma coluna para texto, mantendo None para os valores ausentes."""
+    if value_format is None:
+        if all(value.__class__ is str for value in values):
+            return values
+        return [None if value is None else value if value.__class__ is str else str(value) for value in values]
+    if callable(value_format):
+        return [None if value is None else value_format(value) for value in values]
+    return [None if value is None else format(value, value_format) for value in values]
+
+
+def _escape_column(values: list[str | None], table: dict[int, str]) -> tuple[list[str | None], bool]:
+    """Faz o escape de uma coluna inteira com uma única chamada de str.translate.
+
+    Returns:
+        list[str | None]: Valores com escape.
+        bool: True se algum valor foi alterado.
+    """
+    present = [value for value in values if value is not None]
+    joined = _SEPARATOR.join(present)
+    escaped = joined.translate(table)
+    if len(escaped) == len(joined):
+        return values, False
+
+    parts = escaped.split(_SEPARATOR)
+    if len(parts) != len(present):  # Algum valor contém o separador, escape valor a valor
+        parts = [value.translate(table) for value in present]
+    if len(present) == len(values):
+        return parts, True
+    parts = iter(parts)
+    return [None if value is None else next(parts) for value in values], True
+
+
+class ZplColumnRenderer:
+    """Renderiza etiquetas de um formato armazenado a partir de dados em colunas.
+
+    Os campos variáveis (^FN) do formato são ligados a colunas de dados, e cada bloco de linhas é convertido,
+    formatado e escapado coluna a coluna, sem criar objetos de etiqueta por linha. O resultado é gerado em blocos,
+    podendo ser escrito em um arquivo ou enviado para a impressora conforme fica pronto.
+
+    A saída de cada linha é equivalente a ZplStoredFormat.recall(), valores None não enviam o campo e o campo
+    usa o valor do formato. Quando algum valor de um campo precisa de escape, o campo recebe ^FH no bloco.
+
+    Args:
+        stored_format (ZplStoredFormat): Formato armazenado com os campos variáveis.
+        fields (Mapping[int, str]): Número do campo (^FN) -> nome da coluna.
+        formats (Mapping[str, str | Callable[[any], str]], optional): Formatação por coluna, especificação do
+                                                                       format() (ex: '08d') ou função.
+        escape (bool, optional): Faz o escape dos caracteres especiais, como ZplLabelField.data() (default: True).
+        chunk_rows (int, optional): Quantidade de linhas por bloco gerado (default: 10000).
+    """
+
+    stored_format: ZplStoredFormat
+    fields: dict[int, str]
+    formats: dict[str, str | Callable[[any], str]]
+    escape: bool
+    chunk_rows: int
+
+    def __init__(self, stored_format: ZplStoredFormat, fields: Mapping[int, str],
+                 formats: Mapping[str, str | Callable[[any], str]] = None, escape: bool = True,
+                 chunk_rows: int = 10000):
+        self.stored_format = stored_format
+        self.fields = dict(sorted(fields.items()))
+        self.formats = dict(formats or {})
+        self.escape = escape
+        self.chunk_rows = chunk_rows
+
+    def _chunks(self, columns: Mapping[str, any] | Iterable[Mapping[str, any]]) -> Iterator[dict[str, list]]:
+        """Divide os dados em blocos de colunas, lendo as linhas sob demanda quando os dados são um iterável."""
+        names = set(self.fields.values())
+        if isinstance(columns, Mapping):
+            missing = names.difference(columns)
+            if missing:
+                raise ValueError(f'Missing columns: {", ".join(sorted(missing))}.')
+            lengths = {name: len(columns[name]) for name in names}
+            if len(set(lengths.values())) > 1:
+                raise ValueError('Columns have different lengths: ' +
+                                 ', '.join(f'{name}={length}' for name, length in sorted(lengths.items())) + '.')
+            rows = next(iter(lengths.values()), 0)
+            for start in range(0, rows, self.chunk_rows):
+                stop = min(start + self.chunk_rows, rows)
+                yield {name: _column_values(columns[name], start, stop) for name in names}
+            return
+
+        rows = iter(columns)
+        while True:
+            chunk = list(islice(rows, self.chunk_rows))
+            if not chunk:
+                return
+            yield {name: [row.get(name) for row in chunk] for name in names}
+
+    def _render_chunk(self, chunk: dict[str, list]) -> str:
+        """Renderiza um bloco de linhas."""
+        table = field_escape_table(ZplLabelField.hex_indicator_char)
+        field_separator = str(ZplCommands.FIELD_SEPARATOR)
+        pieces = []
+        for number, name in self.fields.items():
+            values = _to_text(chunk[name], self.formats.get(name))
+            escaped = False
+            if self.escape:
+                values, escaped = _escape_column(values, table)
+            prefix = ((str(ZplCommands.FIELD_HEX_INDICATOR(ZplLabelField.hex_indicator_char)) if escaped else '') +
+                      str(ZplCommands.FIELD_NUMBER(number)) + str(ZplCommands.FIELD_DATA()))
+            pieces.append(['' if value is None else prefix + value + field_separator for value in values])
+
+        rows = len(pieces[0]) if pieces else 0
+        head = (str(ZplCommands.LABEL_START_BLOCK) + str(ZplCommands.RECALL_FORMAT(self.stored_format.path)) +
+                field_separator)
+        tail = str(ZplCommands.LABEL_END_BLOCK)
+        return ''.join(map(''.join, zip(repeat(head, rows), *pieces, repeat(tail, rows))))
+
+    def render(self, columns: Mapping[str, any] | Iterable[Mapping[str, any]]) -> Iterator[str]:
+        """Renderiza as etiquetas em blocos de chunk_rows linhas.
+
+        Args:
+            columns (Mapping[str, any] | Iterable[Mapping[str, any]]): Colunas por nome (listas, arrays NumPy ou
+                séries do pandas) ou um iterável de linhas, ex: csv.DictReader, lido sob demanda.
+
+        Yields:
+            str: Código ZPL de um bloco de etiquetas.
+
+        Raises:
+            ValueError: Se faltarem colunas ou se as colunas tiverem tamanhos diferentes.
+        """
+        for chunk in self._chunks(columns):
+            yield self._render_chunk(chunk)
+
+    def write(self, columns: Mapping[str, any] | Iterable[Mapping[str, any]], stream: IO,
+              include_format: bool = False) -> int:
+        """Escreve as etiquetas em um arquivo conforme os blocos ficam prontos.
+
+        Args:
+            columns (Mapping[str, any] | Iterable[Mapping[str, any]]): Dados das etiquetas.
+            stream (IO): Arquivo de texto ou binário.
+            include_format (bool, optional): Escreve antes o ^DF do formato (default: False).
+
+        Returns:
+            int: Quantidade de etiquetas escritas.
+        """
+        binary = not isinstance(stream, io.TextIOBase)
+        if include_format:
+            zpl = self.stored_format.dump_format()
+            stream.write(zpl.encode('UTF-8') if binary else zpl)
+
+        labels = 0
+        for chunk in self._chunks(columns):
+            zpl = self._render_chunk(chunk)
+            stream.write(zpl.encode('UTF-8') if binary else zpl)
+            labels += len(next(iter(chunk.values()), ()))
+        return labels
+
+    def send(self, columns: Mapping[str, any] | Iterable[Mapping[str, any]], printer: ZplCommandSender) -> int:
+        """Armazena o formato na impressora, se necessário, e envia as etiquetas em blocos.
+
+        Args:
+            columns (Mapping[str, any] | Iterable[Mapping[str, any]]): Dados das etiquetas.
+            printer (ZplCommandSender): Impressora de destino.
+
+        Returns:
+            int: Quantidade de blocos enviados.
+        """
+        self.stored_format.store(printer)
+        sent = 0
+        for chunk in self.render(columns):
+            printer.send_command(chunk)
+            sent += 1
+        return sent
@@ -9,6 +9,10 @@ class ZplCommands(Enum):
     def __str__(self):
         return str(self.value)
 
+    def __reduce_ex__(self, protocol):
+        # Serializa pelo nome, ZplCommand não implementa igualdade para a busca pelo valor
+        return getattr, (self.__class__, self._name_)
+
     def instance_params(self, params: list[str | any] = None) -> ZplCommandParams:
         return self.value(*params)
 
@@ -136,6 +140,25 @@ class ZplCommands(Enum):
         params_default=['_'],
         params_required=1
     )
+    FIELD_NUMBER = ZplCommand(
+        command='^FN',
+        description='Define o número de um campo variável do formato armazenado',
+        params_description=['number', 'prompt'],
+        params_required=1
+    )
+    SERIALIZATION_DATA = ZplCommand(
+        command='^SN',
+        description='Dados serializados, incrementados pela impressora a cada etiqueta',
+        params_description=['start_value', 'increment', 'leading_zeros'],
+        params_default=['1', '1', 'N'],
+        params_required=1
+    )
+    SERIALIZATION_FIELD = ZplCommand(
+        command='^SF',
+        description='Serializa o campo de dados (^FD) usando uma máscara',
+        params_description=['mask', 'increment'],
+        params_required=1
+    )
     FIELD_CLOCK = ZplCommand(
         command='^FC',
         description='Ativa a impressão de data e hora',
@@ -185,6 +208,18 @@ class ZplCommands(Enum):
         params_default=['N'],
         params_required=1
     )
+    DOWNLOAD_FORMAT = ZplCommand(
+        command='^DF',
+        description='Armazena o formato na memória da impressora',
+        params_description=['name'],
+        params_required=1
+    )
+    RECALL_FORMAT = ZplCommand(
+        command='^XF',
+        description='Recupera um formato armazenado na memória da impressora',
+        params_description=['name'],
+        params_required=1
+    )
     CHANGE_ENCODING = ZplCommand(
         command='^CI',
         description='Define a codificação de fonte',
@@ -236,6 +271,45 @@ class ZplCommands(Enum):
         params_default=['3', '3', '1', 'B'],
         params_required=0
     )
+    GRAPHIC_FIELD = ZplCommand(
+        command='^GF',
+        description='Desenha um campo gráfico',
+        params_description=['compression_type', 'binary_byte_count', 'graphic_field_count', 'bytes_per_row',
+                            'data'],
+        params_default=['A', '', '', '', ''],
+        params_required=5
+    )
+    DOWNLOAD_GRAPHIC = ZplCommand(
+        command='~DG',
+        description='Armazena um gráfico na memória da impressora',
+        params_description=['name', 'total_bytes', 'bytes_per_row', 'data'],
+        params_required=4
+    )
+    DOWNLOAD_OBJECT = ZplCommand(
+        command='~DY',
+        description='Armazena um objeto (fonte, gráfico) na memória da impressora',
+        params_description=['name', 'format', 'extension', 'total_bytes', 'bytes_per_row', 'data'],
+        params_required=6
+    )
+    GRAPHIC_RECALL = ZplCommand(
+        command='^XG',
+        description='Recupera um gráfico armazenado na memória da impressora',
+        params_description=['name', 'magnification_x', 'magnification_y'],
+        params_default=['', '1', '1'],
+        params_required=1
+    )
+    IMAGE_MOVE = ZplCommand(
+        command='^IM',
+        description='Move uma imagem armazenada na memória da impressora para o campo',
+        params_description=['name'],
+        params_required=1
+    )
+    OBJECT_DELETE = ZplCommand(
+        command='^ID',
+        description='Remove um objeto da memória da impressora',
+        params_description=['name'],
+        params_required=1
+    )
     GRAPHIC_SYMBOL = ZplCommand(
         command='^GS',
         description='Seleciona um símbolo',
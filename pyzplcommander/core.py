@@ -3,6 +3,20 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from typing import Literal
 import copy
+import weakref
+
+
+_SMALL_INT_LIMIT = 10000
+_SMALL_INT_STRINGS = tuple(str(number) for number in range(_SMALL_INT_LIMIT))  # Coordenadas e tamanhos usuais
+
+
+def _param_to_str(param: any) -> str | None:
+    """Converte um parâmetro para texto, usando a tabela de textos dos inteiros pequenos."""
+    if param is None or param.__class__ is str:
+        return param
+    if param.__class__ is int and 0 <= param < _SMALL_INT_LIMIT:
+        return _SMALL_INT_STRINGS[param]
+    return str(param)
 
 
 class ZplCommandSender(ABC):
@@ -77,7 +91,24 @@ class ZebraProperties:
 
 # noinspection PyMethodMayBeStatic,PyUnusedLocal
 class ZplDump(ABC):
-    """ZplDump é uma classe abstrata para classes que geram um dump de comandos ZPL."""
+    """ZplDump é uma classe abstrata para classes que geram um dump de comandos ZPL.
+
+    As subclasses que sobrescrevem get_origin_position ou get_size declaram has_geometry = True, e as que
+    sobrescrevem get_new_properties declaram has_properties = True. Sem a declaração os atributos são definidos
+    automaticamente pelos métodos sobrescritos. Os blocos usam esses atributos para renderizar os demais filhos
+    sem chamar esses métodos.
+    """
+
+    has_geometry = False  # Implementa get_origin_position ou get_size
+    has_properties = False  # Implementa get_new_properties
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if 'has_geometry' not in cls.__dict__ and ('get_origin_position' in cls.__dict__ or
+                                                   'get_size' in cls.__dict__):
+            cls.has_geometry = True
+        if 'has_properties' not in cls.__dict__ and 'get_new_properties' in cls.__dict__:
+            cls.has_properties = True
 
     @abstractmethod
     def dump_zpl(self, zebra_props: ZebraProperties = None, break_lines: bool = True) -> str:
@@ -136,6 +167,46 @@ class ZplDump(ABC):
         return self.dump_zpl()
 
 
+class _CopyOnWrite:
+    """Compartilhamento estrutural entre clones de blocos (copy-on-write).
+
+    Um objeto compartilhado pertence ao bloco onde foi criado e é referenciado sem cópia pelos clones do bloco,
+    registrados em _sharers. Antes de ser alterado, o objeto entrega aos clones uma cópia do estado atual.
+
+    Note:
+        O registro dos clones não é serializado com pickle, o objeto restaurado é dono exclusivo do seu estado.
+        Um bloco e os seus clones serializados juntos devem ser separados com clone() antes de serem alterados.
+    """
+
+    _sharers: weakref.WeakSet | None = None  # Clones que referenciam o objeto sem serem donos dele
+
+    @property
+    def _shared(self) -> bool:
+        """Indica se o objeto é referenciado por algum clone."""
+        return bool(self._sharers)
+
+    def _share_with(self, block: ZplCommandsBlock) -> None:
+        """Registra um clone que passa a referenciar o objeto."""
+        if self._sharers is None:
+            self._sharers = weakref.WeakSet()
+        self._sharers.add(block)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state.pop('_sharers', None)
+        state.pop('_replacements', None)
+        return state
+
+    def _detach(self) -> None:
+        """Entrega uma cópia do estado atual aos clones que referenciam o objeto, antes de alterá-lo."""
+        sharers = self._sharers
+        if not sharers:
+            return
+        self._sharers = None
+        for block in list(sharers):
+            block._replace_command(self, self.clone())
+
+
 class ZplCommand(ZplDump):
     """ZplCommand é uma classe para representar um comando ZPL.
 
@@ -143,8 +214,9 @@ class ZplCommand(ZplDump):
 
     Args:
         command (str): O comando ZPL, ex: '^FO'
-        cmd_type (Literal['format', 'command']): Tipo do comando, 'format' para comandos de formatação
-                                                e 'command' para comandos de impressão
+        cmd_type (Literal['format', 'command'], optional): Tipo do comando, 'format' para comandos de formatação
+                                                e 'command' para comandos de impressão, quando não informado
+                                                o prefixo já faz parte do comando
         description (str, optional): Descrição do comando
         params_description (list[str], optional): Lista de descrições dos parâmetros
         params_default (list[str], optional): Lista de valores padrão dos parâmetros
@@ -160,7 +232,7 @@ class ZplCommand(ZplDump):
     _params_required: int
     _command_response: bool
 
-    def __init__(self, command: str, cmd_type: Literal['format', 'command'], description: str = None,
+    def __init__(self, command: str, cmd_type: Literal['format', 'command'] = None, description: str = None,
                  params_description: list[str] = None, params_default: list[str] = None,
                  params_required: int = 0, command_response: bool = False):
         self._command = command
@@ -229,6 +301,8 @@ class ZplCommand(ZplDump):
         Returns:
             str: Dump de comandos ZPL
         """
+        if self._cmd_type is None:
+            return self._command
         return self._prefix_param(zebra_props) + self._command
 
     def get_param_index(self, param: str) -> int:
@@ -263,8 +337,8 @@ class ZplCommand(ZplDump):
         Args:
             params: Parâmetros
         """
-        params = params[0] if len(params) == 1 and isinstance(params[0], list) else list(params)
-        return ZplCommandParams(copy.copy(self), params)
+        params = params[0] if len(params) == 1 and isinstance(params[0], list) else params
+        return ZplCommandParams(self, params)
 
     def __repr__(self):
         return (f'<ZplCommand: {self._command}, '
@@ -273,20 +347,48 @@ class ZplCommand(ZplDump):
                 f'Params: {self._params_description}>')
 
 
-class ZplCommandParams(ZplDump):
+class ZplCommandParams(ZplDump, _CopyOnWrite):
     """ZplCommandParams é uma classe para representar um comando ZPL com parâmetros.
 
+    Os parâmetros são somente leitura (tupla), as alterações são feitas com set_param, append_param ou atribuindo
+    uma nova lista a params, mantendo o dump em cache sempre atualizado.
+
     Args:
         command (ZplCommand | str): Comando ZPL
         params (list[str], optional): Lista de parâmetros
     """
 
     command: ZplCommand | str
-    params: list[str | None]
+
+    _params: tuple[str | None, ...]
+    _params_zpl: str | None  # Parâmetros formatados, sem os None finais, refeito somente após alteração
 
     def __init__(self, command: ZplCommand | str, params: list[str | any] = None):
         self.command = command
-        self.params = [str(param) if param is not None else None for param in params]
+        table = _SMALL_INT_STRINGS
+        self._params = tuple([
+            param if param is None or param.__class__ is str else
+            table[param] if param.__class__ is int and 0 <= param < _SMALL_INT_LIMIT else str(param)
+            for param in params
+        ]) if params else ()
+        self._params_zpl = None
+
+    @property
+    def params(self) -> tuple[str | None, ...]:
+        """Parâmetros do comando, convertidos para texto."""
+        return self._params
+
+    @params.setter
+    def params(self, params: list[str | any] | None):
+        self._detach()
+        self._params = tuple([_param_to_str(param) for param in params]) if params else ()
+        self._params_zpl = None
+
+    def clone(self) -> ZplCommandParams:
+        """Retorna uma cópia do comando, os parâmetros imutáveis e o comando ZPL são compartilhados."""
+        clone = copy.copy(self)
+        clone._sharers = None
+        return clone
 
     def set_param_by_name(self, param: str, value: str):
         """Define o valor de um parâmetro pelo nome do parâmetro.
@@ -304,13 +406,15 @@ class ZplCommandParams(ZplDump):
             index (int): Índice do parâmetro
             value(str): Valor do parâmetro
         """
-        if index < 0 or index is None:
+        if index is None or index < 0:
             return
-        if self.params is None:
-            self.params = []
-        while len(self.params) <= index:
-            self.params.append(None)
-        self.params[index] = value
+        self._detach()
+        params = list(self._params)
+        if len(params) <= index:
+            params.extend([None] * (index + 1 - len(params)))
+        params[index] = _param_to_str(value)
+        self._params = tuple(params)
+        self._params_zpl = None
 
     def append_param(self, value: str):
         """Adiciona um valor ao final da lista de parâmetros.
@@ -318,9 +422,9 @@ class ZplCommandParams(ZplDump):
         Args:
             value(str): Valor do parâmetro
         """
-        if self.params is None:
-            self.params = []
-        self.params.append(value)
+        self._detach()
+        self._params += (_param_to_str(value),)
+        self._params_zpl = None
 
     def get_param(self, index: int) -> str | None:
         """Retorna o valor de um parâmetro pelo índice do parâmetro.
@@ -328,8 +432,8 @@ class ZplCommandParams(ZplDump):
         Args:
             index (int): Índice do parâmetro
         """
-        if self.params is not None and index in self.params:
-            return self.params[index]
+        if 0 <= index < len(self._params):
+            return self._params[index]
         return None
 
     def get_param_by_name(self, param: str) -> str | None:
@@ -338,10 +442,7 @@ class ZplCommandParams(ZplDump):
         Args:
             param (str): Nome do parâmetro
         """
-        index = self.command.get_param_index(param)
-        if index < 0:
-            return None
-        return self.params[index]
+        return self.get_param(self.command.get_param_index(param))
 
     @staticmethod
     def format_params_to_zpl(params: list[any]) -> str:
@@ -350,16 +451,18 @@ class ZplCommandParams(ZplDump):
         Args:
             params (list[any]): Lista de parâmetros
         """
-        if params is None or len(params) < 1:
+        if not params:
             return ''
 
-        last_value = -1
-        for index in range(len(params)-1, -1, -1):
-            if params[index] is not None:
-                last_value = index
-                break
-
-        return ','.join(map(lambda x: '' if x is None else str(x), params[:last_value+1]))
+        end = len(params)
+        while end and params[end - 1] is None:
+            end -= 1
+        if end < len(params):
+            params = params[:end]
+        try:
+            return ','.join(params)
+        except TypeError:  # Parâmetros None no meio ou que não são texto
+            return ','.join(['' if param is None else str(param) for param in params])
 
     def dump_zpl(self, zebra_props: ZebraProperties = None, break_lines: bool = True) -> str:
         """Retorna o comando ZPL com parâmetros.
@@ -370,16 +473,47 @@ class ZplCommandParams(ZplDump):
         Returns:
             str: Dump de comandos ZPL
         """
-        if isinstance(self.command, ZplDump):
-            return self.command.dump_zpl(zebra_props, break_lines) + self.format_params_to_zpl(self.params)
+        params_zpl = self._params_zpl
+        if params_zpl is None:
+            params_zpl = self._params_zpl = self.format_params_to_zpl(self._params)
 
-        return str(self.command)+self.format_params_to_zpl(self.params)
+        command = self.command
+        if command.__class__ is ZplCommand or isinstance(command, ZplDump):
+            return command.dump_zpl(zebra_props, break_lines) + params_zpl
+
+        return str(command) + params_zpl
 
     def __repr__(self):
-        return f'<ZplCommandValue: {self.command.__repr__()}, Params: {",".join(self.params)}>'
+        params = ",".join('' if param is None else param for param in self._params)
+        return f'<ZplCommandValue: {self.command.__repr__()}, Params: {params}>'
+
+
+_DUMP_PLAIN = 0  # Texto ZPL, renderizado com str()
+_DUMP_RENDER = 1  # ZplDump renderizado com dump_zpl()
+_DUMP_BLOCK = 2  # ZplCommandsBlock com o dump padrão, achatado nos segmentos do bloco pai
+_DUMP_FULL = 4  # Marcador das classes com geometria ou propriedades
+
+_dump_kinds: dict[type, int] = {}  # Classe -> forma de renderização nos blocos
 
 
-class ZplCommandsBlock(ZplDump):
+def _dump_kind(command_type: type) -> int:
+    """Retorna a forma de renderização de uma classe de comando nos blocos, memorizada pela classe."""
+    kind = _dump_kinds.get(command_type)
+    if kind is None:
+        if not issubclass(command_type, ZplDump):
+            kind = _DUMP_PLAIN
+        elif (issubclass(command_type, ZplCommandsBlock) and command_type.dump_zpl is ZplCommandsBlock.dump_zpl and
+              command_type._format_commands_to_zpl is ZplCommandsBlock._format_commands_to_zpl):
+            kind = _DUMP_BLOCK
+        else:
+            kind = _DUMP_RENDER
+        if kind != _DUMP_PLAIN and (command_type.has_geometry or command_type.has_properties):
+            kind |= _DUMP_FULL
+        _dump_kinds[command_type] = kind
+    return kind
+
+
+class ZplCommandsBlock(ZplDump, _CopyOnWrite):
     """ZplCommandsBlock é uma classe para representar um bloco de comandos ZPL.
 
     Args:
@@ -419,6 +553,7 @@ class ZplCommandsBlock(ZplDump):
             command (ZplCommandParams | str): Comando ZPL
             position (int | str, optional): Posição do comando
         """
+        self._detach()
         position = str(position)
         if position not in self.commands:
             self.commands[position] = []
@@ -447,22 +582,105 @@ class ZplCommandsBlock(ZplDump):
             command (ZplCommandParams | str): Comando ZPL
             position (int | str, optional): Posição do comando
         """
+        self._detach()
         position = str(position)
         self.commands[position] = []
         self.add_command(command, position)
         return self
 
-    def get_commands(self) -> list[ZplCommandParams | ZplCommandsBlock | str]:
-        """Retorna a lista de comandos."""
+    def clone(self):
+        """Retorna uma cópia do bloco com compartilhamento estrutural.
+
+        A cópia tem as próprias listas de comandos, mas os comandos e blocos filhos são compartilhados com o original
+        até serem alterados (copy-on-write). Os filhos obtidos do clone com get_commands, get_commands_by_position
+        ou edit_command são cópias exclusivas do clone, e os filhos do original, ao serem alterados pelos métodos
+        dos comandos (set_param, add_command, etc.), entregam antes ao clone uma cópia do estado anterior.
+
+        Note:
+            Alterar diretamente as listas de commands ou objetos aninhados obtidos do original antes do clone, sem
+            passar pelos filhos diretos, não é detectado.
+
+        Returns:
+            ZplCommandsBlock: Bloco da mesma classe.
+        """
+        clone = copy.copy(self)
+        clone.commands = {position: list(commands) for position, commands in self.commands.items()}
+        clone._sharers = None
+        clone._replacements = None
+        for commands in self.commands.values():
+            for command in commands:
+                if isinstance(command, _CopyOnWrite):
+                    command._share_with(clone)
+        return clone
+
+    def _replace_command(self, command: ZplCommandParams | ZplCommandsBlock,
+                         replacement: ZplCommandParams | ZplCommandsBlock) -> None:
+        """Substitui um filho compartilhado pela cópia do seu estado, chamado pelo filho antes de ser alterado."""
+        for commands in self.commands.values():
+            for index, item in enumerate(commands):
+                if item is command:
+                    commands[index] = replacement
+        if self.__dict__.get('_replacements') is None:
+            self._replacements = weakref.WeakKeyDictionary()
+        self._replacements[command] = replacement  # edit_command aceita o objeto do original
+        self._reset_zpl_dump()
+
+    def _own_command(self, commands: list, index: int) -> ZplCommandParams | ZplCommandsBlock | str:
+        """Torna o filho exclusivo deste bloco antes de ser entregue para alteração."""
+        command = commands[index]
+        sharers = getattr(command, '_sharers', None)
+        if sharers:
+            if self in sharers:  # Filho do bloco original, o clone recebe uma cópia
+                sharers.discard(self)
+                command = commands[index] = command.clone()
+            else:  # Filho deste bloco, os clones recebem uma cópia
+                command._detach()
+        return command
+
+    def _own_commands(self, commands: list) -> list:
+        """Torna exclusivos os filhos de uma lista, e o próprio bloco, antes de serem entregues para alteração."""
+        self._detach()
+        for index in range(len(commands)):
+            self._own_command(commands, index)
+        return commands
+
+    def edit_command(self, command: ZplCommandParams | ZplCommandsBlock) -> ZplCommandParams | ZplCommandsBlock:
+        """Retorna um comando do bloco para alteração, exclusivo deste bloco.
+
+        Args:
+            command (ZplCommandParams | ZplCommandsBlock): Comando do bloco, pode ser o objeto do bloco original.
+
+        Returns:
+            ZplCommandParams | ZplCommandsBlock: Comando exclusivo deste bloco.
+        """
+        for commands in self.commands.values():
+            for index, item in enumerate(commands):
+                if item is command:
+                    self._detach()
+                    command = self._own_command(commands, index)
+                    self._reset_zpl_dump()
+                    return command
+        replacements = self.__dict__.get('_replacements')
+        if replacements is not None and command in replacements:
+            return self.edit_command(replacements[command])
+        raise ValueError('Command not found in block.')
+
+    def _sorted_commands(self) -> list[ZplCommandParams | ZplCommandsBlock | str]:
+        """Retorna a lista de comandos na ordem das posições, para leitura."""
         return [cmd for order in sorted(self.commands.keys()) for cmd in self.commands[order]]
 
+    def get_commands(self) -> list[ZplCommandParams | ZplCommandsBlock | str]:
+        """Retorna a lista de comandos, exclusivos deste bloco quando compartilhados com clones."""
+        return [cmd for order in sorted(self.commands.keys()) for cmd in self._own_commands(self.commands[order])]
+
     def get_commands_by_position(self, position: int | str) -> list[ZplCommandParams | ZplCommandsBlock | str]:
-        """Retorna a lista de comandos por posição.
+        """Retorna a lista de comandos por posição, exclusivos deste bloco quando compartilhados com clones.
 
         Args:
             position (int | str): Posição do comando
         """
-        return self.commands.get(position, [])
+        commands = self.commands.get(position)
+        return self._own_commands(commands) if commands is not None else []
 
     def add_zpl_blank_line(self, lines: int = 1):
         """Adiciona uma ou mais linhas em branco no código ZPL.
@@ -476,6 +694,99 @@ class ZplCommandsBlock(ZplDump):
         self._reset_zpl_dump()
         return self
 
+    def _apply_child(self, command: ZplDump, zebra_props: ZebraProperties = None) -> ZebraProperties:
+        """Acumula a geometria do filho no bloco e retorna as propriedades usadas para renderizá-lo.
+
+        Args:
+            command (ZplDump): Comando com has_geometry ou has_properties.
+            zebra_props (ZebraProperties, optional): Propriedades da impressora antes do comando.
+        """
+        if command.has_geometry:
+            x, y = command.get_origin_position(zebra_props)
+            if x >= 0:
+                self.zpl_dump_x = x if self.zpl_dump_x is None else min(x, self.zpl_dump_x)
+            if y >= 0:
+                self.zpl_dump_y = y if self.zpl_dump_y is None else min(y, self.zpl_dump_y)
+
+            width, height = command.get_size(zebra_props)
+            if width >= 0:
+                self.zpl_dump_width = max(width, self.zpl_dump_width or 0)
+            if height >= 0:
+                self.zpl_dump_height = max(height, self.zpl_dump_height or 0)
+
+        if command.has_properties:
+            zebra_props = command.get_new_properties(zebra_props) or zebra_props
+        return zebra_props
+
+    def _lower_commands(self, segments: list[str], zebra_props: ZebraProperties = None, break_lines: bool = True,
+                        spans: list[list] = None) -> None:
+        """Adiciona à lista os segmentos ZPL dos comandos, achatando os blocos filhos.
+
+        Os blocos filhos com o dump padrão não geram um texto intermediário, os seus segmentos vão direto para a
+        lista, que é unida uma única vez no final.
+
+        Args:
+            segments (list[str]): Lista de segmentos de destino.
+            zebra_props (ZebraProperties, optional): Propriedades da impressora
+            break_lines (bool, optional): Quebra de linha entre os comandos
+            spans (list[list], optional): Recebe o trecho de cada comando, [comando, início, fim, propriedades,
+                                          trechos dos filhos], usado pela atualização incremental.
+        """
+        append = segments.append
+        kinds = _dump_kinds
+        separator = '\r\n' if break_lines else None
+        first = True
+        for command in self._sorted_commands():
+            if separator is not None:
+                if first:
+                    first = False
+                else:
+                    append(separator)
+            kind = kinds.get(command.__class__)
+            if kind is None:
+                kind = _dump_kind(command.__class__)
+
+            if spans is not None and kind != _DUMP_PLAIN:
+                span = [command, len(segments), 0, zebra_props, []]
+                spans.append(span)
+
+            if kind == _DUMP_RENDER:
+                append(command.dump_zpl(zebra_props, False))
+            elif kind == _DUMP_BLOCK:
+                command._lower(segments, zebra_props, False, None if spans is None else span[4])
+            elif kind == _DUMP_PLAIN:
+                append(str(command))
+                continue
+            else:
+                zebra_props = self._apply_child(command, zebra_props)
+                if kind & _DUMP_BLOCK:
+                    command._lower(segments, zebra_props, False, None if spans is None else span[4])
+                else:
+                    append(command.dump_zpl(zebra_props, False))
+
+            if spans is not None:
+                span[2] = len(segments)
+
+    def _lower(self, segments: list[str], zebra_props: ZebraProperties = None, break_lines: bool = True,
+               spans: list[list] = None) -> None:
+        """Adiciona à lista os segmentos ZPL do bloco, incluindo o início e o fim do bloco.
+
+        Args:
+            segments (list[str]): Lista de segmentos de destino.
+            zebra_props (ZebraProperties, optional): Propriedades da impressora
+            break_lines (bool, optional): Quebra de linha
+            spans (list[list], optional): Recebe o trecho de cada comando, como em _lower_commands.
+        """
+        if self.start_block is not None:
+            segments.append(str(self.start_block))
+            if break_lines:
+                segments.append('\r\n')
+        self._lower_commands(segments, zebra_props, break_lines, spans)
+        if self.end_block is not None:
+            if break_lines:
+                segments.append('\r\n')
+            segments.append(str(self.end_block))
+
     def _format_commands_to_zpl(self, zebra_props: ZebraProperties = None, break_lines: bool = True) -> str:
         """Formata os comandos para o formato ZPL.
 
@@ -483,43 +794,22 @@ class ZplCommandsBlock(ZplDump):
             zebra_props (ZebraProperties, optional): Propriedades da impressora
             break_lines (bool, optional): Quebra de linha
         """
-        lines = []
-        for command in self.get_commands():
-            if isinstance(command, ZplDump):
-
-                x, y = command.get_origin_position(zebra_props)
-                if x >= 0:
-                    self.zpl_dump_x = min(x, self.zpl_dump_x)
-                if y >= 0:
-                    self.zpl_dump_y = min(y, self.zpl_dump_y)
-
-                width, height = command.get_size(zebra_props)
-                if width >= 0:
-                    self.zpl_dump_width = max(width, self.zpl_dump_width)
-                if height >= 0:
-                    self.zpl_dump_height = max(height, self.zpl_dump_height)
-
-                new_props = command.get_new_properties(zebra_props)
-                zebra_props = new_props or zebra_props
-
-                lines.append(command.dump_zpl(zebra_props, False))
-            else:
-                lines.append(str(command))
-        return '\r\n'.join(lines) if break_lines else ''.join(lines)
+        segments = []
+        self._lower_commands(segments, zebra_props, break_lines)
+        return ''.join(segments)
 
     def dump_zpl(self, zebra_props: ZebraProperties = None, break_lines: bool = True) -> str:
         """Formata o bloco de comandos para o formato ZPL.
 
+        Os blocos filhos são achatados em uma única lista de segmentos, unida uma vez, sem textos intermediários
+        por nível de aninhamento.
+
         Args:
             zebra_props (ZebraProperties, optional): Propriedades da impressora
             break_lines (bool, optional): Quebra de linha
         """
-        lines = []
-        if self.start_block is not None:
-            lines.append(str(self.start_block))
-        lines.append(self._format_commands_to_zpl(zebra_props, break_lines))
-        if self.end_block is not None:
-            lines.append(str(self.end_block))
-        zpl_code = '\r\n'.join(lines) if break_lines else ''.join(lines)
+        segments = []
+        self._lower(segments, zebra_props, break_lines)
+        zpl_code = ''.join(segments)
         self.zpl_dump_zpl = zpl_code
         return zpl_code
@@ -192,3 +192,12 @@ class ZplStandardFonts24Dots(EnumBase):
     FONT_U = ZplFont('U', 59, 53, 'U-L-D')  # Uppercase, Lowercase, Digits
     FONT_V = ZplFont('V', 80, 71, 'U-L-D')  # Uppercase, Lowercase, Digits
     FONT_0 = ZplFont('0', 15, 12, 'U-L-D')  # Uppercase, Lowercase, Digits
+
+
+# Fontes padrão por densidade de impressão em pontos por milímetro
+ZPL_STANDARD_FONTS = {
+    6: ZplStandardFonts6Dots,
+    8: ZplStandardFonts8Dots,
+    12: ZplStandardFonts12Dots,
+    24: ZplStandardFonts24Dots,
+}
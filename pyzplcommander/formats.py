@@ -0,0 +1,128 @@
+from __future__ import annotations
+from typing import Literal
+import hashlib
+
+from pyzplcommander.core import ZplCommandsBlock, ZplCommandSender, ZebraProperties
+from pyzplcommander.commands import ZplCommands
+from pyzplcommander.label import ZplLabel, ZplLabelField, ZplSerial
+
+
+class ZplStoredFormat:
+    """Formato de etiqueta armazenado na memória da impressora.
+
+    O layout da etiqueta é enviado uma única vez com o comando ^DF, depois cada etiqueta é enviada somente com o
+    comando ^XF e os valores dos campos variáveis (^FN), reduzindo o volume de dados enviados por etiqueta.
+
+    Os campos variáveis são marcados no template com ZplLabelField.variable().
+
+    Note:
+        Comando ZPL para armazenar: ^DF
+        Comando ZPL para recuperar: ^XF
+
+    Args:
+        template (ZplLabel): Etiqueta com o layout do formato.
+        name (str, optional): Nome do formato na impressora, até 8 caracteres, por padrão é derivado do hash do layout.
+        storage (str, optional): Dispositivo de armazenamento da impressora (default: 'R:').
+        zebra_props (ZebraProperties, optional): Propriedades da impressora usadas para gerar o layout.
+    """
+
+    template: ZplLabel
+    template_hash: str
+    name: str
+    storage: Literal['R:', 'E:', 'B:', 'A:']
+
+    _format_body: str
+
+    def __init__(self, template: ZplLabel, name: str = None, storage: Literal['R:', 'E:', 'B:', 'A:'] = 'R:',
+                 zebra_props: ZebraProperties = None):
+        self.template = template
+        self.storage = storage
+        self._format_body = template._format_commands_to_zpl(zebra_props, False)
+        self.template_hash = hashlib.sha1(self._format_body.encode('UTF-8')).hexdigest()
+        self.name = (name or 'F' + self.template_hash[:7]).upper()
+
+    def __getstate__(self):
+        # A impressora do template (socket e travas) não é enviada aos processos do ZplBatchRenderer
+        state = self.__dict__.copy()
+        if getattr(self.template, 'printer', None) is not None:
+            template = state['template'] = self.template.clone()
+            template.printer = None
+        return state
+
+    @property
+    def path(self) -> str:
+        """Retorna o caminho do formato na impressora, ex: 'R:F1A2B3C4.ZPL'."""
+        return f'{self.storage}{self.name}.ZPL'
+
+    def dump_format(self) -> str:
+        """Retorna o código ZPL que armazena o formato na impressora.
+
+        Returns:
+            str: Código ZPL com ^DF.
+        """
+        return (str(ZplCommands.LABEL_START_BLOCK) + str(ZplCommands.DOWNLOAD_FORMAT(self.path)) +
+                str(ZplCommands.FIELD_SEPARATOR) + self._format_body + str(ZplCommands.LABEL_END_BLOCK))
+
+    def is_stored(self, printer: ZplCommandSender) -> bool:
+        """Verifica se a versão atual do formato já foi armazenada na impressora.
+
+        Args:
+            printer (ZplCommandSender): Impressora de destino.
+        """
+        stored_formats = getattr(printer, 'stored_formats', None)
+        return stored_formats is not None and stored_formats.get(self.path) == self.template_hash
+
+    def store(self, printer: ZplCommandSender, force: bool = False) -> bool:
+        """Armazena o formato na impressora, caso ainda não esteja armazenado.
+
+        Args:
+            printer (ZplCommandSender): Impressora de destino.
+            force (bool, optional): Reenvia o formato mesmo que já esteja armazenado.
+
+        Returns:
+            bool: True se o formato foi enviado, False se já estava armazenado.
+        """
+        if not force and self.is_stored(printer):
+            return False
+
+        printer.send_command(self.dump_format())
+        stored_formats = getattr(printer, 'stored_formats', None)
+        if stored_formats is not None:
+            stored_formats[self.path] = self.template_hash
+        return True
+
+    def recall(self, values: dict[int, str] | list[str], printer: ZplCommandSender = None) -> ZplLabel:
+        """Cria uma etiqueta que recupera o formato e informa os valores dos campos variáveis.
+
+        Args:
+            values (dict[int, str] | list[str]): Valores dos campos, por número do campo ou em lista,
+                                                 sendo o primeiro item o campo 1, aceita ZplSerial.
+            printer (ZplCommandSender, optional): Impressora usada ao enviar a etiqueta.
+
+        Returns:
+            ZplLabel: Etiqueta com ^XF e os valores dos campos.
+        """
+        if isinstance(values, dict):
+            values = values.items()
+        else:
+            values = enumerate(values, 1)
+
+        label = ZplLabel(printer)
+        label.add_command(ZplCommandsBlock(end_block=str(ZplCommands.FIELD_SEPARATOR))
+                          .add_command(ZplCommands.RECALL_FORMAT(self.path)))
+        for number, value in values:
+            if value is None:
+                continue
+            label.add_command(ZplLabelField().variable(number)
+                              .data(value if isinstance(value, ZplSerial) else str(value)))
+        return label
+
+    def print_label(self, printer: ZplCommandSender, values: dict[int, str] | list[str]) -> None:
+        """Imprime uma etiqueta usando o formato, armazenando o formato antes se necessário.
+
+        Args:
+            printer (ZplCommandSender): Impressora de destino.
+            values (dict[int, str] | list[str]): Valores dos campos variáveis.
+        """
+        self.store(printer)
+        printer.send_command(self.recall(values).dump_zpl(break_lines=False))
@@ -0,0 +1,208 @@
+from __future__ import annotations
+from typing import Literal
+import base64
+import binascii
+import re
+import zlib
+
+from pyzplcommander.core import ZplCommandParams
+from pyzplcommander.commands import ZplCommands
+
+try:
+    import numpy as np
+except ImportError:  # numpy é opcional, usado somente para converter arrays
+    np = None
+
+
+# Tabelas de conversão de pixels em tons de cinza para bits, pixel escuro = '1'
+_THRESHOLD_TABLES: dict[int, bytes] = {}
+
+# Contadores de repetição da compressão ACS do ZPL
+_ACS_COUNTS_LOW = 'GHIJKLMNOPQRSTUVWXY'  # 1 a 19
+_ACS_COUNTS_HIGH = 'ghijklmnopqrstuvwxyz'  # 20 a 400, de 20 em 20
+_ACS_RUN_REG = re.compile(r'([0-9A-F])\1+')
+
+
+def _threshold_table(threshold: int) -> bytes:
+    """Retorna a tabela de tradução de bytes em tons de cinza para os caracteres '0' e '1'."""
+    table = _THRESHOLD_TABLES.get(threshold)
+    if table is None:
+        table = bytes(0x31 if value < threshold else 0x30 for value in range(256))
+        _THRESHOLD_TABLES[threshold] = table
+    return table
+
+
+def _acs_count(count: int) -> str:
+    """Converte um número de repetições para os caracteres de contagem ACS."""
+    result = ''
+    while count > 400:
+        result += 'z'
+        count -= 400
+    if count >= 20:
+        result += _ACS_COUNTS_HIGH[count // 20 - 1]
+        count %= 20
+    if count > 0:
+        result += _ACS_COUNTS_LOW[count - 1]
+    return result
+
+
+def _acs_run(match: re.Match) -> str:
+    run = match.group(0)
+    if len(run) < 3:
+        return run
+    return _acs_count(len(run)) + run[0]
+
+
+class ZplGraphic:
+    """Gráfico monocromático para impressão em campos ^GF ou armazenamento com ~DG.
+
+    O bitmap é armazenado com as linhas compactadas em bits, sendo o bit 1 um ponto impresso.
+
+    Args:
+        data (bytes): Linhas do bitmap compactadas, 1 bit por ponto.
+        bytes_per_row (int): Quantidade de bytes por linha.
+    """
+
+    data: bytes
+    bytes_per_row: int
+
+    def __init__(self, data: bytes, bytes_per_row: int):
+        if bytes_per_row <= 0 or len(data) % bytes_per_row != 0:
+            raise ValueError('Graphic data size must be a multiple of bytes per row.')
+        self.data = bytes(data)
+        self.bytes_per_row = bytes_per_row
+
+    @property
+    def rows(self) -> int:
+        """Retorna a quantidade de linhas do gráfico."""
+        return len(self.data) // self.bytes_per_row
+
+    @property
+    def total_bytes(self) -> int:
+        """Retorna o tamanho do gráfico sem compressão em bytes."""
+        return len(self.data)
+
+    @classmethod
+    def from_array(cls, bitmap: any, threshold: int = 128) -> ZplGraphic:
+        """Cria o gráfico a partir de um array NumPy de duas dimensões (linhas, colunas).
+
+        Arrays booleanos são usados diretamente (True = ponto impresso), arrays numéricos são tratados como tons de
+        cinza, sendo impressos os pontos menores que o limiar.
+
+        Args:
+            bitmap (numpy.ndarray): Bitmap com o formato (altura, largura).
+            threshold (int, optional): Limiar para tons de cinza (default: 128).
+        """
+        if np is None:
+            raise ImportError('numpy is required to convert arrays, use ZplGraphic.from_bytes instead.')
+
+        bitmap = np.asarray(bitmap)
+        if bitmap.ndim != 2:
+            raise ValueError('Bitmap must have two dimensions (height, width).')
+
+        dots = bitmap if bitmap.dtype == np.bool_ else bitmap < threshold
+        packed = np.packbits(dots, axis=1)
+        return cls(packed.tobytes(), packed.shape[1])
+
+    @classmethod
+    def from_bytes(cls, data: bytes, width: int, mode: Literal['L', '1'] = 'L', threshold: int = 128) -> ZplGraphic:
+        """Cria o gráfico a partir de bytes brutos.
+
+        Args:
+            data (bytes): Pixels do bitmap, linha a linha.
+            width (int): Largura do bitmap em pontos.
+            mode (str, optional): Formato dos pixels, 'L' para 1 byte em tons de cinza por ponto ou
+                                  '1' para linhas já compactadas com 1 bit por ponto (default: 'L').
+            threshold (int, optional): Limiar para tons de cinza, usado no modo 'L' (default: 128).
+        """
+        bytes_per_row = (width + 7) // 8
+
+        if mode == '1':
+            return cls(data, bytes_per_row)
+
+        if mode != 'L':
+            raise ValueError(f'Invalid bitmap mode: {mode}')
+        if width <= 0 or len(data) % width != 0:
+            raise ValueError('Bitmap data size must be a multiple of width.')
+
+        # Cada pixel vira um caractere '0' ou '1', a linha é convertida em inteiro de uma vez
+        bits = bytes(data).translate(_threshold_table(threshold))
+        padding = b'0' * (bytes_per_row * 8 - width)
+        packed = bytearray()
+        for start in range(0, len(bits), width):
+            packed += int(bits[start:start + width] + padding, 2).to_bytes(bytes_per_row, 'big')
+        return cls(bytes(packed), bytes_per_row)
+
+    def encode_hex(self) -> str:
+        """Codifica o gráfico em hexadecimal ASCII sem compressão."""
+        return self.data.hex().upper()
+
+    def encode_acs(self) -> str:
+        """Codifica o gráfico com a compressão ACS (run-length) do ZPL.
+
+        Linhas iguais à anterior são representadas por ':', zeros ao final da linha por ',' e
+        'F' ao final da linha por '!'.
+        """
+        hex_data = self.encode_hex()
+        row_size = self.bytes_per_row * 2
+        rows = []
+        previous = None
+        for start in range(0, len(hex_data), row_size):
+            row = hex_data[start:start + row_size]
+            if row == previous:
+                rows.append(':')
+                continue
+            previous = row
+
+            stripped = row.rstrip('0')
+            suffix = ',' if len(stripped) < len(row) else ''
+            if not suffix:
+                stripped = row.rstrip('F')
+                suffix = '!' if len(stripped) < len(row) else ''
+            rows.append(_ACS_RUN_REG.sub(_acs_run, stripped) + suffix)
+        return ''.join(rows)
+
+    def encode_z64(self) -> str:
+        """Codifica o gráfico com deflate e base64 no formato :Z64:, com CRC ao final."""
+        encoded = base64.b64encode(zlib.compress(self.data, 9))
+        return ':Z64:' + encoded.decode('ascii') + ':' + format(binascii.crc_hqx(encoded, 0), '04x')
+
+    def encode(self, method: Literal['auto', 'hex', 'acs', 'z64'] = 'auto') -> str:
+        """Codifica o gráfico, no modo 'auto' é usada a codificação de menor tamanho.
+
+        Args:
+            method (str, optional): Codificação, 'hex', 'acs', 'z64' ou 'auto' (default: 'auto').
+        """
+        if method == 'hex':
+            return self.encode_hex()
+        if method == 'acs':
+            return self.encode_acs()
+        if method == 'z64':
+            return self.encode_z64()
+        if method != 'auto':
+            raise ValueError(f'Invalid graphic encoding: {method}')
+        return min((self.encode_acs(), self.encode_z64()), key=len)
+
+    def field_command(self, method: Literal['auto', 'hex', 'acs', 'z64'] = 'auto') -> ZplCommandParams:
+        """Retorna o comando ^GF com o gráfico.
+
+        Note:
+            Comando ZPL: ^GF
+
+        Args:
+            method (str, optional): Codificação do gráfico (default: 'auto').
+        """
+        return ZplCommands.GRAPHIC_FIELD('A', self.total_bytes, self.total_bytes, self.bytes_per_row,
+                                         self.encode(method))
+
+    def download_command(self, name: str, method: Literal['auto', 'hex', 'acs', 'z64'] = 'auto') -> ZplCommandParams:
+        """Retorna o comando ~DG que armazena o gráfico na memória da impressora.
+
+        Note:
+            Comando ZPL: ~DG
+
+        Args:
+            name (str): Caminho do gráfico na impressora, ex: 'R:LOGO.GRF'.
+            method (str, optional): Codificação do gráfico (default: 'auto').
+        """
+        return ZplCommands.DOWNLOAD_GRAPHIC(name, self.total_bytes, self.bytes_per_row, self.encode(method))
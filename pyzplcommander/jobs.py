@@ -0,0 +1,240 @@
+from __future__ import annotations
+from typing import Iterable
+import sqlite3
+import time
+import uuid
+
+from pyzplcommander.core import ZplCommandSender, ZplDump
+
+
+# Condições do ~HS em que as etiquetas que saíram do buffer podem não ter sido impressas
+_HOLD_STATUS = (('pause', 'Pause'), ('paper_out', 'Out'), ('ribbon_out', 'Out'), ('head_up', 'Up'),
+                ('partial_format', 'Partial'))
+
+
+class ZplPrintQueue:
+    """Fila de impressão persistente com journal em SQLite.
+
+    Cada etiqueta é registrada antes do envio e acompanhada pelos estados pendente, enviada e confirmada, permitindo
+    retomar a impressão após uma queda da impressora a partir da última etiqueta confirmada.
+
+    As etiquetas são enviadas em lotes, sendo um único envio e uma única transação por lote.
+    A confirmação usa o status da impressora (~HS): uma etiqueta enviada é confirmada quando não está mais no buffer
+    de recebimento da impressora (number_of_formats_recv_buf) e nem aguardando impressão (labels_remaining).
+    É uma estimativa, ver confirm().
+
+    Args:
+        printer (ZplCommandSender): Impressora de destino.
+        database (str): Caminho do arquivo SQLite do journal.
+        batch_size (int, optional): Quantidade de etiquetas por envio/transação (default: 100).
+        max_retries (int, optional): Tentativas de envio de um lote antes de desistir (default: 5).
+        backoff (float, optional): Espera inicial entre tentativas em segundos, dobrada a cada falha (default: 1).
+        max_backoff (float, optional): Espera máxima entre tentativas em segundos (default: 60).
+    """
+
+    STATE_PENDING = 0
+    STATE_SENT = 1
+    STATE_CONFIRMED = 2
+
+    printer: ZplCommandSender
+    batch_size: int
+    max_retries: int
+    backoff: float
+    max_backoff: float
+
+    connection: sqlite3.Connection
+
+    def __init__(self, printer: ZplCommandSender, database: str, batch_size: int = 100, max_retries: int = 5,
+                 backoff: float = 1, max_backoff: float = 60):
+        self.printer = printer
+        self.batch_size = batch_size
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+
+        self.connection = sqlite3.connect(database)
+        self.connection.execute('PRAGMA journal_mode=WAL')
+        self.connection.execute('PRAGMA synchronous=NORMAL')
+        self.connection.execute(
+            'CREATE TABLE IF NOT EXISTS labels ('
+            ' id INTEGER PRIMARY KEY AUTOINCREMENT,'
+            ' job TEXT NOT NULL,'
+            ' zpl BLOB NOT NULL,'
+            ' state INTEGER NOT NULL DEFAULT 0,'
+            ' attempts INTEGER NOT NULL DEFAULT 0,'
+            ' sent_at REAL,'
+            ' confirmed_at REAL)'
+        )
+        self.connection.execute('CREATE INDEX IF NOT EXISTS labels_state ON labels (state, id)')
+        self.connection.commit()
+
+    def close(self) -> None:
+        """Fecha o journal."""
+        self.connection.close()
+
+    def enqueue(self, labels: Iterable[str | bytes | ZplDump], job: str = None) -> str:
+        """Adiciona etiquetas à fila, em uma única transação.
+
+        Args:
+            labels (Iterable[str | bytes | ZplDump]): Etiquetas a serem impressas.
+            job (str, optional): Identificador do trabalho, por padrão é gerado um novo.
+
+        Returns:
+            str: Identificador do trabalho.
+        """
+        job = job or uuid.uuid4().hex
+
+        def rows():
+            for label in labels:
+                if isinstance(label, ZplDump):
+                    label = label.dump_zpl(break_lines=False)
+                if isinstance(label, str):
+                    label = label.encode('UTF-8')
+                yield job, label
+
+        with self.connection:
+            self.connection.executemany('INSERT INTO labels (job, zpl) VALUES (?, ?)', rows())
+        return job
+
+    def counts(self, job: str = None) -> dict[str, int]:
+        """Retorna a quantidade de etiquetas por estado.
+
+        Args:
+            job (str, optional): Filtra pelo trabalho.
+        """
+        query = 'SELECT state, COUNT(*) FROM labels'
+        params = ()
+        if job is not None:
+            query += ' WHERE job = ?'
+            params = (job,)
+        result = dict(self.connection.execute(query + ' GROUP BY state', params).fetchall())
+        return {
+            'pending': result.get(self.STATE_PENDING, 0),
+            'sent': result.get(self.STATE_SENT, 0),
+            'confirmed': result.get(self.STATE_CONFIRMED, 0),
+        }
+
+    def _send_batch(self, batch: list[tuple[int, bytes]]) -> None:
+        """Envia um lote com novas tentativas e espera exponencial, registrando o envio no journal."""
+        ids = [(label_id,) for label_id, _ in batch]
+        payload = b''.join(zpl for _, zpl in batch).decode('UTF-8')
+        delay = self.backoff
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                self.printer.send_command(payload)
+                break
+            except OSError:
+                with self.connection:
+                    self.connection.executemany('UPDATE labels SET attempts = attempts + 1 WHERE id = ?', ids)
+                if attempt >= self.max_retries:
+                    raise
+                time.sleep(delay)
+                delay = min(delay * 2, self.max_backoff)
+
+        with self.connection:
+            self.connection.executemany(
+                'UPDATE labels SET state = ?, sent_at = ?, attempts = attempts + 1 WHERE id = ?',
+                [(self.STATE_SENT, time.time(), label_id) for (label_id,) in ids]
+            )
+
+    def process(self, confirm_every: int = 1) -> int:
+        """Envia as etiquetas pendentes em lotes até esvaziar a fila.
+
+        Args:
+            confirm_every (int, optional): Confirma as etiquetas enviadas a cada N lotes, 0 para não confirmar.
+
+        Returns:
+            int: Quantidade de etiquetas enviadas.
+        """
+        sent = 0
+        batches = 0
+        while True:
+            batch = self.connection.execute(
+                'SELECT id, zpl FROM labels WHERE state = ? ORDER BY id LIMIT ?',
+                (self.STATE_PENDING, self.batch_size)
+            ).fetchall()
+            if not batch:
+                break
+            self._send_batch(batch)
+            sent += len(batch)
+            batches += 1
+            if confirm_every and batches % confirm_every == 0:
+                self.confirm()
+        return sent
+
+    def confirm(self) -> int:
+        """Confirma as etiquetas enviadas que já saíram da impressora, conforme o status ~HS.
+
+        As etiquetas ainda no buffer de recebimento ou aguardando impressão permanecem como enviadas.
+
+        Note:
+            A confirmação é uma estimativa: o ~HS informa quantos formatos ainda estão na impressora, não quais
+            etiquetas foram impressas, e a impressora não informa um contador de etiquetas (o odômetro do ~HQOD
+            mede o comprimento impresso). Todas as etiquetas enviadas antes das que estão no buffer são
+            consideradas impressas, então uma etiqueta perdida após sair do buffer, ex: atolamento ou etiqueta
+            descartada com ~JA, também é confirmada. Com a impressora pausada, sem papel ou ribbon, com a cabeça
+            levantada ou recebendo um formato, nenhuma etiqueta é confirmada.
+
+        Returns:
+            int: Quantidade de etiquetas confirmadas.
+        """
+        host_status_dict = getattr(self.printer, 'host_status_dict', None)
+        if host_status_dict is None:
+            return 0
+        try:
+            status = host_status_dict()
+        except (OSError, ValueError):
+            return 0
+        if not status or any(status.get(name) == value for name, value in _HOLD_STATUS):
+            return 0
+
+        in_printer = status['number_of_formats_recv_buf'] + (1 if status['labels_remaining'] > 0 else 0)
+        with self.connection:
+            sent = self.connection.execute(
+                'SELECT id FROM labels WHERE state = ? ORDER BY id', (self.STATE_SENT,)
+            ).fetchall()
+            confirmed = sent[:max(len(sent) - in_printer, 0)]
+            self.connection.executemany(
+                'UPDATE labels SET state = ?, confirmed_at = ? WHERE id = ?',
+                [(self.STATE_CONFIRMED, time.time(), label_id) for (label_id,) in confirmed]
+            )
+        return len(confirmed)
+
+    def resume(self, reprint_unconfirmed: bool = True) -> int:
+        """Prepara a fila para retomar após uma queda da impressora.
+
+        As etiquetas enviadas e ainda não confirmadas podem ter sido perdidas no buffer da impressora,
+        com reprint_unconfirmed elas voltam a ficar pendentes e são reenviadas a partir da última etiqueta confirmada.
+
+        Args:
+            reprint_unconfirmed (bool, optional): Reenvia as etiquetas não confirmadas (default: True),
+                                                  caso contrário elas são consideradas impressas.
+
+        Returns:
+            int: Quantidade de etiquetas afetadas.
+        """
+        self.confirm()
+        new_state = self.STATE_PENDING if reprint_unconfirmed else self.STATE_CONFIRMED
+        with self.connection:
+            cursor = self.connection.execute('UPDATE labels SET state = ? WHERE state = ?',
+                                             (new_state, self.STATE_SENT))
+        return cursor.rowcount
+
+    def purge(self, job: str = None) -> int:
+        """Remove do journal as etiquetas confirmadas.
+
+        Args:
+            job (str, optional): Remove somente as etiquetas do trabalho.
+
+        Returns:
+            int: Quantidade de etiquetas removidas.
+        """
+        query = 'DELETE FROM labels WHERE state = ?'
+        params = (self.STATE_CONFIRMED,)
+        if job is not None:
+            query += ' AND job = ?'
+            params += (job,)
+        with self.connection:
+            return self.connection.execute(query, params).rowcount
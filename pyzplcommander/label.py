@@ -1,8 +1,53 @@
 from __future__ import annotations
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import Literal
 
-from pyzplcommander.core import ZplCommandsBlock, ZplCommandSender
+from pyzplcommander.core import ZplCommandParams, ZplCommandsBlock, ZplCommandSender
 from pyzplcommander.commands import ZplCommands
+from pyzplcommander.graphics import ZplGraphic
+
+
+_FIELD_SPECIAL_CHARS = '_\\^~#$&|{}[]:;,.<>=-+!"()*%/?@`\''
+
+
+@lru_cache(maxsize=None)
+def field_escape_table(hex_indicator: str = '_') -> dict[int, str]:
+    """Retorna a tabela de str.translate que faz o escape hexadecimal dos caracteres especiais do ^FD.
+
+    Args:
+        hex_indicator (str, optional): Caractere de escape hexadecimal definido com ^FH (default: '_').
+    """
+    return {ord(char): f'{hex_indicator}{ord(char):02X}' for char in _FIELD_SPECIAL_CHARS}
+
+
+class _ZplFontParams(ZplCommandParams):
+    """Comando ^A com a fonte e a orientação junto ao nome do comando (^Afo,h,w), como a impressora interpreta.
+
+    Os parâmetros continuam sendo font, orientation, height e width, somente a formatação difere.
+    """
+
+    @staticmethod
+    def format_params_to_zpl(params: list[any]) -> str:
+        font = params[0] if params else None
+        orientation = params[1] if len(params) > 1 else None
+        size = ZplCommandParams.format_params_to_zpl(params[2:])
+        return (font or '') + (orientation or '') + (',' + size if size else '')
+
+
+@dataclass
+class ZplSerial:
+    """ZplSerial representa um valor serializado pela impressora, usado no lugar do texto de um campo.
+
+    Args:
+        start (str | int): Valor inicial, zeros à esquerda definem o tamanho quando leading_zeros é True
+        increment (int): Incremento a cada etiqueta, pode ser negativo
+        leading_zeros (bool): Mantém os zeros à esquerda do valor inicial
+    """
+
+    start: str | int
+    increment: int = 1
+    leading_zeros: bool = False
 
 
 class ZplLabelField(ZplCommandsBlock):
@@ -70,11 +115,58 @@ class ZplLabelField(ZplCommandsBlock):
         self.add_command(ZplCommands.FIELD_CLOCK(char_indicator_1, char_indicator_2, char_indicator_3))
         return self
 
-    def data(self, data: str):
+    def variable(self, number: int, prompt: str = None):
+        """Marca o campo como variável de um formato armazenado na impressora.
+        O valor do campo é informado ao recuperar o formato, o ^FD do formato é usado como valor padrão.
+
+        Note:
+            Comando ZPL: ^FN
+
+        Args:
+            number (int): Número do campo(1-9999).
+            prompt (str, optional): Texto de solicitação do campo, suporte somente para firmware .14+.
+        """
+        self.set_command(ZplCommands.FIELD_NUMBER(number, prompt), 'binding')
+        return self
+
+    def serialize(self, start: str | int, increment: int = 1, leading_zeros: bool = False):
+        """Define o texto do campo como um número serializado pela impressora.
+        O valor é incrementado pela impressora a cada etiqueta impressa, usado com a quantidade do ^PQ.
+
+        Note:
+            Comando ZPL: ^SN
+
+        Args:
+            start (str | int): Valor inicial, até 12 dígitos.
+            increment (int, optional): Incremento a cada etiqueta, pode ser negativo (default: 1).
+            leading_zeros (bool, optional): Mantém os zeros à esquerda do valor inicial (default: False).
+        """
+        self.set_command(ZplCommands.SERIALIZATION_DATA(start, increment, 'Y' if leading_zeros else 'N'), 'data')
+        return self
+
+    def serialize_mask(self, mask: str, increment: str = None):
+        """Serializa o texto do campo (^FD) usando uma máscara.
+
+        Caracteres da máscara: 'D' ou 'd' decimal, 'H' ou 'h' hexadecimal, 'O' ou 'o' octal,
+        'A' ou 'a' alfabético, 'N' ou 'n' alfanumérico, '%' ignora o caractere.
+
+        Note:
+            Comando ZPL: ^SF
+
+        Args:
+            mask (str): Máscara de serialização, alinhada à direita do texto do campo.
+            increment (str, optional): Incremento, alinhado à direita da máscara (default: 1).
+        """
+        self.set_command(ZplCommands.SERIALIZATION_FIELD(mask, increment), 'serialization')
+        return self
+
+    def data(self, data: str | ZplSerial):
         """Define o texto/data do campo.
         Caso o texto/data contenha caracteres especiais, é necessário realizar o escape dos mesmos,
         conforme a tabela de caracteres especiais do ZPL utilizando tabela hexadecimal.
 
+        Quando for informado um ZplSerial, o campo é serializado pela impressora com o comando ^SN.
+
         Caracteres especiais que é feito o escape:
         _ \\ ^ ~ # $ & | { } [ ] : ; , . < > = - + ! " ( ) * % / ? @ ` '
 
@@ -82,50 +174,55 @@ class ZplLabelField(ZplCommandsBlock):
             Comando ZPL: ^FD
 
         Args:
-            data (str): Texto/Data de até 3072 bytes.
+            data (str | ZplSerial): Texto/Data de até 3072 bytes.
         """
+        if isinstance(data, ZplSerial):
+            return self.serialize(data.start, data.increment, data.leading_zeros)
 
-        special_chars = {
-            '_': self.hex_indicator_char+'5F',
-            '\\': self.hex_indicator_char+'5C',
-            '^': self.hex_indicator_char+'5E',
-            '~': self.hex_indicator_char+'7E',
-            '#': self.hex_indicator_char+'23',
-            '$': self.hex_indicator_char+'24',
-            '&': self.hex_indicator_char+'26',
-            '|': self.hex_indicator_char+'7C',
-            '{': self.hex_indicator_char+'7B',
-            '}': self.hex_indicator_char+'7D',
-            '[': self.hex_indicator_char+'5B',
-            ']': self.hex_indicator_char+'5D',
-            ':': self.hex_indicator_char+'3A',
-            ';': self.hex_indicator_char+'3B',
-            ',': self.hex_indicator_char+'2C',
-            '.': self.hex_indicator_char+'2E',
-            '<': self.hex_indicator_char+'3C',
-            '>': self.hex_indicator_char+'3E',
-            '=': self.hex_indicator_char+'3D',
-            '-': self.hex_indicator_char+'2D',
-            '+': self.hex_indicator_char+'2B',
-            '!': self.hex_indicator_char+'21',
-            '"': self.hex_indicator_char+'22',
-            '(': self.hex_indicator_char+'28',
-            ')': self.hex_indicator_char+'29',
-            '*': self.hex_indicator_char+'2A',
-            '%': self.hex_indicator_char+'25',
-            '/': self.hex_indicator_char+'2F',
-            '?': self.hex_indicator_char+'3F',
-            '@': self.hex_indicator_char+'40',
-            '`': self.hex_indicator_char+'60',
-            "'": self.hex_indicator_char+'27'
-        }
-
-        if any(char in data for char in special_chars):
-            data = ''.join(special_chars.get(i, i) for i in data)
+        data = data.translate(field_escape_table(self.hex_indicator_char))
 
         self.set_command(ZplCommands.FIELD_DATA(data), 'data')
         return self
 
+    def graphic(self, graphic: ZplGraphic, method: Literal['auto', 'hex', 'acs', 'z64'] = 'auto'):
+        """Define um gráfico como conteúdo do campo.
+
+        Note:
+            Comando ZPL: ^GF
+
+        Args:
+            graphic (ZplGraphic): Gráfico a ser impresso.
+            method (str, optional): Codificação do gráfico, 'hex', 'acs', 'z64' ou 'auto' para a de menor tamanho.
+        """
+        self.set_command(graphic.field_command(method), 'data')
+        return self
+
+    def stored_graphic(self, name: str, magnification_x: int = None, magnification_y: int = None):
+        """Define um gráfico armazenado na impressora como conteúdo do campo.
+
+        Note:
+            Comando ZPL: ^XG
+
+        Args:
+            name (str): Caminho do gráfico na impressora, ex: 'R:LOGO.GRF'.
+            magnification_x (int, optional): Fator de ampliação horizontal(1-10).
+            magnification_y (int, optional): Fator de ampliação vertical(1-10).
+        """
+        self.set_command(ZplCommands.GRAPHIC_RECALL(name, magnification_x, magnification_y), 'data')
+        return self
+
+    def image_move(self, name: str):
+        """Define uma imagem armazenada na impressora como conteúdo do campo, sem ampliação.
+
+        Note:
+            Comando ZPL: ^IM
+
+        Args:
+            name (str): Caminho da imagem na impressora, ex: 'R:LOGO.GRF'.
+        """
+        self.set_command(ZplCommands.IMAGE_MOVE(name), 'data')
+        return self
+
     def position(self, x: int = None, y: int = None, justification: Literal['0', '1', '2'] = None):
         """Define a posição do campo.
         A posição do campo é relativa à posição inicial da etiqueta, definido pelo comando ^LH.
@@ -165,7 +262,7 @@ class ZplLabelField(ZplCommandsBlock):
             height (int, optional): Altura da fonte em pontos(10-32000).
             width (int, optional): Largura da fonte em pontos(10-32000).
         """
-        self.add_command(ZplCommands.FIELD_FONT(font, orientation, height, width))
+        self.add_command(_ZplFontParams(ZplCommands.FIELD_FONT.value, [font, orientation, height, width]))
         return self
 
     def direction(self, direction: Literal['H', 'V', 'R'], additional_inter_chars: int | None = None):
@@ -265,12 +362,12 @@ class ZplLabel(ZplCommandsBlock):
         self.add_command(field)
         return field
 
-    def draw_text(self, text: str, x: int = None, y: int = None, font: str = None,
+    def draw_text(self, text: str | ZplSerial, x: int = None, y: int = None, font: str = None,
                   height: int = None, width: int = None, orientation: Literal['N', 'R', 'I', 'B'] = None):
         """Adiciona um campo de texto à etiqueta.
 
         Args:
-            text (str): Texto/Data de até 3072 bytes.
+            text (str | ZplSerial): Texto/Data de até 3072 bytes, ou valor serializado pela impressora.
             x (int, optional): Coordenada X em pontos(0-32000), definido com o comando ^FO.
             y (int, optional): Coordenada Y em pontos(0-32000), definido com o comando ^FO.
             font (str, optional): Nome da fonte, caso não seja informado, será utilizada a fonte padrão atual.
@@ -287,6 +384,58 @@ class ZplLabel(ZplCommandsBlock):
         field.data(text)
         self.add_command(field)
 
+    def draw_graphic(self, graphic: ZplGraphic, x: int = None, y: int = None,
+                     method: Literal['auto', 'hex', 'acs', 'z64'] = 'auto'):
+        """Adiciona um campo gráfico à etiqueta.
+
+        Args:
+            graphic (ZplGraphic): Gráfico a ser impresso.
+            x (int, optional): Coordenada X em pontos(0-32000), definido com o comando ^FO.
+            y (int, optional): Coordenada Y em pontos(0-32000), definido com o comando ^FO.
+            method (str, optional): Codificação do gráfico, 'hex', 'acs', 'z64' ou 'auto' para a de menor tamanho.
+        """
+        field = ZplLabelField()
+        if x or y:
+            field.position(x, y)
+        field.graphic(graphic, method)
+        self.add_command(field)
+        return self
+
+    def draw_stored_graphic(self, name: str, x: int = None, y: int = None,
+                            magnification_x: int = None, magnification_y: int = None):
+        """Adiciona à etiqueta um gráfico armazenado na impressora.
+
+        Note:
+            Comando ZPL: ^XG
+
+        Args:
+            name (str): Caminho do gráfico na impressora, ex: 'R:LOGO.GRF'.
+            x (int, optional): Coordenada X em pontos(0-32000), definido com o comando ^FO.
+            y (int, optional): Coordenada Y em pontos(0-32000), definido com o comando ^FO.
+            magnification_x (int, optional): Fator de ampliação horizontal(1-10).
+            magnification_y (int, optional): Fator de ampliação vertical(1-10).
+        """
+        field = ZplLabelField()
+        if x or y:
+            field.position(x, y)
+        field.stored_graphic(name, magnification_x, magnification_y)
+        self.add_command(field)
+        return self
+
+    def draw_cached_graphic(self, graphic: ZplGraphic, x: int = None, y: int = None):
+        """Adiciona um gráfico à etiqueta usando o cache de recursos da impressora.
+        O gráfico é armazenado na impressora somente na primeira vez e recuperado com ^XG nas próximas.
+
+        Args:
+            graphic (ZplGraphic): Gráfico a ser impresso.
+            x (int, optional): Coordenada X em pontos(0-32000), definido com o comando ^FO.
+            y (int, optional): Coordenada Y em pontos(0-32000), definido com o comando ^FO.
+        """
+        resources = getattr(self.printer, 'resources', None)
+        if resources is None:
+            return self.draw_graphic(graphic, x, y)
+        return self.draw_stored_graphic(resources.graphic(graphic), x, y)
+
     def encode_font(self, encode_enum: str | int):
         """Define o charset da fonte para os próximos campos de texto.
         O charset é utilizado para converter os caracteres especiais para os caracteres correspondentes
@@ -331,6 +480,24 @@ class ZplLabel(ZplCommandsBlock):
         self.add_command(ZplCommands.LABEL_FONT_DEFAULT(font, height, width))
         return self
 
+    def quantity(self, quantity: int, pause: int = None, replicates: int = None,
+                 override_pause: Literal['Y', 'N'] = None, cut_on_error: Literal['Y', 'N'] = None):
+        """Define a quantidade de etiquetas impressas com este formato.
+
+        Note:
+            Comando ZPL: ^PQ
+
+        Args:
+            quantity (int): Quantidade total de etiquetas(1-99999999).
+            pause (int, optional): Pausa e corte a cada N etiquetas.
+            replicates (int, optional): Cópias de cada número de série.
+            override_pause (str, optional): 'Y' não pausa após cada lote.
+            cut_on_error (str, optional): 'Y' corta a etiqueta com erro de RFID.
+        """
+        self.set_command(ZplCommands.LABEL_QUANTITY(quantity, pause, replicates, override_pause, cut_on_error),
+                         'quantity')
+        return self
+
     def comment(self, comment: str):
         """Adiciona um comentário ao bloco de comandos.
         Conforme a documentação ZPL, o comentário é ignorado pelo interpretador.
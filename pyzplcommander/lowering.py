@@ -0,0 +1,175 @@
+from __future__ import annotations
+from typing import IO
+import io
+
+from pyzplcommander.core import (ZplCommandSender, ZplCommandsBlock, ZplDump, ZebraProperties, _DUMP_BLOCK,
+                                 _DUMP_FULL, _dump_kind)
+
+
+class ZplLoweredBlock:
+    """Árvore de blocos de comandos achatada em uma lista linear de segmentos ZPL já renderizados.
+
+    Os blocos aninhados (ex: ZplLabel com ZplLabelField e blocos de comentário) não geram textos intermediários
+    por nível, a saída final é uma única junção dos segmentos ou uma escrita direta deles no arquivo.
+
+    Depois de alterar um comando ou bloco da árvore, update() renderiza novamente somente o trecho dele.
+    Quando o trecho mantém a quantidade de segmentos, ex: um comando com parâmetros alterados, a atualização
+    substitui os segmentos no lugar, senão os trechos seguintes são deslocados sem renderizar.
+
+    Note:
+        Comandos com has_properties alteram as propriedades dos comandos seguintes, então a atualização deles
+        renderiza novamente o bloco pai inteiro.
+
+    Args:
+        block (ZplCommandsBlock): Bloco raiz, ex: ZplLabel.
+        zebra_props (ZebraProperties, optional): Propriedades da impressora.
+        break_lines (bool, optional): Quebra de linha entre os comandos do bloco raiz (default: True).
+    """
+
+    block: ZplCommandsBlock
+    zebra_props: ZebraProperties | None
+    break_lines: bool
+    segments: list[str]
+
+    def __init__(self, block: ZplCommandsBlock, zebra_props: ZebraProperties = None, break_lines: bool = True):
+        self.block = block
+        self.zebra_props = zebra_props
+        self.break_lines = break_lines
+        self.refresh()
+
+    def refresh(self) -> None:
+        """Renderiza novamente a árvore inteira, usado após alterações em vários pontos."""
+        self.segments = []
+        self._root = [self.block, 0, 0, self.zebra_props, []]
+        self.block._lower(self.segments, self.zebra_props, self.break_lines, self._root[4])
+        self._root[2] = len(self.segments)
+        self._spans: dict[int, list[tuple[list, list | None]]] = {}
+        self._index(self._root, None)
+
+    def _index(self, span: list, parent: list | None) -> None:
+        """Registra o trecho e os trechos dos filhos no índice pelo objeto do comando."""
+        self._spans.setdefault(id(span[0]), []).append((span, parent))
+        for child in span[4]:
+            self._index(child, span)
+
+    def _unindex(self, span: list) -> None:
+        """Remove do índice os trechos dos filhos de um trecho."""
+        for child in span[4]:
+            self._unindex(child)
+            entries = [entry for entry in self._spans[id(child[0])] if entry[0] is not child]
+            if entries:
+                self._spans[id(child[0])] = entries
+            else:
+                del self._spans[id(child[0])]
+
+    def _shift(self, spans: list[list], target: list, delta: int, found: bool = False) -> bool:
+        """Desloca os trechos posteriores ao trecho alterado e estende o fim dos trechos que o contêm."""
+        for span in spans:
+            if found:
+                span[1] += delta
+                span[2] += delta
+                self._shift(span[4], target, delta, True)
+            elif span is target:
+                found = True
+            elif self._shift(span[4], target, delta):
+                span[2] += delta
+                found = True
+        return found
+
+    def _relower(self, span: list, parent: list) -> None:
+        """Renderiza novamente o trecho de um comando e substitui os seus segmentos."""
+        command, start, stop, zebra_props = span[0], span[1], span[2], span[3]
+        kind = _dump_kind(command.__class__)
+        if kind & _DUMP_FULL:
+            zebra_props = parent[0]._apply_child(command, zebra_props)
+
+        segments, children = [], []
+        if kind & _DUMP_BLOCK:
+            command._lower(segments, zebra_props, False, children)
+        else:
+            segments.append(command.dump_zpl(zebra_props, False))
+
+        if not children and not span[4] and len(segments) == stop - start:
+            self.segments[start:stop] = segments
+            return
+
+        self._unindex(span)
+        for child in children:
+            _offset(child, start)
+        span[4] = children
+        for child in children:
+            self._index(child, span)
+
+        delta = len(segments) - (stop - start)
+        self.segments[start:stop] = segments
+        span[2] = stop + delta
+        if delta:
+            self._shift([self._root], span, delta)
+
+    def update(self, command: ZplDump) -> None:
+        """Renderiza novamente um comando ou bloco da árvore após ser alterado.
+
+        Note:
+            Comandos adicionados ou substituídos em um bloco, inclusive as cópias feitas por edit_command, são
+            renderizados atualizando o bloco que os contém.
+
+        Args:
+            command (ZplDump): Comando ou bloco alterado, se aparecer mais de uma vez todos os trechos são
+                               atualizados. O bloco raiz renderiza a árvore inteira.
+
+        Raises:
+            ValueError: Se o comando não estiver na árvore.
+        """
+        if command is self.block:
+            self.refresh()
+            return
+        entries = self._spans.get(id(command))
+        if not entries:
+            raise ValueError('Command not found in lowered block.')
+
+        if command.has_properties:
+            for parent in {id(parent[0]): parent[0] for _, parent in entries}.values():
+                self.update(parent)
+            return
+        for span, parent in list(entries):
+            self._relower(span, parent)
+
+    def dump_zpl(self) -> str:
+        """Retorna o código ZPL da árvore, unindo os segmentos uma única vez.
+
+        Returns:
+            str: Código ZPL.
+        """
+        return ''.join(self.segments)
+
+    def write(self, stream: IO) -> None:
+        """Escreve os segmentos no arquivo, sem montar o texto completo quando o arquivo é de texto.
+
+        Args:
+            stream (IO): Arquivo de texto ou binário.
+        """
+        if isinstance(stream, io.TextIOBase):
+            stream.writelines(self.segments)
+        else:
+            stream.write(self.dump_zpl().encode('UTF-8'))
+
+    def send_to(self, sender: ZplCommandSender, get_response: bool = False) -> None | str:
+        """Envia o código ZPL.
+
+        Args:
+            sender (ZplCommandSender): Objeto que envia o comando
+            get_response (bool, optional): Obter resposta do comando
+        """
+        return sender.send_command(self.dump_zpl(), get_response)
+
+    def __str__(self):
+        """Retorna o código ZPL da árvore."""
+        return self.dump_zpl()
+
+
+def _offset(span: list, offset: int) -> None:
+    """Desloca um trecho renderizado isoladamente para a sua posição na lista de segmentos."""
+    span[1] += offset
+    span[2] += offset
+    for child in span[4]:
+        _offset(child, offset)
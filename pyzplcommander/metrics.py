@@ -0,0 +1,208 @@
+from __future__ import annotations
+from dataclasses import dataclass
+from functools import lru_cache
+
+from pyzplcommander.enums import ZplFont, ZplStandardFonts8Dots, ZPL_STANDARD_FONTS
+
+
+# Espaço entre caracteres das fontes bitmap, em pontos na ampliação 1x
+_BITMAP_FONTS_GAP = {'A': 1, 'B': 2, 'C': 2, 'D': 2, 'E': 5, 'F': 3, 'G': 8, 'H': 6, 'GS': 0}
+
+# Fontes escaláveis, com largura proporcional por caractere
+_SCALABLE_FONTS = {'0', 'P', 'Q', 'R', 'S', 'T', 'U', 'V'}
+
+# Largura dos caracteres das fontes escaláveis, em milésimos do parâmetro de largura do ^A.
+# Valores aproximados da fonte CG Triumvirate Bold Condensed (fonte 0), agrupados por largura.
+_SCALABLE_WIDTH_GROUPS = {
+    250: " il.,:;!|'`",
+    333: '()[]{}-fjrtI"/\\',
+    556: 'abcdeghknopqsuvxyz0123456789$#*?_+<>=^~',
+    611: 'ABCDEFGHJKLNOPQRSTUVXYZ',
+    778: 'mwMW%&@',
+}
+_SCALABLE_DEFAULT_WIDTH = 556
+_SCALABLE_WIDTHS = {char: width for width, chars in _SCALABLE_WIDTH_GROUPS.items() for char in chars}
+
+
+@lru_cache(maxsize=65536)
+def _scalable_units(text: str) -> int:
+    """Retorna a largura do texto em milésimos do parâmetro de largura da fonte escalável."""
+    widths = _SCALABLE_WIDTHS
+    return sum([widths.get(char, _SCALABLE_DEFAULT_WIDTH) for char in text])
+
+
+@dataclass
+class ZplTextFit:
+    """Resultado do ajuste de texto em uma área.
+
+    Args:
+        height (int): Altura da fonte em pontos
+        width (int): Largura da fonte em pontos
+        lines (list[str]): Linhas do texto quebrado na largura da área
+    """
+
+    height: int
+    width: int
+    lines: list[str]
+
+
+class ZplTextMetrics:
+    """Medição de texto para as fontes padrão ZPL.
+
+    As fontes bitmap (A-H, GS) têm largura fixa por caractere e são ampliadas em múltiplos inteiros do tamanho
+    base, as fontes escaláveis (0, P-V) usam uma tabela de largura por caractere.
+
+    Note:
+        As larguras das fontes escaláveis são aproximadas, servem para calcular quebras de linha e tamanho de fonte
+        sem impressões de teste, o resultado impresso pode variar alguns pontos.
+
+    Args:
+        font (ZplFont | str): Fonte ou nome da fonte, ex: ZplStandardFonts8Dots.FONT_0() ou '0'.
+        density (int, optional): Densidade de impressão em pontos por milímetro (default: 8).
+    """
+
+    font: ZplFont
+    scalable: bool
+
+    def __init__(self, font: ZplFont | str, density: int = 8):
+        if not isinstance(font, ZplFont):
+            fonts = ZPL_STANDARD_FONTS.get(density, ZplStandardFonts8Dots)
+            font = next((item.value for item in fonts if item.value.name == str(font)), None)
+            if font is None:
+                raise ValueError(f'Unknown standard font for density {density}.')
+        self.font = font
+        self.scalable = font.name in _SCALABLE_FONTS
+
+    def font_size(self, height: int = None, width: int = None) -> tuple[int, int]:
+        """Retorna a altura e largura efetivas da fonte, como a impressora arredonda os valores.
+
+        Args:
+            height (int, optional): Altura solicitada em pontos.
+            width (int, optional): Largura solicitada em pontos.
+        """
+        if self.scalable:
+            height = height or (width if width else self.font.min_height)
+            return height, width or height
+
+        base_height, base_width = self.font.min_height, self.font.min_width
+        scale_height = max(round((height or base_height) / base_height), 1)
+        scale_width = max(round(width / base_width), 1) if width else scale_height
+        return base_height * scale_height, base_width * scale_width
+
+    def _gap(self, width: int) -> int:
+        """Retorna o espaço entre caracteres em pontos, zero para fontes escaláveis."""
+        if self.scalable:
+            return 0
+        scale = width // self.font.min_width
+        return _BITMAP_FONTS_GAP.get(self.font.name, max(self.font.min_width // 5, 1)) * scale
+
+    def _advance(self, text: str, width: int) -> int:
+        """Retorna o avanço horizontal do texto em pontos, incluindo o espaço após o último caractere."""
+        if self.scalable:
+            return (_scalable_units(text) * width + 999) // 1000
+        return len(text) * (width + self._gap(width))
+
+    def measure(self, text: str, height: int = None, width: int = None) -> tuple[int, int]:
+        """Mede uma linha de texto.
+
+        Args:
+            text (str): Texto de uma linha.
+            height (int, optional): Altura da fonte em pontos.
+            width (int, optional): Largura da fonte em pontos.
+
+        Returns:
+            int: Largura do texto em pontos
+            int: Altura do texto em pontos
+        """
+        height, width = self.font_size(height, width)
+        if not text:
+            return 0, height
+        return self._advance(text, width) - self._gap(width), height
+
+    def wrap(self, text: str, max_width: int, height: int = None, width: int = None) -> list[str]:
+        """Quebra o texto em linhas que cabem na largura informada, como o ^FB.
+        As quebras são feitas nos espaços, palavras maiores que a largura são quebradas por caractere.
+
+        Args:
+            text (str): Texto.
+            max_width (int): Largura máxima da linha em pontos.
+            height (int, optional): Altura da fonte em pontos.
+            width (int, optional): Largura da fonte em pontos.
+        """
+        height, width = self.font_size(height, width)
+        gap = self._gap(width)
+        space_advance = self._advance(' ', width)
+        max_advance = max_width + gap
+
+        lines = []
+        for paragraph in text.split('\n'):
+            line = ''
+            line_advance = 0
+            for word in paragraph.split():
+                word_advance = self._advance(word, width)
+                if line and line_advance + space_advance + word_advance <= max_advance:
+                    line += ' ' + word
+                    line_advance += space_advance + word_advance
+                    continue
+                if line:
+                    lines.append(line)
+                while word_advance > max_advance and len(word) > 1:
+                    cut = len(word) - 1
+                    while cut > 1 and self._advance(word[:cut], width) > max_advance:
+                        cut -= 1
+                    lines.append(word[:cut])
+                    word = word[cut:]
+                    word_advance = self._advance(word, width)
+                line, line_advance = word, word_advance
+            lines.append(line)
+        return lines
+
+    def fit_text(self, text: str, box: tuple[int, int], max_lines: int = None, line_spacing: int = 0,
+                 min_height: int = None, max_height: int = None) -> ZplTextFit | None:
+        """Escolhe o maior tamanho de fonte em que o texto cabe na área informada.
+
+        Args:
+            text (str): Texto.
+            box (tuple[int, int]): Largura e altura da área em pontos.
+            max_lines (int, optional): Quantidade máxima de linhas, por padrão limitada pela altura da área.
+            line_spacing (int, optional): Espaço adicional entre as linhas em pontos, como no ^FB.
+            min_height (int, optional): Menor altura de fonte aceita em pontos.
+            max_height (int, optional): Maior altura de fonte aceita em pontos, por padrão a altura da área.
+
+        Returns:
+            ZplTextFit | None: Tamanho da fonte e linhas, None se o texto não couber nem no menor tamanho.
+        """
+        box_width, box_height = box
+        base_height = self.font.min_height
+
+        def fits(font_height: int) -> ZplTextFit | None:
+            height, width = self.font_size(font_height)
+            lines = self.wrap(text, box_width, height, width)
+            if max_lines is not None and len(lines) > max_lines:
+                return None
+            if len(lines) * height + (len(lines) - 1) * line_spacing > box_height:
+                return None
+            if any(self.measure(line, height, width)[0] > box_width for line in lines):
+                return None
+            return ZplTextFit(height, width, lines)
+
+        low = min_height or (10 if self.scalable else base_height)
+        high = max_height or box_height
+        if self.scalable:
+            candidates = range(low, high + 1)
+        else:
+            candidates = [base_height * scale for scale in range(max(low // base_height, 1), 11)
+                          if base_height * scale <= high]
+
+        # O texto cabe em todos os tamanhos menores que o maior tamanho que cabe, então a busca é binária
+        best = None
+        lo, hi = 0, len(candidates) - 1
+        while lo <= hi:
+            middle = (lo + hi) // 2
+            result = fits(candidates[middle])
+            if result is not None:
+                best = result
+                lo = middle + 1
+            else:
+                hi = middle - 1
+        return best
@@ -0,0 +1,195 @@
+from __future__ import annotations
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Callable, Iterable, Literal, Mapping
+import heapq
+import itertools
+import threading
+import time
+
+from pyzplcommander.printers import ZebraPrinter
+
+
+@dataclass(frozen=True)
+class ZplPrinterHealth:
+    """Último estado conhecido de uma impressora.
+
+    Args:
+        state (str): 'error' com alguma falha, 'busy' imprimindo ou com formatos no buffer, 'idle' ociosa,
+                     'offline' sem resposta válida.
+        status (dict | None): Resposta do host_status_dict, None se offline.
+        errors (tuple[str, ...]): Falhas encontradas, ex: ('paper_out', 'head_up').
+        checked_at (float): Momento da consulta (time.time()).
+        interval (float): Intervalo até a próxima consulta em segundos.
+        failure (str | None): Erro da consulta quando offline.
+    """
+
+    state: Literal['error', 'busy', 'idle', 'offline']
+    status: dict | None
+    errors: tuple[str, ...]
+    checked_at: float
+    interval: float
+    failure: str | None = None
+
+
+def _health_state(status: dict) -> tuple[str, tuple[str, ...]]:
+    """Classifica o status da impressora, retornando o estado e as falhas."""
+    errors = tuple(name for name, value in (('paper_out', 'Out'), ('ribbon_out', 'Out'), ('head_up', 'Up'),
+                                            ('over_temp', 'Over Temp')) if status.get(name) == value)
+    if errors:
+        return 'error', errors
+    if status.get('labels_remaining', 0) > 0 or status.get('number_of_formats_recv_buf', 0) > 0:
+        return 'busy', errors
+    return 'idle', errors
+
+
+class ZplPrinterPoller:
+    """Serviço em segundo plano que consulta o status de várias impressoras com intervalo adaptativo.
+
+    Impressoras ocupadas, com falha (paper_out, ribbon_out, head_up, over_temp) ou sem resposta são consultadas a
+    cada min_interval, já que impressoras com falha muitas vezes não respondem ao ~HS. Impressoras ociosas e sem
+    falhas têm o intervalo multiplicado por backoff a cada consulta até max_interval. Qualquer mudança de estado
+    volta o intervalo para min_interval.
+
+    As consultas rodam em um pool limitado a workers threads. O último estado de todas as impressoras fica em
+    snapshot, um mapeamento imutável substituído por inteiro a cada consulta, podendo ser lido sem lock.
+
+    Args:
+        printers (Mapping[str, ZebraPrinter] | Iterable[ZebraPrinter]): Impressoras por nome, ou lista indexada
+                                                                        pela posição.
+        workers (int, optional): Quantidade máxima de consultas simultâneas (default: 4).
+        min_interval (float, optional): Intervalo mínimo entre consultas em segundos (default: 1).
+        max_interval (float, optional): Intervalo máximo entre consultas em segundos (default: 60).
+        backoff (float, optional): Fator de aumento do intervalo das impressoras ociosas (default: 2).
+        on_change (Callable[[str, ZplPrinterHealth | None, ZplPrinterHealth], None], optional): Chamado na thread
+            da consulta quando o estado de uma impressora muda.
+    """
+
+    printers: dict[str, ZebraPrinter]
+    workers: int
+    min_interval: float
+    max_interval: float
+    backoff: float
+    on_change: Callable[[str, ZplPrinterHealth | None, ZplPrinterHealth], None] | None
+
+    snapshot: Mapping[str, ZplPrinterHealth]
+
+    def __init__(self, printers: Mapping[str, ZebraPrinter] | Iterable[ZebraPrinter], workers: int = 4,
+                 min_interval: float = 1, max_interval: float = 60, backoff: float = 2,
+                 on_change: Callable[[str, ZplPrinterHealth | None, ZplPrinterHealth], None] = None):
+        self.printers = dict(printers) if isinstance(printers, Mapping) else dict(enumerate(printers))
+        self.workers = workers
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.on_change = on_change
+        self.snapshot = MappingProxyType({})
+
+        self._publish_lock = threading.Lock()  # Somente entre escritores, a leitura do snapshot não usa lock
+        self._schedule = threading.Condition()
+        self._queue: list[tuple[float, int, str]] = []
+        self._sequence = itertools.count()
+        self._stopped = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._executor: ThreadPoolExecutor | None = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    def _next_interval(self, previous: ZplPrinterHealth | None, state: str) -> float:
+        """Retorna o intervalo até a próxima consulta conforme o estado atual e o anterior."""
+        if state in ('error', 'busy', 'offline') or previous is None or previous.state != state:
+            return self.min_interval
+        return min(previous.interval * self.backoff, self.max_interval)
+
+    def poll(self, name: str) -> ZplPrinterHealth:
+        """Consulta uma impressora e publica o novo estado no snapshot.
+
+        Args:
+            name (str): Nome da impressora.
+
+        Returns:
+            ZplPrinterHealth: Estado da impressora.
+        """
+        failure = None
+        try:
+            status = self.printers[name].host_status_dict()
+        except (OSError, ValueError) as error:
+            status, failure = None, str(error) or type(error).__name__
+
+        if status:
+            state, errors = _health_state(status)
+        else:
+            state, errors = 'offline', ()
+
+        with self._publish_lock:
+            previous = self.snapshot.get(name)
+            health = ZplPrinterHealth(state, status, errors, time.time(), self._next_interval(previous, state),
+                                      failure)
+            snapshot = dict(self.snapshot)
+            snapshot[name] = health
+            self.snapshot = MappingProxyType(snapshot)
+
+        if self.on_change is not None and (previous is None or previous.state != state or
+                                           previous.errors != errors):
+            self.on_change(name, previous, health)
+        return health
+
+    def _poll_and_reschedule(self, name: str) -> None:
+        """Consulta a impressora no pool e agenda a próxima consulta."""
+        try:
+            health = self.poll(name)
+            interval = health.interval
+        except Exception:
+            interval = self.max_interval
+        with self._schedule:
+            heapq.heappush(self._queue, (time.monotonic() + interval, next(self._sequence), name))
+            self._schedule.notify()
+
+    def _run(self) -> None:
+        """Laço do agendador, envia ao pool as impressoras com consulta vencida."""
+        while not self._stopped.is_set():
+            with self._schedule:
+                while not self._stopped.is_set():
+                    wait = self._queue[0][0] - time.monotonic() if self._queue else None
+                    if wait is not None and wait <= 0:
+                        break
+                    self._schedule.wait(wait)
+                if self._stopped.is_set():
+                    return
+                _, _, name = heapq.heappop(self._queue)
+            self._executor.submit(self._poll_and_reschedule, name)
+
+    def start(self) -> None:
+        """Inicia as consultas em segundo plano, a primeira consulta de cada impressora é imediata."""
+        if self._thread is not None:
+            return
+        self._stopped.clear()
+        now = time.monotonic()
+        with self._schedule:
+            self._queue = [(now, next(self._sequence), name) for name in self.printers]
+            heapq.heapify(self._queue)
+        self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='zpl-poller')
+        self._thread = threading.Thread(target=self._run, name='zpl-poller', daemon=True)
+        self._thread.start()
+
+    def stop(self, wait: bool = True) -> None:
+        """Para as consultas.
+
+        Args:
+            wait (bool, optional): Aguarda as consultas em andamento terminarem (default: True).
+        """
+        if self._thread is None:
+            return
+        self._stopped.set()
+        with self._schedule:
+            self._schedule.notify_all()
+        self._thread.join()
+        self._executor.shutdown(wait=wait)
+        self._thread = None
+        self._executor = None
@@ -1,19 +1,40 @@
 from __future__ import annotations
-from typing import Literal
+from typing import Callable, Literal
 
 import os
 import re
+import mmap
 from abc import ABC
+import select
 import socket
+import threading
+
+try:
+    import termios
+except ImportError:  # termios existe somente em sistemas POSIX, usado somente pela impressora serial
+    termios = None
 
 from pyzplcommander.core import ZplCommandSender
 from pyzplcommander.commands import ZplCommands
 from pyzplcommander.label import ZplLabel
+from pyzplcommander.resources import ZebraResourceCache
+from pyzplcommander.spool import ZplSpoolFile
+
+
+_IOV_MAX = 1024  # Quantidade máxima de buffers por chamada de sendmsg
 
 
 class ZebraPrinter(ZplCommandSender, ABC):
     """Classe base para impressoras ZPL."""
 
+    stored_formats: dict[str, str]  # Formatos armazenados na impressora, caminho -> hash do layout
+    resources: ZebraResourceCache  # Gráficos e fontes armazenados na impressora
+    frame_gap: float = 0.1  # Espera por um novo quadro STX/ETX após um quadro completo, ver _read_response
+
+    def __init__(self):
+        self.stored_formats = {}
+        self.resources = ZebraResourceCache(self)
+
     def new_label(self) -> ZplLabel:
         """Inicia a criação de uma nova etiqueta.
 
@@ -22,6 +43,35 @@ class ZebraPrinter(ZplCommandSender, ABC):
         """
         return ZplLabel(self)
 
+    @staticmethod
+    def _read_response(read: Callable[[int, float], bytes], timeout: float, buffer_size: int = 1024,
+                       frame_gap: float = 0.1) -> bytes:
+        """Lê uma resposta da impressora até o fim da conexão ou até ficar sem dados pelo tempo limite.
+
+        As respostas em quadros STX/ETX (ex: ~HS) não aguardam o tempo limite inteiro: com todos os quadros
+        fechados, a leitura termina se o próximo quadro não começar dentro de frame_gap.
+
+        Args:
+            read (Callable[[int, float], bytes]): Função de leitura, recebe o tamanho e o tempo limite e retorna
+                                                  os bytes lidos, vazio no fim da conexão ou sem dados no tempo.
+            timeout (float): Tempo limite de espera por dados em segundos.
+            buffer_size (int, optional): Tamanho de cada leitura (default: 1024).
+            frame_gap (float, optional): Tempo de espera por um novo quadro após um quadro completo (default: 0.1).
+
+        Returns:
+            bytes: Resposta da impressora.
+        """
+        message = b''
+        wait = timeout
+        while True:
+            buffer_msg = read(buffer_size, wait)
+            if not buffer_msg:
+                break
+            message += buffer_msg
+            framed = message.lstrip().startswith(b'\x02') and message.rstrip().endswith(b'\x03')
+            wait = frame_gap if framed and message.count(b'\x02') == message.count(b'\x03') else timeout
+        return message
+
     def host_status(self) -> str:
         """Verifica o status da impressora.
 
@@ -165,7 +215,7 @@ class ZebraPrinter(ZplCommandSender, ABC):
         status = self.host_status()
         if not status or '' not in status:
             return None
-        return self._parse_host_status(self.host_status())
+        return self._parse_host_status(status)
     
     def host_diagnostic(self) -> str | None:
         """Verifica o status de diagnóstico da impressora.
@@ -225,6 +275,15 @@ class ZebraPrinter(ZplCommandSender, ABC):
         """
         return self.send_command(ZplCommands.HOST_MEMORY(), get_response=True)
 
+    def host_w(self) -> str:
+        """Lista os objetos armazenados na memória da impressora.
+
+        Returns:
+            str: Listagem de diretório da impressora.
+        """
+        return self.send_command(str(ZplCommands.LABEL_START_BLOCK()) + str(ZplCommands.HOST_W()) +
+                                 str(ZplCommands.LABEL_END_BLOCK()), get_response=True)
+
     def host_query(self, query: Literal['ES', 'HA', 'JT', 'MA', 'MI', 'OD', 'PH', 'PP', 'SN', 'UI']) -> str:
         """Consulta a impressora.
 
@@ -346,10 +405,28 @@ class ZebraNetworkPrinter(ZebraPrinter):
 
     A impressora deve estar configurada para receber comandos ZPL via TCP/IP.
 
+    A instância pode ser compartilhada entre threads: cada comando é escrito inteiro, consultas com resposta são
+    serializadas por impressora e envios sem resposta de várias threads são agrupados em uma única escrita.
+
+    Com write_buffer_size os envios sem resposta são acumulados e escritos juntos (sendmsg com vários buffers) ao
+    atingir o tamanho, após flush_interval segundos ou com flush(). Consultas com resposta e send_file escrevem os
+    comandos acumulados antes, mantendo a ordem.
+
+    Quando uma escrita acumulada falha, o erro é gerado no envio seguinte e os dados do lote ficam em
+    unsent_writes até serem obtidos com take_unsent(), para serem reenviados. Parte do lote pode ter chegado à
+    impressora antes da falha. Se a falha for na conexão, os dados continuam acumulados para o próximo flush().
+    Escritas síncronas, sem write_buffer_size, recebem o erro diretamente e não entram em unsent_writes.
+
     Args:
         host (str): Endereço IP ou nome de domínio da impressora.
         port (int): Porta de comunicação da impressora (default: 9100).
         timeout (int): Tempo limite de espera para resposta da impressora (default: None).
+        write_buffer_size (int, optional): Bytes acumulados antes de escrever, 0 escreve a cada envio (default: 0).
+        flush_interval (float, optional): Tempo máximo em segundos que um envio fica acumulado (default: None).
+        tcp_nodelay (bool, optional): Desativa o algoritmo de Nagle (TCP_NODELAY) (default: False).
+        send_buffer_size (int, optional): Tamanho do buffer de envio do socket (SO_SNDBUF).
+        keepalive (bool, optional): Ativa o keepalive do TCP (SO_KEEPALIVE) (default: False).
+        keepalive_idle (int, optional): Segundos sem tráfego antes do primeiro keepalive (TCP_KEEPIDLE).
     """
 
     host: str
@@ -361,7 +438,18 @@ class ZebraNetworkPrinter(ZebraPrinter):
     check_conn_on_send: bool
     auto_close_conn_on_send: bool
 
-    def __init__(self, host: str, port: int = 9100, timeout: int = None):
+    write_buffer_size: int
+    flush_interval: float | None
+    tcp_nodelay: bool
+    send_buffer_size: int | None
+    keepalive: bool
+    keepalive_idle: int | None
+
+    unsent_writes: list[bytes]
+
+    def __init__(self, host: str, port: int = 9100, timeout: int = None, write_buffer_size: int = 0,
+                 flush_interval: float = None, tcp_nodelay: bool = False, send_buffer_size: int = None,
+                 keepalive: bool = False, keepalive_idle: int = None):
         super().__init__()
         self.host = host
         self.port = port
@@ -371,9 +459,36 @@ class ZebraNetworkPrinter(ZebraPrinter):
         self.check_conn_on_send = True
         self.auto_close_conn_on_send = True
 
+        self.write_buffer_size = write_buffer_size
+        self.flush_interval = flush_interval
+        self.tcp_nodelay = tcp_nodelay
+        self.send_buffer_size = send_buffer_size
+        self.keepalive = keepalive
+        self.keepalive_idle = keepalive_idle
+
+        self._io_lock = threading.RLock()  # Uso exclusivo do socket: conexão, escrita e leitura de respostas
+        self._pending_lock = threading.Lock()  # Protege a lista de escritas pendentes
+        self._pending_writes: list[list] = []  # Escritas aguardando: [dados, enviado, erro, aguardada]
+        self._pending_bytes = 0
+        self._flush_timer: threading.Timer | None = None
+        self._flush_error: BaseException | None = None  # Erro de uma escrita feita pelo temporizador
+        self.unsent_writes = []  # Dados dos lotes que falharam, na ordem de envio
+
+    def _apply_socket_options(self, connection: socket.socket) -> None:
+        """Aplica as opções de socket configuradas, antes de conectar."""
+        if self.tcp_nodelay:
+            connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        if self.send_buffer_size:
+            connection.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, self.send_buffer_size)
+        if self.keepalive:
+            connection.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            if self.keepalive_idle and hasattr(socket, 'TCP_KEEPIDLE'):
+                connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, self.keepalive_idle)
+
     def connect(self) -> None:
         """Conecta-se à impressora."""
         self.connection = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._apply_socket_options(self.connection)
         self.connection.connect((self.host, self.port))
         if self.default_timeout is None or self.default_timeout < 0:
             self.default_timeout = self.connection.timeout
@@ -393,18 +508,17 @@ class ZebraNetworkPrinter(ZebraPrinter):
         Returns:
             str: Resposta da impressora.
         """
-        self.connection.settimeout(timeout)
-        message = b''
-        while True:
+        def read(size: int, wait: float) -> bytes:
+            self.connection.settimeout(wait)
             try:
-                buffer_msg = self.connection.recv(buffer_size)
-                if not buffer_msg:
-                    break
-                message += buffer_msg
+                return self.connection.recv(size)
             except socket.timeout:
-                break
+                return b''
 
-        self.connection.settimeout(self.default_timeout)
+        try:
+            message = self._read_response(read, timeout, buffer_size, self.frame_gap)
+        finally:
+            self.connection.settimeout(self.default_timeout)
         return message.decode('UTF-8')
 
     def _send_command(self, command: str, get_response: bool = False) -> None | str:
@@ -422,6 +536,138 @@ class ZebraNetworkPrinter(ZebraPrinter):
         if get_response:
             return self.recv_all()
 
+    def _open_for_send(self) -> None:
+        """Conecta-se à impressora antes do envio, se necessário."""
+        if self.check_conn_on_send and not self.connected():
+            self.connect()
+
+    def _close_after_send(self) -> None:
+        """Desconecta-se da impressora após o envio, se configurado."""
+        if self.check_conn_on_send and self.auto_close_conn_on_send and self.connection is not None:
+            self.disconnect()
+
+    def _send_buffers(self, buffers: list[bytes]) -> None:
+        """Escreve os buffers em sequência, com o mínimo de chamadas de sistema."""
+        if not hasattr(self.connection, 'sendmsg'):
+            self.connection.sendall(b''.join(buffers))
+            return
+
+        buffers = [memoryview(buffer) for buffer in buffers if buffer]
+        index = 0
+        while index < len(buffers):
+            sent = self.connection.sendmsg(buffers[index:index + _IOV_MAX])
+            # Avança sobre os buffers escritos por inteiro e corta o buffer escrito em parte
+            while sent and sent >= len(buffers[index]):
+                sent -= len(buffers[index])
+                index += 1
+            if sent:
+                buffers[index] = buffers[index][sent:]
+
+    def _flush_pending(self) -> None:
+        """Escreve todas as escritas pendentes em um único envio, deve ser chamado com o _io_lock."""
+        with self._pending_lock:
+            batch, self._pending_writes = self._pending_writes, []
+            self._pending_bytes = 0
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+        if not batch:
+            return
+        try:
+            self.connection.settimeout(self.default_timeout)
+            self._send_buffers([write[0] for write in batch])
+        except BaseException as error:
+            with self._pending_lock:
+                # Só guarda as escritas acumuladas, as aguardadas recebem o erro de quem as enviou
+                self.unsent_writes.extend(write[0] for write in batch if not write[3])
+            for write in batch:
+                write[2] = error
+            raise
+        finally:
+            for write in batch:
+                write[1] = True
+
+    def _timed_flush(self) -> None:
+        """Escreve os envios acumulados após flush_interval, guardando o erro para o próximo envio."""
+        try:
+            self.flush()
+        except Exception as error:
+            self._flush_error = error
+
+    def _raise_flush_error(self) -> None:
+        """Gera o erro de uma escrita feita pelo temporizador, uma única vez."""
+        if self._flush_error is not None:
+            error, self._flush_error = self._flush_error, None
+            raise error
+
+    def take_unsent(self) -> list[bytes]:
+        """Retorna e remove os dados dos lotes de escrita que falharam, para serem reenviados.
+
+        Returns:
+            list[bytes]: Dados não enviados, na ordem de envio.
+        """
+        with self._pending_lock:
+            unsent, self.unsent_writes = self.unsent_writes, []
+        return unsent
+
+    @property
+    def unsent_bytes(self) -> int:
+        """Quantidade de bytes dos lotes de escrita que falharam e ainda não foram obtidos com take_unsent()."""
+        return sum(len(data) for data in self.unsent_writes)
+
+    def flush(self) -> None:
+        """Escreve na impressora os envios sem resposta acumulados."""
+        self._raise_flush_error()
+        with self._io_lock:
+            if not self._pending_writes:
+                return
+            self._open_for_send()
+            try:
+                self._flush_pending()
+            finally:
+                self._close_after_send()
+
+    def _discard_pending(self, write: list) -> None:
+        """Remove da fila uma escrita que ainda não foi enviada."""
+        with self._pending_lock:
+            for index, pending in enumerate(self._pending_writes):
+                if pending is write:
+                    del self._pending_writes[index]
+                    self._pending_bytes -= len(write[0])
+                    break
+
+    def _write(self, data: bytes) -> None:
+        """Escreve os dados agrupando com as escritas pendentes de outras threads.
+
+        A escrita entra na fila de pendentes e a thread que obtiver o socket envia toda a fila de uma vez,
+        as demais threads encontram a sua escrita já enviada ao obter o socket.
+        Com write_buffer_size a escrita fica na fila até atingir o tamanho, o tempo ou um flush().
+        Uma falha da escrita feita pelo temporizador é gerada aqui, antes de acumular novos dados.
+        Se o envio síncrono falhar antes de enviar a escrita, ex: na conexão, ela sai da fila de pendentes, o erro
+        é gerado para quem chamou e a escrita não é reenviada junto com uma nova tentativa.
+        """
+        self._raise_flush_error()
+        write = [data, False, None, True]
+        with self._pending_lock:
+            self._pending_writes.append(write)
+            self._pending_bytes += len(data)
+            if self.write_buffer_size and self._pending_bytes < self.write_buffer_size:
+                write[3] = False
+                if self.flush_interval is not None and self._flush_timer is None:
+                    self._flush_timer = threading.Timer(self.flush_interval, self._timed_flush)
+                    self._flush_timer.daemon = True
+                    self._flush_timer.start()
+                return
+
+        if not write[1]:
+            try:
+                self.flush()
+            except BaseException:
+                self._discard_pending(write)
+                raise
+        if write[2] is not None:
+            raise write[2]
+
     def send_command(self, command: str | any, get_response: bool = False) -> None | str:
         """Envia um comando para a impressora.
 
@@ -432,19 +678,24 @@ class ZebraNetworkPrinter(ZebraPrinter):
         Returns:
             None | str: Resposta da impressora, se get_response=True.
         """
-        if self.check_conn_on_send and not self.connected():
-            self.connect()
-
-        result_recv = self._send_command(command=command, get_response=get_response)
-
-        if self.check_conn_on_send and self.auto_close_conn_on_send:
-            self.disconnect()
+        if not get_response:
+            self._write(bytes(str(command), 'UTF-8'))
+            return None
 
-        return result_recv
+        self._raise_flush_error()
+        with self._io_lock:
+            self._open_for_send()
+            try:
+                self._flush_pending()
+                return self._send_command(command=command, get_response=True)
+            finally:
+                self._close_after_send()
 
     def send_commands(self, commands: list[str | any], get_response: bool = False) -> list[str] | None:
         """Envia uma lista de comandos para a impressora.
 
+        Sem resposta, os comandos são enviados juntos em uma única escrita.
+
         Args:
             commands (list[str | any]): Lista de comandos ZPL a serem enviados.
             get_response (bool): Indica se deve-se esperar uma resposta da impressora (default: False).
@@ -452,20 +703,63 @@ class ZebraNetworkPrinter(ZebraPrinter):
         Returns:
             list[str] | None: Lista de respostas da impressora, se get_response=True.
         """
-        if self.check_conn_on_send and not self.connected():
-            self.connect()
+        if not get_response:
+            self._write(bytes(''.join(str(command) for command in commands), 'UTF-8'))
+            return None
 
-        results = []
-        for command in commands:
-            result_recv = self._send_command(command=command, get_response=get_response)
-            if get_response:
-                results.append(result_recv)
+        self._raise_flush_error()
+        with self._io_lock:
+            self._open_for_send()
+            try:
+                self._flush_pending()
+                return [self._send_command(command=command, get_response=True) for command in commands]
+            finally:
+                self._close_after_send()
+
+    def _send_file_mmap(self, file, offset: int, block_size: int) -> int:
+        """Envia o arquivo mapeado em memória, em fatias sem cópia."""
+        size = os.fstat(file.fileno()).st_size
+        if offset >= size:
+            return 0
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as file_map:
+            with memoryview(file_map) as view:
+                for start in range(offset, size, block_size):
+                    with view[start:start + block_size] as block:
+                        self.connection.sendall(block)
+        return size - offset
+
+    def send_file(self, file_name: str, offset: int = 0, align_to_label: bool = True,
+                  block_size: int = 1024 * 1024) -> int:
+        """Envia um arquivo ZPL (ex: spool gerado pelo ZplSpoolWriter) para a impressora.
+
+        O envio usa socket.sendfile (sem cópia para o espaço do usuário) quando disponível no sistema,
+        caso contrário o arquivo é mapeado em memória e enviado em fatias.
 
-        if self.check_conn_on_send and self.auto_close_conn_on_send:
-            self.disconnect()
+        Args:
+            file_name (str): Caminho do arquivo ZPL.
+            offset (int): Posição inicial em bytes, usado para retomar um envio interrompido (default: 0).
+            align_to_label (bool): Ajusta a posição inicial para o início da etiqueta, usando o índice do spool
+                                   (default: True).
+            block_size (int): Tamanho das fatias no envio mapeado em memória (default: 1 MiB).
 
-        if get_response:
-            return results
+        Returns:
+            int: Quantidade de bytes enviados.
+        """
+        if offset and align_to_label:
+            offset = ZplSpoolFile(file_name).label_boundary(offset)
+
+        self._raise_flush_error()
+        with self._io_lock:
+            self._open_for_send()
+            try:
+                self._flush_pending()
+                self.connection.settimeout(self.default_timeout)
+                with open(file_name, 'rb') as f:
+                    if hasattr(os, 'sendfile'):
+                        return self.connection.sendfile(f, offset)
+                    return self._send_file_mmap(f, offset, block_size)
+            finally:
+                self._close_after_send()
 
     def connected(self) -> bool:
         """Verifica se a impressora está conectada.
@@ -479,3 +773,193 @@ class ZebraNetworkPrinter(ZebraPrinter):
             self.connection.sendall(bytes(str(ZplCommands.FIELD_COMMENT) + 'TESTE_CONNECTION', 'UTF-8'))
         except OSError:
             return False
+        return True
+
+
+class ZebraSerialPrinter(ZebraPrinter):
+    """Classe de impressora conectada via porta serial (RS-232).
+
+    A porta é configurada com termios em modo bruto, com a mesma velocidade, paridade, bits e handshake configurados
+    na impressora (ver a interface em host_status_dict). O controle de fluxo é feito pelo kernel: com Xon/Xoff a
+    escrita é pausada quando a impressora envia XOFF, com DTR é usado o controle por hardware (CRTSCTS), com o DTR
+    da impressora ligado ao CTS do computador. As escritas aguardam a porta sem descartar bytes, sem tempo limite
+    por padrão, já que a impressora pode segurar o fluxo enquanto imprime um lote longo.
+
+    A porta permanece aberta entre os envios e a instância pode ser compartilhada entre threads.
+
+    Note:
+        Disponível somente em sistemas POSIX. Para testes, um pseudo-terminal (pty) pode substituir a porta.
+
+    Args:
+        device (str): Caminho da porta serial, ex: '/dev/ttyS0'.
+        baud (int, optional): Velocidade em bauds (default: 9600).
+        handshake (str, optional): Controle de fluxo, 'Xon/Xoff', 'DTR' ou None (default: 'Xon/Xoff').
+        parity (str, optional): Paridade, 'None', 'Odd' ou 'Even' (default: 'None').
+        data_bits (int, optional): Bits de dados, 7 ou 8 (default: 8).
+        stop_bits (int, optional): Bits de parada, 1 ou 2 (default: 1).
+        timeout (float, optional): Tempo limite de espera para resposta da impressora (default: 2).
+        write_timeout (float | None, optional): Tempo limite em segundos sem a porta aceitar dados durante uma
+                                                escrita, None aguarda o controle de fluxo indefinidamente
+                                                (default: None).
+        frame_gap (float, optional): Espera por um novo quadro STX/ETX após um quadro completo da resposta,
+                                     aumentar em baixas velocidades (default: 0.1).
+    """
+
+    device: str
+    baud: int
+    handshake: Literal['Xon/Xoff', 'DTR'] | None
+    parity: Literal['None', 'Odd', 'Even']
+    data_bits: int
+    stop_bits: int
+    default_timeout: float
+    write_timeout: float | None
+
+    fd: int | None
+
+    def __init__(self, device: str, baud: int = 9600, handshake: Literal['Xon/Xoff', 'DTR'] | None = 'Xon/Xoff',
+                 parity: Literal['None', 'Odd', 'Even'] = 'None', data_bits: int = 8, stop_bits: int = 1,
+                 timeout: float = 2, write_timeout: float = None, frame_gap: float = 0.1):
+        if termios is None:
+            raise OSError('Serial printers require termios (POSIX).')
+        if not hasattr(termios, f'B{baud}'):
+            raise ValueError(f'Baud rate {baud} is not supported by the system.')
+        super().__init__()
+        self.device = device
+        self.baud = baud
+        self.handshake = handshake
+        self.parity = parity
+        self.data_bits = data_bits
+        self.stop_bits = stop_bits
+        self.default_timeout = timeout
+        self.write_timeout = write_timeout
+        self.frame_gap = frame_gap
+        self.fd = None
+        self._io_lock = threading.RLock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.disconnect()
+
+    def _configure(self) -> None:
+        """Configura a porta em modo bruto com os parâmetros da interface."""
+        iflag, oflag, cflag, lflag, _, _, cc = termios.tcgetattr(self.fd)
+
+        iflag &= ~(termios.IGNBRK | termios.BRKINT | termios.PARMRK | termios.ISTRIP | termios.INLCR |
+                   termios.IGNCR | termios.ICRNL | termios.IXON | termios.IXOFF | termios.IXANY)
+        oflag &= ~termios.OPOST
+        lflag &= ~(termios.ECHO | termios.ECHONL | termios.ICANON | termios.ISIG | termios.IEXTEN)
+        cflag &= ~(termios.CSIZE | termios.PARENB | termios.PARODD | termios.CSTOPB | termios.CRTSCTS)
+        cflag |= termios.CLOCAL | termios.CREAD | termios.HUPCL
+        cflag |= termios.CS7 if self.data_bits == 7 else termios.CS8
+        if self.parity != 'None':
+            cflag |= termios.PARENB | (termios.PARODD if self.parity == 'Odd' else 0)
+        if self.stop_bits == 2:
+            cflag |= termios.CSTOPB
+
+        if self.handshake == 'Xon/Xoff':
+            iflag |= termios.IXON | termios.IXOFF
+        elif self.handshake == 'DTR':
+            cflag |= termios.CRTSCTS
+
+        cc[termios.VMIN] = 0
+        cc[termios.VTIME] = 0
+        speed = getattr(termios, f'B{self.baud}')
+        termios.tcsetattr(self.fd, termios.TCSANOW, [iflag, oflag, cflag, lflag, speed, speed, cc])
+
+    def connect(self) -> None:
+        """Abre e configura a porta serial."""
+        fd = os.open(self.device, os.O_RDWR | os.O_NOCTTY | os.O_NONBLOCK)
+        self.fd = fd
+        try:
+            self._configure()
+        except BaseException:
+            self.disconnect()
+            raise
+
+    def disconnect(self) -> None:
+        """Fecha a porta serial."""
+        if self.fd is not None:
+            fd, self.fd = self.fd, None
+            os.close(fd)
+
+    def connected(self) -> bool:
+        """Verifica se a porta serial está aberta.
+
+        Returns:
+            bool: True se aberta, False caso contrário.
+        """
+        return self.fd is not None
+
+    def _write(self, data: bytes) -> None:
+        """Escreve todos os dados, aguardando a porta quando o buffer de saída está cheio ou pausado pelo fluxo."""
+        view = memoryview(data)
+        while view:
+            _, writable, _ = select.select([], [self.fd], [], self.write_timeout)
+            if not writable:
+                raise TimeoutError('Serial port did not accept data, check the printer flow control.')
+            try:
+                written = os.write(self.fd, view)
+            except BlockingIOError:
+                continue
+            view = view[written:]
+
+    def _read(self, size: int, wait: float) -> bytes:
+        """Lê até size bytes da porta, retorna vazio se não houver dados no tempo."""
+        readable, _, _ = select.select([self.fd], [], [], wait)
+        if not readable:
+            return b''
+        try:
+            return os.read(self.fd, size)
+        except BlockingIOError:
+            return b''
+
+    def recv_all(self, timeout: float = 2, buffer_size: int = 1024) -> str:
+        """Recebe a resposta da impressora.
+
+        Args:
+            timeout (float): Tempo limite de espera para resposta da impressora (default: 2).
+            buffer_size (int): Tamanho do buffer de leitura (default: 1024).
+
+        Returns:
+            str: Resposta da impressora.
+        """
+        return self._read_response(self._read, timeout, buffer_size, self.frame_gap).decode('UTF-8')
+
+    def send_command(self, command: str | any, get_response: bool = False) -> None | str:
+        """Envia um comando para a impressora.
+
+        Args:
+            command (str | any): Comando ZPL a ser enviado.
+            get_response (bool): Indica se deve-se esperar uma resposta da impressora (default: False).
+
+        Returns:
+            None | str: Resposta da impressora, se get_response=True.
+        """
+        with self._io_lock:
+            if self.fd is None:
+                self.connect()
+            if get_response:
+                termios.tcflush(self.fd, termios.TCIFLUSH)
+            self._write(bytes(str(command), 'UTF-8'))
+            if get_response:
+                return self.recv_all(self.default_timeout)
+        return None
+
+    def send_commands(self, commands: list[str | any], get_response: bool = False) -> list[str] | None:
+        """Envia uma lista de comandos para a impressora.
+
+        Sem resposta, os comandos são enviados juntos em uma única escrita.
+
+        Args:
+            commands (list[str | any]): Lista de comandos ZPL a serem enviados.
+            get_response (bool): Indica se deve-se esperar uma resposta da impressora (default: False).
+
+        Returns:
+            list[str] | None: Lista de respostas da impressora, se get_response=True.
+        """
+        with self._io_lock:
+            if get_response:
+                return [self.send_command(command, get_response=True) for command in commands]
+            return self.send_command(''.join(str(command) for command in commands))
@@ -0,0 +1,304 @@
+from __future__ import annotations
+import base64
+import re
+import struct
+import zlib
+
+from pyzplcommander.core import ZebraProperties, ZplDump
+from pyzplcommander.enums import ZplFont, ZplStandardFonts8Dots, ZPL_STANDARD_FONTS
+
+try:
+    import numpy as np
+except ImportError:  # numpy é opcional, necessário somente para o rasterizador
+    np = None
+
+
+_ZPL_TOKEN_REG = re.compile(r'[\^~]([A-Z@][A-Z0-9@]?)([^\^~]*)', re.DOTALL)
+_ACS_COUNTS = {char: index + 1 for index, char in enumerate('GHIJKLMNOPQRSTUVWXY')}
+_ACS_COUNTS.update({char: (index + 1) * 20 for index, char in enumerate('ghijklmnopqrstuvwxyz')})
+
+
+def decode_graphic_data(data: str, bytes_per_row: int) -> bytes:
+    """Decodifica os dados de um ^GF/~DG em hexadecimal, ACS ou :Z64:/:B64: para bytes compactados.
+
+    Args:
+        data (str): Dados do gráfico.
+        bytes_per_row (int): Quantidade de bytes por linha.
+    """
+    data = data.strip()
+    if data.startswith((':Z64:', ':B64:')):
+        encoded = data[5:].split(':', 1)[0]
+        decoded = base64.b64decode(encoded)
+        return zlib.decompress(decoded) if data.startswith(':Z64:') else decoded
+
+    row_size = bytes_per_row * 2
+    rows = []
+    row = ''
+    count = 0
+    for char in data:
+        if char in _ACS_COUNTS:
+            count += _ACS_COUNTS[char]
+            continue
+        if char == ':':
+            rows.append(rows[-1] if rows else '0' * row_size)
+            continue
+        if char == ',':
+            row = row.ljust(row_size, '0')
+        elif char == '!':
+            row = row.ljust(row_size, 'F')
+        elif char in '0123456789ABCDEFabcdef':
+            row += char * (count or 1)
+            count = 0
+        else:
+            continue
+        while len(row) >= row_size:
+            rows.append(row[:row_size])
+            row = row[row_size:]
+    if row:
+        rows.append(row.ljust(row_size, '0'))
+    return bytes.fromhex(''.join(rows))
+
+
+class ZplRasterizer:
+    """Rasterizador local de ZPL para pré-visualização e testes de regressão sem impressora.
+
+    Gera um bitmap monocromático (numpy.ndarray booleano, True = ponto impresso) com a resolução definida pela
+    densidade e tamanho da etiqueta em ZebraProperties.
+
+    Comandos suportados: ^LH, ^FO, ^FS, ^FR, ^FH, ^FD, ^A, ^CF, ^GB, ^GC, ^GE, ^GD, ^GF, ~DG, ^XG, ^PO.
+
+    Note:
+        O texto é desenhado como blocos do tamanho da célula de cada caractere da fonte, sem o desenho dos glifos,
+        suficiente para conferir posição, tamanho e sobreposição de campos.
+
+    Args:
+        zebra_props (ZebraProperties, optional): Propriedades da impressora e da etiqueta.
+    """
+
+    zebra_props: ZebraProperties
+    width: int
+    height: int
+    graphics: dict[str, any]  # Gráficos armazenados com ~DG, caminho -> bitmap
+
+    def __init__(self, zebra_props: ZebraProperties = None):
+        if np is None:
+            raise ImportError('numpy is required to use ZplRasterizer.')
+        self.zebra_props = zebra_props or ZebraProperties()
+        self.width = self.zebra_props.label_width * self.zebra_props.density
+        self.height = self.zebra_props.label_height * self.zebra_props.density
+        self.graphics = {}
+
+        fonts = ZPL_STANDARD_FONTS.get(self.zebra_props.density, ZplStandardFonts8Dots)
+        self._fonts: dict[str, ZplFont] = {font.value.name: font.value for font in fonts}
+
+    @staticmethod
+    def _int(params: list[str], index: int, default: int) -> int:
+        try:
+            return int(float(params[index]))
+        except (IndexError, ValueError):
+            return default
+
+    def _paint(self, bitmap, x: int, y: int, mask, white: bool, reverse: bool):
+        """Aplica a máscara no bitmap na posição informada, recortando o que estiver fora da etiqueta."""
+        height, width = mask.shape
+        x0, y0 = max(x, 0), max(y, 0)
+        x1, y1 = min(x + width, bitmap.shape[1]), min(y + height, bitmap.shape[0])
+        if x0 >= x1 or y0 >= y1:
+            return
+        mask = mask[y0 - y:y1 - y, x0 - x:x1 - x]
+        region = bitmap[y0:y1, x0:x1]
+        if reverse:
+            region ^= mask
+        elif white:
+            region &= ~mask
+        else:
+            region |= mask
+
+    @staticmethod
+    def _box_mask(width: int, height: int, thickness: int):
+        mask = np.zeros((height, width), dtype=bool)
+        mask[:thickness, :] = True
+        mask[height - thickness:, :] = True
+        mask[:, :thickness] = True
+        mask[:, width - thickness:] = True
+        return mask
+
+    @staticmethod
+    def _ellipse_mask(width: int, height: int, thickness: int):
+        rx, ry = width / 2, height / 2
+        yy, xx = np.ogrid[:height, :width]
+        dx, dy = xx + 0.5 - rx, yy + 0.5 - ry
+        outer = (dx / rx) ** 2 + (dy / ry) ** 2 <= 1
+        irx, iry = rx - thickness, ry - thickness
+        if irx <= 0 or iry <= 0:
+            return outer
+        inner = (dx / irx) ** 2 + (dy / iry) ** 2 < 1
+        return outer & ~inner
+
+    @staticmethod
+    def _diagonal_mask(width: int, height: int, thickness: int, orientation: str):
+        yy, xx = np.ogrid[:height, :width + thickness]
+        line_x = (yy * width) // max(height, 1)
+        if orientation == 'R':
+            line_x = width - 1 - line_x
+        offset = xx - line_x
+        return (offset >= 0) & (offset < thickness)
+
+    def _graphic_mask(self, data: bytes, bytes_per_row: int):
+        rows = len(data) // bytes_per_row
+        bits = np.unpackbits(np.frombuffer(data, dtype=np.uint8)[:rows * bytes_per_row])
+        return bits.reshape(rows, bytes_per_row * 8).astype(bool)
+
+    def _text_mask(self, text: str, font_height: int, font_width: int, orientation: str):
+        cell_width = max(font_width, 1)
+        mask = np.zeros((max(font_height, 1), cell_width * len(text)), dtype=bool)
+        glyph_width = max(cell_width - max(cell_width // 5, 1), 1)
+        glyph_height = max(font_height - max(font_height // 5, 1), 1)
+        for index, char in enumerate(text):
+            if not char.isspace():
+                start = index * cell_width
+                mask[font_height - glyph_height:, start:start + glyph_width] = True
+        if orientation == 'R':
+            return np.rot90(mask, -1)
+        if orientation == 'I':
+            return np.rot90(mask, 2)
+        if orientation == 'B':
+            return np.rot90(mask, 1)
+        return mask
+
+    def _font_size(self, name: str, height: int | None, width: int | None) -> tuple[int, int]:
+        font = self._fonts.get(name)
+        base_height, base_width = (font.min_height, font.min_width) if font is not None else (9, 5)
+        if height and not width:
+            width = max(height * base_width // base_height, 1)
+        if width and not height:
+            height = max(width * base_height // base_width, 1)
+        return height or base_height, width or base_width
+
+    def render(self, zpl: str | ZplDump):
+        """Rasteriza uma etiqueta ou código ZPL.
+
+        Args:
+            zpl (str | ZplDump): Código ZPL ou objeto ZplDump, ex: ZplLabel.
+
+        Returns:
+            numpy.ndarray: Bitmap booleano com o formato (altura, largura).
+        """
+        if isinstance(zpl, ZplDump):
+            zpl = zpl.dump_zpl(self.zebra_props, False)
+
+        bitmap = np.zeros((self.height, self.width), dtype=bool)
+        home_x = home_y = 0
+        x = y = 0
+        reverse = False
+        hex_indicator = None
+        default_font = ('0', None, None)
+        font = None
+        invert = False
+
+        for command, args in _ZPL_TOKEN_REG.findall(zpl):
+            args = args.strip('\r\n')
+            params = args.split(',')
+
+            if command == 'LH':
+                home_x, home_y = self._int(params, 0, 0), self._int(params, 1, 0)
+            elif command in ('FO', 'FT'):
+                x, y = home_x + self._int(params, 0, 0), home_y + self._int(params, 1, 0)
+            elif command == 'FR':
+                reverse = True
+            elif command == 'FH':
+                hex_indicator = args[:1] or '_'
+            elif command == 'FS':
+                reverse, hex_indicator, font = False, None, None
+            elif command == 'CF':
+                default_font = (params[0][:1] or default_font[0], self._int(params, 1, 0) or None,
+                                self._int(params, 2, 0) or None)
+            elif command == 'PO':
+                invert = args[:1] == 'I'
+            elif command[0] == 'A' and command != 'A@':
+                # ^Afo,h,w: o nome da fonte faz parte do comando, a orientação é o primeiro parâmetro
+                font = (command[1:] or default_font[0], params[0][:1] or 'N',
+                        self._int(params, 1, 0) or None, self._int(params, 2, 0) or None)
+            elif command == 'FD':
+                text = args
+                if hex_indicator:
+                    text = re.sub(re.escape(hex_indicator) + '([0-9A-Fa-f]{2})',
+                                  lambda match: chr(int(match.group(1), 16)), text)
+                name, orientation, height, width = font or (default_font[0], 'N') + default_font[1:]
+                height, width = self._font_size(name, height, width)
+                self._paint(bitmap, x, y, self._text_mask(text, height, width, orientation), False, reverse)
+            elif command == 'GB':
+                thickness = max(self._int(params, 2, 1), 1)
+                width = max(self._int(params, 0, thickness), thickness)
+                height = max(self._int(params, 1, thickness), thickness)
+                mask = self._box_mask(width, height, min(thickness, width, height))
+                self._paint(bitmap, x, y, mask, params[3:4] == ['W'], reverse)
+            elif command == 'GC':
+                diameter = max(self._int(params, 0, 3), 1)
+                mask = self._ellipse_mask(diameter, diameter, max(self._int(params, 1, 1), 1))
+                self._paint(bitmap, x, y, mask, params[2:3] == ['W'], reverse)
+            elif command == 'GE':
+                mask = self._ellipse_mask(max(self._int(params, 0, 3), 1), max(self._int(params, 1, 3), 1),
+                                          max(self._int(params, 2, 1), 1))
+                self._paint(bitmap, x, y, mask, params[3:4] == ['W'], reverse)
+            elif command == 'GD':
+                thickness = max(self._int(params, 2, 1), 1)
+                mask = self._diagonal_mask(max(self._int(params, 0, 3), 1), max(self._int(params, 1, 3), 1),
+                                           thickness, (params[4:5] or ['R'])[0] or 'R')
+                self._paint(bitmap, x, y, mask, params[3:4] == ['W'], reverse)
+            elif command == 'GF':
+                bytes_per_row = self._int(params, 3, 0)
+                if bytes_per_row > 0:
+                    data = decode_graphic_data(','.join(params[4:]), bytes_per_row)
+                    self._paint(bitmap, x, y, self._graphic_mask(data, bytes_per_row), False, reverse)
+            elif command == 'DG':
+                bytes_per_row = self._int(params, 2, 0)
+                if bytes_per_row > 0:
+                    data = decode_graphic_data(','.join(params[3:]), bytes_per_row)
+                    self.graphics[params[0].upper()] = self._graphic_mask(data, bytes_per_row)
+            elif command == 'XG':
+                mask = self.graphics.get(params[0].upper())
+                if mask is not None:
+                    scale_x, scale_y = max(self._int(params, 1, 1), 1), max(self._int(params, 2, 1), 1)
+                    mask = mask.repeat(scale_y, axis=0).repeat(scale_x, axis=1)
+                    self._paint(bitmap, x, y, mask, False, reverse)
+
+        return np.rot90(bitmap, 2).copy() if invert else bitmap
+
+    @staticmethod
+    def diff(bitmap_a, bitmap_b) -> int:
+        """Retorna a quantidade de pontos diferentes entre dois bitmaps de mesmo tamanho."""
+        return int(np.count_nonzero(bitmap_a ^ bitmap_b))
+
+    @staticmethod
+    def to_png(bitmap) -> bytes:
+        """Converte o bitmap em uma imagem PNG monocromática.
+
+        Args:
+            bitmap (numpy.ndarray): Bitmap booleano, True = ponto impresso (preto).
+
+        Returns:
+            bytes: Conteúdo do arquivo PNG.
+        """
+        height, width = bitmap.shape
+        rows = np.packbits(~bitmap, axis=1)
+        raw = np.hstack((np.zeros((height, 1), dtype=np.uint8), rows)).tobytes()
+
+        def chunk(chunk_type: bytes, data: bytes) -> bytes:
+            return (struct.pack('>I', len(data)) + chunk_type + data +
+                    struct.pack('>I', zlib.crc32(chunk_type + data) & 0xFFFFFFFF))
+
+        return (b'\x89PNG\r\n\x1a\n' +
+                chunk(b'IHDR', struct.pack('>IIBBBBB', width, height, 1, 0, 0, 0, 0)) +
+                chunk(b'IDAT', zlib.compress(raw, 6)) +
+                chunk(b'IEND', b''))
+
+    def save_png(self, zpl: str | ZplDump, file_name: str) -> None:
+        """Rasteriza a etiqueta e salva a pré-visualização em PNG.
+
+        Args:
+            zpl (str | ZplDump): Código ZPL ou objeto ZplDump.
+            file_name (str): Caminho do arquivo PNG.
+        """
+        with open(file_name, 'wb') as f:
+            f.write(self.to_png(self.render(zpl)))
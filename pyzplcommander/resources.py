@@ -0,0 +1,194 @@
+from __future__ import annotations
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Literal
+import hashlib
+import re
+
+from pyzplcommander.core import ZplCommandSender
+from pyzplcommander.commands import ZplCommands
+from pyzplcommander.graphics import ZplGraphic
+
+
+@dataclass
+class ZplStoredResource:
+    """Recurso (gráfico ou fonte) armazenado na memória da impressora.
+
+    Args:
+        path (str): Caminho do recurso na impressora, ex: 'R:G1A2B3C4.GRF'
+        content_hash (str): Hash do conteúdo do recurso
+        size (int): Tamanho do recurso em bytes
+    """
+
+    path: str
+    content_hash: str
+    size: int
+
+
+class ZebraResourceCache:
+    """Cache de recursos armazenados na impressora, endereçado pelo conteúdo.
+
+    Cada gráfico ou fonte é identificado pelo hash do seu conteúdo e enviado uma única vez para a impressora,
+    as etiquetas passam a referenciar o recurso pelo caminho com ^XG/^IM.
+    Quando a memória livre da impressora não é suficiente, os recursos usados há mais tempo são removidos.
+
+    Args:
+        printer (ZplCommandSender): Impressora onde os recursos são armazenados.
+        storage (str, optional): Dispositivo de armazenamento, 'R:' para RAM ou 'E:' para flash (default: 'R:').
+        reserved_bytes (int, optional): Memória mínima mantida livre na impressora em bytes (default: 0).
+    """
+
+    printer: ZplCommandSender
+    storage: Literal['R:', 'E:', 'B:', 'A:']
+    reserved_bytes: int
+
+    entries: OrderedDict[str, ZplStoredResource]  # Recursos em ordem de uso, do mais antigo para o mais recente
+    printer_files: dict[str, int]  # Arquivos listados pela impressora no ^HW, caminho -> tamanho
+    free_bytes: int | None  # Memória livre estimada no dispositivo, None se desconhecida
+
+    def __init__(self, printer: ZplCommandSender, storage: Literal['R:', 'E:', 'B:', 'A:'] = 'R:',
+                 reserved_bytes: int = 0):
+        self.printer = printer
+        self.storage = storage
+        self.reserved_bytes = reserved_bytes
+        self.entries = OrderedDict()
+        self.printer_files = {}
+        self.free_bytes = None
+
+    def _resource_path(self, prefix: str, content_hash: str, extension: str) -> str:
+        return f'{self.storage}{prefix}{content_hash[:7].upper()}.{extension}'
+
+    def _touch(self, path: str, content_hash: str, size: int) -> bool:
+        """Marca o recurso como usado, retorna True se já está na impressora."""
+        if path in self.entries:
+            self.entries.move_to_end(path)
+            return True
+        if path in self.printer_files:
+            # O nome é derivado do conteúdo, então o arquivo existente na impressora é o mesmo recurso
+            self.entries[path] = ZplStoredResource(path, content_hash, self.printer_files[path])
+            return True
+        return False
+
+    def _store(self, path: str, content_hash: str, size: int, command: str):
+        self.ensure_free(size)
+        self.printer.send_command(command)
+        self.entries[path] = ZplStoredResource(path, content_hash, size)
+        self.printer_files[path] = size
+        if self.free_bytes is not None:
+            self.free_bytes -= size
+
+    def graphic(self, graphic: ZplGraphic) -> str:
+        """Garante que o gráfico está armazenado na impressora e retorna o seu caminho.
+
+        Note:
+            Comando ZPL: ~DG
+
+        Args:
+            graphic (ZplGraphic): Gráfico a ser armazenado.
+
+        Returns:
+            str: Caminho do gráfico na impressora, usado com ^XG ou ^IM.
+        """
+        content_hash = hashlib.sha1(graphic.bytes_per_row.to_bytes(4, 'big') + graphic.data).hexdigest()
+        path = self._resource_path('G', content_hash, 'GRF')
+        if not self._touch(path, content_hash, graphic.total_bytes):
+            self._store(path, content_hash, graphic.total_bytes, str(graphic.download_command(path)))
+        return path
+
+    def font(self, data: bytes, extension: Literal['T', 'E'] = 'T') -> str:
+        """Garante que a fonte está armazenada na impressora e retorna o seu caminho.
+
+        Note:
+            Comando ZPL: ~DY
+
+        Args:
+            data (bytes): Conteúdo do arquivo da fonte.
+            extension (str, optional): Tipo da fonte, 'T' para TrueType ou 'E' para TrueType Extension.
+
+        Returns:
+            str: Caminho da fonte na impressora, usado com ^A@.
+        """
+        content_hash = hashlib.sha1(data).hexdigest()
+        path = self._resource_path('F', content_hash, 'TTF' if extension == 'T' else 'TTE')
+        if not self._touch(path, content_hash, len(data)):
+            name = path.rsplit('.', 1)[0]
+            command = ZplCommands.DOWNLOAD_OBJECT(name, 'A', extension, len(data), '', data.hex().upper())
+            self._store(path, content_hash, len(data), str(command))
+        return path
+
+    def evict(self, path: str = None) -> ZplStoredResource | None:
+        """Remove um recurso da impressora, por padrão o usado há mais tempo.
+
+        Note:
+            Comando ZPL: ^ID
+
+        Args:
+            path (str, optional): Caminho do recurso a ser removido.
+
+        Returns:
+            ZplStoredResource | None: Recurso removido, None se não há recursos.
+        """
+        if not self.entries:
+            return None
+        resource = self.entries.pop(path) if path is not None else self.entries.popitem(last=False)[1]
+        self.printer.send_command(str(ZplCommands.LABEL_START_BLOCK()) +
+                                  str(ZplCommands.OBJECT_DELETE(resource.path)) +
+                                  str(ZplCommands.LABEL_END_BLOCK()))
+        self.printer_files.pop(resource.path, None)
+        if self.free_bytes is not None:
+            self.free_bytes += resource.size
+        return resource
+
+    def ensure_free(self, size: int) -> None:
+        """Remove os recursos usados há mais tempo até que exista memória livre para o novo recurso.
+
+        Args:
+            size (int): Tamanho do novo recurso em bytes.
+        """
+        if self.free_bytes is None:
+            self.refresh_memory()
+        if self.free_bytes is None:
+            return
+        while self.entries and self.free_bytes - size < self.reserved_bytes:
+            self.evict()
+
+    def refresh_memory(self) -> int | None:
+        """Atualiza a memória livre a partir da resposta do ~HM.
+
+        Returns:
+            int | None: Memória livre em bytes, None se a resposta for inválida.
+        """
+        host_memory = getattr(self.printer, 'host_memory', None)
+        response = host_memory() if host_memory is not None else None
+        values = re.findall(r'\d+', response or '')
+        if len(values) >= 3:
+            self.free_bytes = int(values[2]) * 1024
+        return self.free_bytes
+
+    @staticmethod
+    def parse_directory(listing: str) -> tuple[dict[str, int], dict[str, int]]:
+        """Converte a listagem de diretório do ^HW em arquivos e memória livre por dispositivo.
+
+        Args:
+            listing (str): Resposta do ^HW.
+
+        Returns:
+            dict[str, int]: Arquivos, caminho -> tamanho em bytes.
+            dict[str, int]: Memória livre, dispositivo -> bytes.
+        """
+        files = {path.upper(): int(size)
+                 for path, size in re.findall(r'^\s*\*?\s*([A-Z]:\S+\.\S+)\s+(\d+)', listing, re.MULTILINE)}
+        free = {device + ':': int(size) for size, device in re.findall(r'(\d+)\s+bytes free\s+([A-Z]):', listing)}
+        return files, free
+
+    def reconcile(self) -> None:
+        """Sincroniza o cache com a listagem de diretório da impressora (^HW).
+
+        Recursos que não existem mais na impressora são removidos do cache.
+        """
+        files, free = self.parse_directory(self.printer.host_w() or '')
+        self.printer_files = {path: size for path, size in files.items() if path.startswith(self.storage)}
+        for path in [path for path in self.entries if path not in self.printer_files]:
+            del self.entries[path]
+        if self.storage in free:
+            self.free_bytes = free[self.storage]
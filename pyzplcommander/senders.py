@@ -0,0 +1,211 @@
+from __future__ import annotations
+import gzip
+import itertools
+import os
+import threading
+import time
+
+from pyzplcommander.core import ZplCommandSender
+
+
+_LABEL_END = b'^XZ'
+
+
+class ZplFileSender(ZplCommandSender):
+    """Envia os comandos ZPL para arquivos em uma pasta monitorada por um servidor de impressão (hot folder).
+
+    Cada trabalho é escrito em um arquivo temporário oculto na própria pasta e renomeado atomicamente para o nome
+    final ao ser concluído, assim o servidor de impressão nunca encontra um arquivo pela metade.
+    Os comandos são acumulados em um buffer e escritos em blocos grandes, sem uma chamada de sistema por comando.
+
+    Sem limites, cada trabalho vai para um arquivo concluído com commit() ou ao sair do bloco with.
+    Com max_bytes ou max_labels o arquivo é concluído automaticamente ao atingir o limite, sempre no final de uma
+    etiqueta, e o próximo comando abre um novo arquivo (spool rotativo).
+
+    Note:
+        Impressoras de arquivo não respondem, comandos com get_response retornam None.
+
+    Args:
+        directory (str): Pasta de destino.
+        prefix (str, optional): Prefixo do nome dos arquivos (default: 'job').
+        extension (str, optional): Extensão dos arquivos (default: '.zpl'), com compress é adicionado '.gz'.
+        compress (bool, optional): Compacta os arquivos com gzip (default: False).
+        buffer_size (int, optional): Tamanho do buffer de escrita em bytes (default: 1 MiB).
+        max_bytes (int, optional): Tamanho máximo de cada arquivo, antes da compactação.
+        max_labels (int, optional): Quantidade máxima de etiquetas por arquivo.
+        label_end (bytes, optional): Comando que finaliza uma etiqueta (default: b'^XZ').
+    """
+
+    directory: str
+    prefix: str
+    extension: str
+    compress: bool
+    buffer_size: int
+    max_bytes: int | None
+    max_labels: int | None
+    label_end: bytes
+
+    files: list[str]
+
+    def __init__(self, directory: str, prefix: str = 'job', extension: str = '.zpl', compress: bool = False,
+                 buffer_size: int = 1024 * 1024, max_bytes: int = None, max_labels: int = None,
+                 label_end: bytes = _LABEL_END):
+        self.directory = directory
+        self.prefix = prefix
+        self.extension = extension + ('.gz' if compress else '')
+        self.compress = compress
+        self.buffer_size = buffer_size
+        self.max_bytes = max_bytes
+        self.max_labels = max_labels
+        self.label_end = label_end
+        self.files = []
+
+        self._lock = threading.Lock()
+        self._sequence = itertools.count(1)
+        self._raw = None
+        self._file = None
+        self._temp_name = None
+        self._bytes = 0
+        self._labels = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            self.commit()
+        else:
+            self.discard()
+
+    def _new_file_name(self) -> str:
+        """Retorna o nome de um novo arquivo, único entre processos e ordenável pela criação."""
+        return (f'{self.prefix}-{time.strftime("%Y%m%d%H%M%S")}-{os.getpid()}-{next(self._sequence):06d}'
+                f'{self.extension}')
+
+    def _open(self) -> None:
+        """Abre um novo arquivo temporário para o trabalho."""
+        name = self._new_file_name()
+        self._temp_name = os.path.join(self.directory, '.' + name + '.tmp')
+        self._raw = open(self._temp_name, 'wb', buffering=self.buffer_size)
+        self._file = gzip.GzipFile(filename=name, fileobj=self._raw, mode='wb') if self.compress else self._raw
+        self._bytes = 0
+        self._labels = 0
+
+    def _close(self, keep: bool) -> str | None:
+        """Fecha o arquivo atual, renomeando para o nome final ou removendo o temporário."""
+        if self._file is None:
+            return None
+        if self._file is not self._raw:
+            self._file.close()
+        if keep:
+            self._raw.flush()
+            os.fsync(self._raw.fileno())
+        self._raw.close()
+        temp_name, self._temp_name, self._file, self._raw = self._temp_name, None, None, None
+
+        if not keep:
+            os.remove(temp_name)
+            return None
+        file_name = os.path.join(self.directory, os.path.basename(temp_name)[1:-len('.tmp')])
+        os.replace(temp_name, file_name)
+        self.files.append(file_name)
+        return file_name
+
+    def _append(self, data: bytes) -> None:
+        """Escreve os dados no arquivo atual, contando os bytes e as etiquetas."""
+        self._file.write(data)
+        self._bytes += len(data)
+        if self.max_labels is not None:
+            self._labels += data.count(self.label_end)
+
+    def _cut(self, data: bytes, start: int) -> int | None:
+        """Retorna a posição após a etiqueta que atinge um dos limites, None se os dados não atingem os limites."""
+        end = self.label_end
+        cuts = []
+        if self.max_bytes is not None:
+            position = data.find(end, start + max(0, self.max_bytes - self._bytes - len(end)))
+            if position >= 0:
+                cuts.append(position)
+        if self.max_labels is not None:
+            position = start - len(end)
+            for _ in range(max(1, self.max_labels - self._labels)):
+                position = data.find(end, position + len(end))
+                if position < 0:
+                    break
+            else:
+                cuts.append(position)
+        if not cuts:
+            return None
+
+        # O espaço após o final da etiqueta, ex: quebras de linha, fica no mesmo arquivo
+        cut = min(cuts) + len(end)
+        while cut < len(data) and data[cut] in b' \t\r\n':
+            cut += 1
+        return cut
+
+    def _write(self, data: bytes) -> None:
+        """Escreve os dados no trabalho atual, concluindo o arquivo ao atingir os limites no final de uma etiqueta.
+
+        Os dados com várias etiquetas são divididos nos finais de etiqueta, assim os limites são respeitados
+        mesmo em escritas grandes, ex: um bloco inteiro do ZplBatchRenderer.
+        """
+        if self._file is None:
+            self._open()
+        if self.max_bytes is None and self.max_labels is None:
+            self._append(data)
+            return
+
+        start = 0
+        while True:
+            cut = self._cut(data, start)
+            self._append(data[start:cut] if start or cut is not None else data)
+            if cut is None:
+                return
+            self._close(True)
+            if cut >= len(data):
+                return
+            start = cut
+            self._open()
+
+    def send_command(self, command: str | bytes | any, get_response: bool = False) -> None:
+        """Escreve um comando no arquivo do trabalho atual.
+
+        Args:
+            command (str | bytes | any): Comando ZPL, bytes são escritos sem conversão.
+            get_response (bool): Ignorado, arquivos não respondem.
+        """
+        data = command if isinstance(command, bytes) else str(command).encode('UTF-8')
+        with self._lock:
+            self._write(data)
+        return None
+
+    def send_commands(self, commands: list[str | bytes | any], get_response: bool = False) -> None:
+        """Escreve uma lista de comandos no arquivo do trabalho atual, em uma única escrita.
+
+        Args:
+            commands (list[str | bytes | any]): Lista de comandos ZPL.
+            get_response (bool): Ignorado, arquivos não respondem.
+        """
+        data = b''.join(command if isinstance(command, bytes) else str(command).encode('UTF-8')
+                        for command in commands)
+        with self._lock:
+            self._write(data)
+        return None
+
+    def commit(self) -> str | None:
+        """Conclui o trabalho atual, tornando o arquivo visível na pasta.
+
+        Returns:
+            str | None: Caminho do arquivo concluído, None se nada foi escrito.
+        """
+        with self._lock:
+            return self._close(True)
+
+    def discard(self) -> None:
+        """Descarta o trabalho atual, removendo o arquivo temporário."""
+        with self._lock:
+            self._close(False)
+
+    def close(self) -> None:
+        """Conclui o trabalho atual."""
+        self.commit()
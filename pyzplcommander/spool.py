@@ -0,0 +1,141 @@
+from __future__ import annotations
+from array import array
+from bisect import bisect_right
+import os
+
+
+_LABEL_END = b'^XZ'
+
+
+class ZplSpoolWriter:
+    """Escritor de arquivos de spool ZPL.
+
+    O arquivo de spool é o ZPL bruto (.zpl) acompanhado de um índice (.zpl.idx) com a posição final de cada etiqueta,
+    permitindo retomar o envio a partir do início de uma etiqueta.
+
+    O índice é uma sequência de inteiros sem sinal de 64 bits (little-endian), um por etiqueta.
+
+    Args:
+        file_name (str): Caminho do arquivo de spool.
+        label_end (bytes, optional): Comando que finaliza uma etiqueta (default: b'^XZ').
+    """
+
+    file_name: str
+    label_end: bytes
+    offsets: array
+
+    def __init__(self, file_name: str, label_end: bytes = _LABEL_END):
+        self.file_name = file_name
+        self.label_end = label_end
+        self.offsets = array('Q')
+        self._file = open(file_name, 'wb')
+        self._position = 0
+        self._tail = b''
+
+    @staticmethod
+    def index_file_name(file_name: str) -> str:
+        """Retorna o caminho do índice de um arquivo de spool."""
+        return file_name + '.idx'
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def write(self, data: bytes | str) -> int:
+        """Escreve ZPL no spool, registrando no índice o final de cada etiqueta.
+
+        Args:
+            data (bytes | str): Uma ou mais etiquetas ZPL.
+
+        Returns:
+            int: Quantidade de bytes escritos.
+        """
+        if isinstance(data, str):
+            data = data.encode('UTF-8')
+
+        # Mantém o final do bloco anterior para encontrar um ^XZ dividido entre duas escritas
+        search = self._tail + data
+        base = self._position - len(self._tail)
+        index = search.find(self.label_end)
+        while index >= 0:
+            end = index + len(self.label_end)
+            if end > len(self._tail):
+                self.offsets.append(base + end)
+            index = search.find(self.label_end, end)
+        self._tail = search[-(len(self.label_end) - 1):]
+
+        written = self._file.write(data)
+        self._position += written
+        return written
+
+    def close(self) -> None:
+        """Finaliza o spool, a última etiqueta termina no final do arquivo."""
+        if self._file.closed:
+            return
+        self._file.close()
+        if self.offsets and self.offsets[-1] < self._position:
+            self.offsets[-1] = self._position
+        with open(self.index_file_name(self.file_name), 'wb') as f:
+            self.offsets.tofile(f)
+
+
+class ZplSpoolFile:
+    """Leitor de arquivos de spool ZPL.
+
+    Args:
+        file_name (str): Caminho do arquivo de spool.
+    """
+
+    file_name: str
+    offsets: array  # Posição final de cada etiqueta, vazio se o spool não possui índice
+
+    def __init__(self, file_name: str):
+        self.file_name = file_name
+        self.offsets = array('Q')
+        index_file_name = ZplSpoolWriter.index_file_name(file_name)
+        if os.path.exists(index_file_name):
+            with open(index_file_name, 'rb') as f:
+                self.offsets.frombytes(f.read())
+
+    @property
+    def size(self) -> int:
+        """Retorna o tamanho do spool em bytes."""
+        return os.path.getsize(self.file_name)
+
+    @property
+    def labels(self) -> int:
+        """Retorna a quantidade de etiquetas no índice."""
+        return len(self.offsets)
+
+    def label_offset(self, label: int) -> int:
+        """Retorna a posição inicial de uma etiqueta.
+
+        Args:
+            label (int): Índice da etiqueta, iniciando em 0.
+        """
+        if label <= 0:
+            return 0
+        if label > len(self.offsets):
+            raise IndexError('Label index out of spool range.')
+        return self.offsets[label - 1]
+
+    def label_at(self, offset: int) -> int:
+        """Retorna o índice da etiqueta que contém a posição informada.
+
+        Args:
+            offset (int): Posição em bytes.
+        """
+        return bisect_right(self.offsets, offset)
+
+    def label_boundary(self, offset: int) -> int:
+        """Ajusta uma posição para o início da etiqueta que a contém.
+        Usado para retomar um envio interrompido sem enviar uma etiqueta pela metade.
+
+        Args:
+            offset (int): Posição em bytes, ex: quantidade de bytes já enviados.
+        """
+        if not self.offsets:
+            return 0 if offset < self.size else offset
+        return self.label_offset(self.label_at(offset))
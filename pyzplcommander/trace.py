@@ -0,0 +1,262 @@
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import IO, Iterator
+import gzip
+import struct
+import threading
+import time
+
+from pyzplcommander.core import ZplCommandSender
+
+
+_MAGIC = b'ZPLTRC1\n'
+_GZIP_MAGIC = b'\x1f\x8b'
+_RECORD = struct.Struct('<BdI')  # Tipo, segundos desde o início da gravação, tamanho dos dados
+
+TRACE_SEND = 1  # Comando enviado sem resposta
+TRACE_QUERY = 2  # Comando enviado aguardando resposta
+TRACE_RESPONSE = 3  # Resposta da impressora
+_TRACE_BYTES = 0x80  # Marca no tipo dos comandos enviados como bytes, reproduzidos sem decodificar
+
+
+@dataclass(frozen=True)
+class ZplTraceRecord:
+    """Registro de um trace.
+
+    Args:
+        kind (int): TRACE_SEND, TRACE_QUERY ou TRACE_RESPONSE.
+        timestamp (float): Segundos desde o início da gravação.
+        data (bytes): Comando ou resposta em UTF-8, ou o comando original quando enviado como bytes.
+        binary (bool, optional): O comando foi enviado como bytes e é reproduzido como bytes (default: False).
+    """
+
+    kind: int
+    timestamp: float
+    data: bytes
+    binary: bool = False
+
+
+@dataclass(frozen=True)
+class ZplReplayResult:
+    """Resultado da reprodução de um trace.
+
+    Args:
+        commands (int): Quantidade de comandos enviados.
+        queries (int): Quantidade de comandos com resposta.
+        sent_bytes (int): Bytes enviados.
+        elapsed (float): Duração da reprodução em segundos.
+        recorded (float): Duração da gravação original em segundos.
+        latencies (tuple[float, ...]): Tempo de resposta de cada comando com resposta, em segundos.
+        responses (tuple[str | None, ...]): Respostas recebidas, na ordem dos comandos com resposta.
+    """
+
+    commands: int
+    queries: int
+    sent_bytes: int
+    elapsed: float
+    recorded: float
+    latencies: tuple[float, ...]
+    responses: tuple[str | None, ...]
+
+
+def _open_trace(trace: str | IO, mode: str) -> tuple[IO, bool]:
+    """Abre o trace, retornando o arquivo binário e se ele deve ser fechado ao final."""
+    if not isinstance(trace, str):
+        return trace, False
+    if mode == 'rb':
+        file = open(trace, 'rb')
+        if file.read(2) == _GZIP_MAGIC:
+            file.seek(0)
+            return gzip.GzipFile(fileobj=file, mode='rb'), True
+        file.seek(0)
+        return file, True
+    if trace.endswith('.gz'):
+        return gzip.open(trace, 'wb'), True
+    return open(trace, 'wb'), True
+
+
+def read_trace(trace: str | IO) -> Iterator[ZplTraceRecord]:
+    """Lê os registros de um trace gravado com ZplTraceRecorder.
+
+    Args:
+        trace (str | IO): Caminho do arquivo, compactado com gzip ou não, ou arquivo binário aberto.
+
+    Yields:
+        ZplTraceRecord: Registros na ordem da gravação.
+    """
+    file, owned = _open_trace(trace, 'rb')
+    try:
+        if file.read(len(_MAGIC)) != _MAGIC:
+            raise ValueError('Not a ZPL trace file.')
+        read = file.read
+        unpack = _RECORD.unpack
+        size = _RECORD.size
+        while True:
+            header = read(size)
+            if not header:
+                return
+            if len(header) != size:
+                raise ValueError('Truncated ZPL trace file.')
+            kind, timestamp, length = unpack(header)
+            data = read(length)
+            if len(data) != length:
+                raise ValueError('Truncated ZPL trace file.')
+            yield ZplTraceRecord(kind & ~_TRACE_BYTES, timestamp, data, bool(kind & _TRACE_BYTES))
+    finally:
+        if owned:
+            file.close()
+
+
+class ZplTraceRecorder(ZplCommandSender):
+    """Grava em um trace binário os comandos enviados e as respostas recebidas por outro ZplCommandSender.
+
+    Cada registro tem o tipo, o momento desde o início da gravação e os dados em UTF-8, com 13 bytes de
+    cabeçalho por registro. Comandos em bytes são gravados sem conversão e reproduzidos como bytes.
+    O trace pode ser reproduzido com ZplTraceReplayer para reproduzir falhas ou medir o desempenho com o tráfego real.
+
+    Args:
+        sender (ZplCommandSender): Impressora ou sender que recebe os comandos.
+        trace (str | IO): Caminho do arquivo, compactado com gzip se terminar em '.gz', ou arquivo binário aberto.
+    """
+
+    sender: ZplCommandSender
+
+    def __init__(self, sender: ZplCommandSender, trace: str | IO):
+        self.sender = sender
+        self._file, self._owned = _open_trace(trace, 'wb')
+        self._lock = threading.Lock()
+        self._start = time.perf_counter()
+        self._file.write(_MAGIC)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def _record(self, kind: int, timestamp: float, data: str | bytes | any) -> None:
+        """Escreve um registro no trace, marcando os comandos enviados como bytes."""
+        if data.__class__ is bytes:
+            kind |= _TRACE_BYTES
+        else:
+            data = str(data).encode('UTF-8')
+        with self._lock:
+            self._file.write(_RECORD.pack(kind, timestamp, len(data)))
+            self._file.write(data)
+
+    def send_command(self, command: str | any, get_response: bool = False) -> None | str:
+        """Grava e envia um comando ZPL.
+
+        Args:
+            command (str | any): Comando ZPL.
+            get_response (bool, optional): Obter resposta do comando.
+
+        Returns:
+            None | str: Resposta do sender, se get_response=True.
+        """
+        self._record(TRACE_QUERY if get_response else TRACE_SEND, time.perf_counter() - self._start,
+                     bytes(command) if isinstance(command, bytes) else command)
+        response = self.sender.send_command(command, get_response)
+        if get_response:
+            self._record(TRACE_RESPONSE, time.perf_counter() - self._start, '' if response is None else response)
+        return response
+
+    def send_commands(self, commands: list[str | any], get_response: bool = False) -> None | list[str]:
+        """Grava e envia uma lista de comandos ZPL, mantendo o envio em lote do sender.
+
+        Args:
+            commands (list[str | any]): Lista de comandos ZPL.
+            get_response (bool, optional): Obter resposta dos comandos.
+
+        Returns:
+            None | list[str]: Respostas do sender, se get_response=True.
+        """
+        if get_response:
+            return [self.send_command(command, True) for command in commands]
+
+        timestamp = time.perf_counter() - self._start
+        for command in commands:
+            self._record(TRACE_SEND, timestamp, bytes(command) if isinstance(command, bytes) else command)
+        return self.sender.send_commands(commands, False)
+
+    def flush(self) -> None:
+        """Grava no disco os registros em buffer."""
+        with self._lock:
+            self._file.flush()
+
+    def close(self) -> None:
+        """Finaliza o trace, o sender não é fechado."""
+        with self._lock:
+            if self._owned:
+                self._file.close()
+            else:
+                self._file.flush()
+
+
+class ZplTraceReplayer:
+    """Reproduz um trace gravado com ZplTraceRecorder em uma impressora ou emulador.
+
+    Os comandos são enviados na ordem da gravação, respeitando os intervalos originais divididos por speed.
+    Com speed=None os comandos são enviados na velocidade máxima, e os comandos consecutivos sem resposta
+    são agrupados em um único send_commands. As respostas gravadas não são enviadas, os comandos com resposta
+    são reenviados com get_response=True e o tempo de resposta é medido.
+
+    Args:
+        trace (str | IO): Caminho do arquivo ou arquivo binário aberto.
+        speed (float | None, optional): Fator de velocidade, 1 no tempo original, 2 duas vezes mais rápido,
+                                        None na velocidade máxima (default: 1).
+    """
+
+    records: list[ZplTraceRecord]
+    speed: float | None
+
+    def __init__(self, trace: str | IO, speed: float | None = 1):
+        if speed is not None and speed <= 0:
+            raise ValueError('speed must be positive or None.')
+        self.records = [record for record in read_trace(trace) if record.kind != TRACE_RESPONSE]
+        self.speed = speed
+
+    def replay(self, printer: ZplCommandSender) -> ZplReplayResult:
+        """Envia os comandos do trace para a impressora.
+
+        Args:
+            printer (ZplCommandSender): Impressora ou emulador de destino.
+
+        Returns:
+            ZplReplayResult: Contagens e tempos da reprodução.
+        """
+        commands = queries = sent_bytes = 0
+        latencies, responses, pending = [], [], []
+        start = time.perf_counter()
+
+        def send_pending() -> None:
+            if pending:
+                printer.send_commands(pending, False)
+                pending.clear()
+
+        for record in self.records:
+            if self.speed is not None:
+                delay = record.timestamp / self.speed - (time.perf_counter() - start)
+                if delay > 0:
+                    time.sleep(delay)
+
+            command = record.data if record.binary else record.data.decode('UTF-8')
+            commands += 1
+            sent_bytes += len(record.data)
+            if record.kind == TRACE_SEND:
+                if self.speed is None:
+                    pending.append(command)
+                else:
+                    printer.send_command(command, False)
+                continue
+
+            send_pending()
+            queries += 1
+            query_start = time.perf_counter()
+            responses.append(printer.send_command(command, True))
+            latencies.append(time.perf_counter() - query_start)
+
+        send_pending()
+        return ZplReplayResult(commands, queries, sent_bytes, time.perf_counter() - start,
+                               self.records[-1].timestamp if self.records else 0.0, tuple(latencies),
+                               tuple(responses))
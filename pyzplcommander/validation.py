@@ -0,0 +1,274 @@
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import Callable, Iterable
+import string
+
+from pyzplcommander.core import ZplCommand, ZplCommandParams, ZplCommandsBlock, ZplDump
+from pyzplcommander.commands import ZplCommands
+from pyzplcommander.enums import (ZplOrientation, ZplPrintOrientation, ZplJustification, ZplDirection, ZplCharSets,
+                                  DiagonalOrientation)
+
+
+def _values(enum) -> frozenset[str]:
+    return frozenset(str(item.value) for item in enum)
+
+
+_YES_NO = frozenset(('Y', 'N'))
+
+# Regras pelo nome do parâmetro: conjunto de valores aceitos ou intervalo numérico (mínimo, máximo)
+_PARAM_RULES: dict[str, frozenset[str] | tuple[int, int]] = {
+    'orientation': _values(ZplOrientation),
+    'justification': frozenset(('0', '1', '2')),
+    'text_justification': _values(ZplJustification),
+    'direction': _values(ZplDirection),
+    'encoding': _values(ZplCharSets),
+    'diagonal_orientation': _values(DiagonalOrientation),
+    'line_color': frozenset(('B', 'W')),
+    'interpretation_line': _YES_NO,
+    'interpretation_line_above': _YES_NO,
+    'print_check_digit': _YES_NO,
+    'leading_zeros': _YES_NO,
+    'override_pause': _YES_NO,
+    'cut_on_error': _YES_NO,
+    'x': (0, 32000),
+    'y': (0, 32000),
+    'width': (0, 32000),
+    'height': (0, 32000),
+    'length': (1, 32000),
+    'width_line': (0, 32000),
+    'max_lines': (1, 9999),
+    'space_between_lines': (-9999, 9999),
+    'indent_seconds_line': (0, 9999),
+    'additional_inter_chars': (0, 9999),
+    'border_thickness': (1, 32000),
+    'rounding': (0, 8),
+    'diameter': (3, 4095),
+    'darkness': (0, 30),
+    'quantity': (1, 99999999),
+    'pause': (0, 99999999),
+    'replicates': (0, 99999999),
+    'number': (0, 9999),
+    'magnification_x': (1, 10),
+    'magnification_y': (1, 10),
+}
+
+# Regras específicas de um comando, substituem as regras pelo nome do parâmetro
+_COMMAND_RULES: dict[str, dict[str, frozenset[str] | tuple[int, int] | None]] = {
+    '^A': {'font': frozenset(string.ascii_uppercase + string.digits), 'height': (10, 32000), 'width': (10, 32000)},
+    '^CF': {'font': frozenset(string.ascii_uppercase + string.digits)},
+    '^PO': {'orientation': _values(ZplPrintOrientation)},
+    '^GC': {'border_thickness': (1, 4095)},
+}
+
+# Comandos com a descrição dos parâmetros diferente do manual, validados somente pela quantidade de parâmetros
+_UNCHECKED_RULES = frozenset(('^BY',))
+
+
+class ZplValidationError(ValueError):
+    """Erro de validação de comandos ZPL, contendo todos os problemas encontrados.
+
+    Args:
+        issues (list[ZplValidationIssue]): Problemas encontrados.
+    """
+
+    def __init__(self, issues: list[ZplValidationIssue]):
+        self.issues = issues
+        first = issues[0]
+        super().__init__(f'{len(issues)} invalid command(s), first in label {first.label}: '
+                         f'{first.command} {first.message}')
+
+
+@dataclass(frozen=True)
+class ZplValidationIssue:
+    """Problema encontrado em um comando.
+
+    Args:
+        label (int): Índice da etiqueta no lote.
+        command (str): Comando ZPL, ex: '^FO'.
+        params (tuple): Parâmetros do comando.
+        message (str): Descrição do problema.
+    """
+
+    label: int
+    command: str
+    params: tuple
+    message: str
+
+
+def compile_command_validator(command: ZplCommand) -> Callable[[tuple], str | None]:
+    """Compila o validador dos parâmetros de um comando a partir das informações do ZplCommand.
+
+    São verificados a quantidade de parâmetros (no máximo a quantidade descrita e os obrigatórios preenchidos),
+    os valores aceitos das enumerações e os intervalos numéricos conhecidos pelo nome do parâmetro.
+
+    Args:
+        command (ZplCommand): Comando ZPL.
+
+    Returns:
+        Callable[[tuple], str | None]: Função que recebe os parâmetros e retorna a descrição do problema, ou None.
+    """
+    names = tuple(command.params_description or ())
+    max_params = len(names)
+    required = command.params_required or 0
+    command_rules = _COMMAND_RULES.get(command.command, {})
+
+    checks = []
+    if command.command not in _UNCHECKED_RULES:
+        for index, name in enumerate(names):
+            rule = command_rules[name] if name in command_rules else _PARAM_RULES.get(name)
+            if isinstance(rule, frozenset):
+                checks.append((index, name, rule, 0, 0))
+            elif rule is not None:
+                checks.append((index, name, None, rule[0], rule[1]))
+    checks = tuple(checks)
+
+    def validate(params: tuple) -> str | None:
+        count = len(params)
+        while count and params[count - 1] is None:
+            count -= 1
+        if count > max_params:
+            return f'accepts {max_params} parameter(s), got {count}'
+        for index in range(required):
+            if index >= count or params[index] is None:
+                return f'missing required parameter {names[index]!r}'
+        for index, name, allowed, minimum, maximum in checks:
+            if index >= count:
+                break
+            value = params[index]
+            if value is None or value == '':
+                continue
+            if allowed is not None:
+                if str(value) not in allowed:
+                    return f'invalid {name} {value!r}, expected one of {sorted(allowed)}'
+                continue
+            try:
+                number = int(value)
+            except ValueError:
+                return f'invalid {name} {value!r}, expected an integer'
+            if not minimum <= number <= maximum:
+                return f'{name} {value!r} out of range {minimum}-{maximum}'
+        return None
+
+    return validate
+
+
+class ZplValidator:
+    """Validador de comandos ZPL antes do envio.
+
+    Os validadores são compilados uma vez por comando da ZplCommands e os resultados são memorizados pelos
+    parâmetros, então lotes de etiquetas com os mesmos valores custam uma consulta de dicionário por comando.
+    Blocos e comandos compartilhados entre etiquetas (ex: ZplLabel.clone()) são verificados uma vez por lote.
+
+    Note:
+        São validados os comandos ZplCommandParams das árvores de blocos, textos ZPL avulsos não são verificados.
+
+    Args:
+        commands (Iterable[ZplCommand], optional): Comandos conhecidos (default: ZplCommands).
+    """
+
+    validators: dict[str, Callable[[tuple], str | None]]
+
+    _MAX_MEMO = 1 << 18
+
+    def __init__(self, commands: Iterable[ZplCommand | ZplCommands] = ZplCommands):
+        self.validators = {}
+        for command in commands:
+            command = command.value if isinstance(command, ZplCommands) else command
+            self.validators.setdefault(command.command, compile_command_validator(command))
+        self._memo: dict[tuple, str | None] = {}
+        self._kinds: dict[type, int] = {}
+
+    def check_command(self, command: ZplCommandParams) -> str | None:
+        """Valida um comando.
+
+        Args:
+            command (ZplCommandParams): Comando com parâmetros.
+
+        Returns:
+            str | None: Descrição do problema, None se válido ou desconhecido.
+        """
+        name = command.command.command if isinstance(command.command, ZplCommand) else str(command.command)
+        key = (name, tuple(command.params or ()))
+        try:
+            return self._memo[key]
+        except KeyError:
+            pass
+        except TypeError:  # Parâmetro não hashable, valida sem memorizar
+            validator = self.validators.get(name)
+            return validator(key[1]) if validator is not None else None
+
+        validator = self.validators.get(name)
+        result = validator(key[1]) if validator is not None else None
+        if len(self._memo) >= self._MAX_MEMO:
+            self._memo.clear()
+        self._memo[key] = result
+        return result
+
+    def _kind(self, item_type: type) -> int:
+        """Retorna o tipo do item da árvore: 1 comando, 2 bloco, 0 outros, memorizado pela classe."""
+        kind = self._kinds.get(item_type)
+        if kind is None:
+            kind = 1 if issubclass(item_type, ZplCommandParams) else 2 if issubclass(item_type, ZplCommandsBlock) else 0
+            self._kinds[item_type] = kind
+        return kind
+
+    def _collect(self, block: ZplCommandsBlock, shared: dict[int, tuple]) -> list[tuple[str, tuple, str]]:
+        """Retorna os problemas dos comandos de um bloco, memorizando os blocos compartilhados entre clones."""
+        found = []
+        memo = self._memo
+        kinds = self._kinds
+        for commands in block.commands.values():
+            for command in commands:
+                kind = kinds.get(type(command))
+                if kind is None:
+                    kind = self._kind(type(command))
+                if kind == 1:
+                    name = command.command
+                    key = (name.command if type(name) is ZplCommand else str(name), tuple(command.params or ()))
+                    try:
+                        message = memo[key]
+                    except (KeyError, TypeError):
+                        message = self.check_command(command)
+                    if message is not None:
+                        found.append((key[0], key[1], message))
+                elif kind == 2:
+                    if not command._shared:
+                        found.extend(self._collect(command, shared))
+                        continue
+                    entry = shared.get(id(command))
+                    if entry is None:
+                        # Mantém a referência ao bloco para o id não ser reutilizado durante o lote
+                        entry = shared[id(command)] = (command, self._collect(command, shared))
+                    found.extend(entry[1])
+        return found
+
+    def check(self, labels: Iterable[ZplDump]) -> list[ZplValidationIssue]:
+        """Valida um lote de etiquetas.
+
+        Args:
+            labels (Iterable[ZplDump]): Etiquetas ou blocos de comandos.
+
+        Returns:
+            list[ZplValidationIssue]: Problemas encontrados, vazia se todas forem válidas.
+        """
+        issues = []
+        shared = {}
+        root = ZplCommandsBlock()
+        for label_index, label in enumerate(labels):
+            root.commands = {'0': [label]}
+            for name, params, message in self._collect(root, shared):
+                issues.append(ZplValidationIssue(label_index, name, params, message))
+        return issues
+
+    def validate(self, labels: Iterable[ZplDump]) -> None:
+        """Valida um lote de etiquetas, gerando erro se algum comando for inválido.
+
+        Args:
+            labels (Iterable[ZplDump]): Etiquetas ou blocos de comandos.
+
+        Raises:
+            ZplValidationError: Com todos os problemas encontrados.
+        """
+        issues = self.check(labels)
+        if issues:
+            raise ZplValidationError(issues)
@@ -0,0 +1,72 @@
+import pytest
+
+from pyzplcommander import ZebraNetworkPrinter, ZplLabel, ZplSerial, ZplStoredFormat
+from pyzplcommander.batch import ZplBatchRenderer, apply_label_quantity, fold_serial_runs
+
+
+def test_padded_run_followed_by_int_starts_new_run():
+    assert list(fold_serial_runs([{'sn': '007'}, {'sn': 8}], 'sn')) == [({'sn': '007'}, 1), ({'sn': 8}, 1)]
+
+
+def test_int_run_followed_by_text_starts_new_run():
+    folded = list(fold_serial_runs([{'sn': 1}, {'sn': 2}, {'sn': '3'}], 'sn'))
+    assert folded == [({'sn': ZplSerial(1, 1, False)}, 2), ({'sn': '3'}, 1)]
+
+
+def test_padded_run_is_folded():
+    folded = list(fold_serial_runs([{'sn': '007'}, {'sn': '008'}, {'sn': '009'}], 'sn'))
+    assert folded == [({'sn': ZplSerial('007', 1, True)}, 3)]
+
+
+def _serial_label(record):
+    label = ZplLabel(None)
+    label.draw_text(ZplSerial(record['sn']), 10, 10)
+    return label
+
+
+def _plain_label(record):
+    label = ZplLabel(None)
+    label.draw_text(record['text'], 10, 10)
+    return label
+
+
+def test_collapse_duplicates_keeps_serialized_labels_apart():
+    renderer = ZplBatchRenderer(_serial_label, workers=1, collapse_duplicates=True)
+    zpl = b''.join(renderer.render([{'sn': 5}, {'sn': 5}])).decode()
+    assert zpl.count('^XA') == 2
+    assert '^PQ' not in zpl
+    assert renderer.formats_saved == 0
+
+
+def test_collapse_duplicates_merges_plain_labels():
+    renderer = ZplBatchRenderer(_plain_label, workers=1, chunk_size=1, collapse_duplicates=True)
+    zpl = b''.join(renderer.render([{'text': 'a'}, {'text': 'a'}, {'text': 'a'}])).decode()
+    assert zpl.count('^XA') == 1
+    assert '^PQ3' in zpl
+    assert renderer.formats_saved == 2
+
+
+def test_label_quantity_keeps_copies_of_each_serial_as_replicates():
+    zpl = '^XA^FO10,10^FD^SN5,1,N^FS^PQ2,0,2^XZ'
+    assert apply_label_quantity(zpl, 3) == '^XA^FO10,10^FD^SN5,1,N^FS^PQ6,0,2^XZ'
+
+
+def test_label_quantity_refuses_serial_label_printing_several_values():
+    with pytest.raises(ValueError):
+        apply_label_quantity('^XA^FD^SN5^FS^PQ2^XZ', 3)
+
+
+def test_label_quantity_multiplies_plain_label():
+    assert apply_label_quantity('^XA^FDa^FS^PQ2,1^XZ', 3) == '^XA^FDa^FS^PQ6,1^XZ'
+    assert apply_label_quantity('^XA^FDa^FS^XZ', 3) == '^XA^FDa^FS^PQ3^XZ'
+
+
+def test_stored_format_with_printer_renders_in_worker_processes():
+    template = ZplLabel(ZebraNetworkPrinter('127.0.0.1'))
+    template.new_field(10, 10).variable(1)
+    stored = ZplStoredFormat(template)
+    renderer = ZplBatchRenderer(stored, workers=2, chunk_size=1)
+    zpl = b''.join(renderer.render([['a'], ['b']])).decode()
+    assert zpl.count('^XF' + stored.path) == 2
+    assert '^FDa^FS' in zpl and '^FDb^FS' in zpl
+    assert template.printer is not None
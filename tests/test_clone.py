@@ -0,0 +1,92 @@
+import gc
+import pickle
+
+from pyzplcommander import ZplCommands, ZplCommandsBlock, ZplLabel
+
+
+def _label() -> ZplLabel:
+    label = ZplLabel(None)
+    label.font('0', 30, 30)
+    label.new_field(10, 20).data('one')
+    label.new_field(10, 60).data('two')
+    group = ZplCommandsBlock(start_block='^FXgroup')
+    group.new_command(ZplCommands.FIELD_ORIGIN, 1).set_param(0, 5)
+    label.add_command(group)
+    return label
+
+
+def _edit_everything(label: ZplLabel) -> None:
+    for command in label.get_commands():
+        if isinstance(command, ZplCommandsBlock):
+            command.add_command('^FXedited')
+            for child in command.get_commands():
+                if hasattr(child, 'set_param'):
+                    child.set_param(0, 999)
+        else:
+            command.append_param('X')
+
+
+def test_editing_clone_never_changes_original():
+    original = _label()
+    expected = original.dump_zpl()
+    clone = original.clone()
+    _edit_everything(clone)
+    clone.add_command('^FXclone')
+    assert original.dump_zpl() == expected
+    assert clone.dump_zpl() != expected
+
+
+def test_editing_original_never_changes_clone():
+    original = _label()
+    field = original.new_field(1, 1)
+    field.data('before')
+    expected = original.dump_zpl()
+    clone = original.clone()
+
+    field.data('after')  # Referência obtida antes do clone
+    _edit_everything(original)
+    assert clone.dump_zpl() == expected
+
+
+def test_clones_of_clones_are_independent():
+    original = _label()
+    expected = original.dump_zpl()
+    first = original.clone()
+    second = first.clone()
+    _edit_everything(second)
+    assert first.dump_zpl() == expected
+    assert original.dump_zpl() == expected
+    _edit_everything(first)
+    assert original.dump_zpl() == expected
+
+
+def test_shared_flag_is_cleared():
+    original = _label()
+    clone = original.clone()
+    children = original.get_commands()
+    clone.get_commands()
+    assert not any(getattr(command, '_shared', False) for command in children)
+
+    other = original.clone()
+    assert any(command._shared for command in children if hasattr(command, '_shared'))
+    del other
+    gc.collect()
+    assert not any(getattr(command, '_shared', False) for command in children)
+
+
+def test_edit_command_returns_exclusive_command():
+    original = _label()
+    expected = original.dump_zpl()
+    clone = original.clone()
+    field = original.get_commands()[1]
+    clone.edit_command(field).data('three')
+    assert original.dump_zpl() == expected
+
+
+def test_cloned_label_can_be_pickled():
+    original = _label()
+    clone = original.clone()
+    restored = pickle.loads(pickle.dumps(original))
+    assert restored.dump_zpl() == original.dump_zpl()
+    _edit_everything(restored)
+    assert pickle.loads(pickle.dumps(clone)).dump_zpl() == clone.dump_zpl() == original.dump_zpl()
@@ -0,0 +1,28 @@
+import math
+
+import pytest
+
+from pyzplcommander import ZplColumnRenderer, ZplLabel, ZplStoredFormat
+
+
+def _renderer() -> ZplColumnRenderer:
+    template = ZplLabel(None)
+    template.new_field(10, 10).variable(1)
+    template.new_field(10, 50).variable(2)
+    return ZplColumnRenderer(ZplStoredFormat(template, name='T'), {1: 'name', 2: 'price'})
+
+
+def test_ragged_columns_raise():
+    with pytest.raises(ValueError, match='different lengths'):
+        list(_renderer().render({'name': ['a', 'b', 'c'], 'price': [1, 2]}))
+
+
+def test_nan_values_skip_the_field():
+    zpl = ''.join(_renderer().render({'name': ['a', 'b'], 'price': [15, math.nan]}))
+    assert zpl == '^XA^XFR:T.ZPL^FS^FN1^FDa^FS^FN2^FD15^FS^XZ^XA^XFR:T.ZPL^FS^FN1^FDb^FS^XZ'
+
+
+def test_numpy_nan_values_skip_the_field():
+    np = pytest.importorskip('numpy')
+    zpl = ''.join(_renderer().render({'name': np.array(['a', 'b']), 'price': np.array([np.nan, 2], dtype=object)}))
+    assert zpl == '^XA^XFR:T.ZPL^FS^FN1^FDa^FS^XZ^XA^XFR:T.ZPL^FS^FN1^FDb^FS^FN2^FD2^FS^XZ'
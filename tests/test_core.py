@@ -0,0 +1,32 @@
+import pytest
+
+from pyzplcommander import ZplCommands, ZplCommandParams
+
+
+def test_params_are_read_only():
+    command = ZplCommands.FIELD_ORIGIN(10, 20)
+    with pytest.raises(TypeError):
+        command.params[0] = '30'
+    with pytest.raises(AttributeError):
+        command.params.append('0')
+
+
+def test_param_changes_refresh_dump():
+    command = ZplCommands.FIELD_ORIGIN(10, 20)
+    assert command.dump_zpl() == '^FO10,20'
+    command.set_param(0, 30)
+    assert command.dump_zpl() == '^FO30,20'
+    command.append_param(1)
+    assert command.dump_zpl() == '^FO30,20,1'
+    command.params = [1, None, 3]
+    assert command.params == ('1', None, '3')
+    assert command.dump_zpl() == '^FO1,,3'
+    command.params = None
+    assert command.dump_zpl() == '^FO'
+
+
+def test_set_param_pads_with_none():
+    command = ZplCommandParams('^XX')
+    command.set_param(2, 'a')
+    assert command.params == (None, None, 'a')
+    assert command.dump_zpl() == '^XX,,a'
@@ -0,0 +1,36 @@
+import json
+import os
+import subprocess
+import sys
+
+IMPORT_BUDGET_MS = 20  # Orçamento do 'import pyzplcommander' a frio, medido em ~1 ms
+
+_PROBE = '''
+import json, sys, time
+start = time.perf_counter()
+import pyzplcommander
+elapsed = (time.perf_counter() - start) * 1000
+loaded = [name for name in ('numpy', 'sqlite3', 'socket', 'pyzplcommander.printers', 'pyzplcommander.commands')
+          if name in sys.modules]
+print(json.dumps({'elapsed': elapsed, 'loaded': loaded}))
+'''
+
+
+def _probe() -> dict:
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ, PYTHONPATH=root + os.pathsep + os.environ.get('PYTHONPATH', ''))
+    output = subprocess.run([sys.executable, '-c', _PROBE], env=env, check=True, capture_output=True, text=True)
+    return json.loads(output.stdout)
+
+
+def test_import_is_lazy_and_within_budget():
+    results = [_probe() for _ in range(3)]
+    assert all(result['loaded'] == [] for result in results), results
+    assert min(result['elapsed'] for result in results) < IMPORT_BUDGET_MS, results
+
+
+def test_star_import_resolves_every_name():
+    namespace = {}
+    exec('from pyzplcommander import *', namespace)
+    import pyzplcommander
+    assert set(pyzplcommander.__all__) <= set(namespace)
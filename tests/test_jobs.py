@@ -0,0 +1,35 @@
+from pyzplcommander.jobs import ZplPrintQueue
+
+
+class _Printer:
+    def __init__(self, **status):
+        self.sent = []
+        self.status = {'number_of_formats_recv_buf': 0, 'labels_remaining': 0, 'pause': 'Resume',
+                       'paper_out': 'In', 'ribbon_out': 'In', 'head_up': 'Down', 'partial_format': 'Full', **status}
+
+    def send_command(self, command, get_response=False):
+        self.sent.append(command)
+
+    def host_status_dict(self):
+        return self.status
+
+
+def test_confirm_keeps_labels_still_in_the_buffer(tmp_path):
+    printer = _Printer(number_of_formats_recv_buf=1)
+    queue = ZplPrintQueue(printer, str(tmp_path / 'journal.db'))
+    queue.enqueue(['^XA^FD1^FS^XZ', '^XA^FD2^FS^XZ', '^XA^FD3^FS^XZ'])
+    queue.process(confirm_every=0)
+    assert queue.confirm() == 2
+    assert queue.counts() == {'pending': 0, 'sent': 1, 'confirmed': 2}
+    queue.close()
+
+
+def test_confirm_nothing_while_the_printer_is_paused(tmp_path):
+    printer = _Printer(pause='Pause')
+    queue = ZplPrintQueue(printer, str(tmp_path / 'journal.db'))
+    queue.enqueue(['^XA^FD1^FS^XZ'])
+    queue.process(confirm_every=0)
+    assert queue.confirm() == 0
+    printer.status['pause'] = 'Resume'
+    assert queue.confirm() == 1
+    queue.close()
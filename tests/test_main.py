@@ -0,0 +1,22 @@
+import socket
+
+from pyzplcommander.__main__ import _LoopbackPrinter, main
+
+
+def _closed_port() -> int:
+    server = socket.socket()
+    server.bind(('127.0.0.1', 0))
+    port = server.getsockname()[1]
+    server.close()
+    return port
+
+
+def test_query_fails_when_a_printer_is_offline(capsys):
+    assert main(['--timeout', '1', 'query', '-p', f'127.0.0.1:{_closed_port()}']) == 1
+    assert 'offline' in capsys.readouterr().out
+
+
+def test_query_fails_when_a_printer_reports_an_error(capsys):
+    emulator = _LoopbackPrinter()  # O ~HS do emulador informa ribbon_out
+    assert main(['--timeout', '1', 'query', '-p', f'127.0.0.1:{emulator.port}']) == 1
+    assert 'error (ribbon_out)' in capsys.readouterr().out
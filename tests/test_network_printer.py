@@ -0,0 +1,121 @@
+import socket
+import threading
+import time
+
+import pytest
+
+from pyzplcommander import ZebraNetworkPrinter
+
+
+def _closed_port() -> int:
+    server = socket.socket()
+    server.bind(('127.0.0.1', 0))
+    port = server.getsockname()[1]
+    server.close()
+    return port
+
+
+def _wait(condition) -> None:
+    deadline = time.monotonic() + 2
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+def test_timer_connect_error_is_raised_on_next_write_and_data_stays_pending():
+    printer = ZebraNetworkPrinter('127.0.0.1', _closed_port(), timeout=1, write_buffer_size=1 << 20,
+                                  flush_interval=0.01)
+    printer.send_command('^XA^FDone^FS^XZ')
+    _wait(lambda: printer._flush_error is not None)
+
+    with pytest.raises(OSError):
+        printer.send_command('^XA^FDtwo^FS^XZ')
+    assert [write[0] for write in printer._pending_writes] == [b'^XA^FDone^FS^XZ']
+    assert printer.unsent_writes == []
+
+
+def test_timer_send_error_is_raised_on_next_write_and_batch_kept(monkeypatch):
+    server = socket.socket()
+    server.bind(('127.0.0.1', 0))
+    server.listen(1)
+    printer = ZebraNetworkPrinter('127.0.0.1', server.getsockname()[1], timeout=1, write_buffer_size=1 << 20,
+                                  flush_interval=0.01)
+
+    def broken_send(buffers):
+        raise ConnectionResetError('reset by peer')
+
+    monkeypatch.setattr(printer, '_send_buffers', broken_send)
+    printer.send_command('^XA^FDone^FS^XZ')
+    printer.send_command('^XA^FDtwo^FS^XZ')
+    _wait(lambda: printer.unsent_writes)
+
+    with pytest.raises(ConnectionResetError):
+        printer.send_command('^XA^FDthree^FS^XZ')
+    assert printer.unsent_bytes == len(b'^XA^FDone^FS^XZ^XA^FDtwo^FS^XZ')
+    assert printer.take_unsent() == [b'^XA^FDone^FS^XZ', b'^XA^FDtwo^FS^XZ']
+    assert printer.unsent_writes == []
+    server.close()
+
+
+def test_unsent_writes_can_be_resent():
+    server = socket.socket()
+    server.bind(('127.0.0.1', 0))
+    server.listen(1)
+    received = []
+
+    def serve():
+        connection, _ = server.accept()
+        with connection:
+            while data := connection.recv(65536):
+                received.append(data)
+
+    thread = threading.Thread(target=serve, daemon=True)
+    thread.start()
+    printer = ZebraNetworkPrinter('127.0.0.1', server.getsockname()[1], timeout=1)
+    printer.unsent_writes = [b'^XA', b'^XZ']
+    printer.send_commands([data.decode() for data in printer.take_unsent()])
+    thread.join(2)
+    server.close()
+    assert b''.join(received) == b'^XA^XZ'
+
+
+def test_sync_connect_error_is_not_resent_on_retry():
+    printer = ZebraNetworkPrinter('127.0.0.1', _closed_port(), timeout=1)
+    with pytest.raises(OSError):
+        printer.send_command('^XA^FDone^FS^XZ')
+    assert printer._pending_writes == []
+    assert printer._pending_bytes == 0
+
+    server = socket.socket()
+    server.bind(('127.0.0.1', 0))
+    server.listen(1)
+    received = []
+
+    def serve():
+        connection, _ = server.accept()
+        with connection:
+            while data := connection.recv(65536):
+                received.append(data)
+
+    thread = threading.Thread(target=serve, daemon=True)
+    thread.start()
+    printer.port = server.getsockname()[1]
+    printer.send_command('^XA^FDone^FS^XZ')
+    thread.join(2)
+    server.close()
+    assert b''.join(received) == b'^XA^FDone^FS^XZ'
+
+
+def test_sync_send_error_is_raised_and_not_kept_in_unsent_writes(monkeypatch):
+    server = socket.socket()
+    server.bind(('127.0.0.1', 0))
+    server.listen(1)
+    printer = ZebraNetworkPrinter('127.0.0.1', server.getsockname()[1], timeout=1)
+
+    def broken_send(buffers):
+        raise ConnectionResetError('reset by peer')
+
+    monkeypatch.setattr(printer, '_send_buffers', broken_send)
+    with pytest.raises(ConnectionResetError):
+        printer.send_command('^XA^FDone^FS^XZ')
+    assert printer.unsent_writes == []
+    server.close()
@@ -0,0 +1,23 @@
+from pyzplcommander import ZplPrinterPoller
+
+
+class _OfflinePrinter:
+    def host_status_dict(self):
+        raise OSError('timed out')
+
+
+class _IdlePrinter:
+    def host_status_dict(self):
+        return {'paper_out': 'OK', 'labels_remaining': 0, 'number_of_formats_recv_buf': 0}
+
+
+def test_offline_printer_keeps_min_interval():
+    poller = ZplPrinterPoller({'p': _OfflinePrinter()}, min_interval=1, max_interval=60)
+    intervals = [poller.poll('p').interval for _ in range(5)]
+    assert intervals == [1] * 5
+    assert poller.snapshot['p'].state == 'offline'
+
+
+def test_idle_printer_backs_off():
+    poller = ZplPrinterPoller({'p': _IdlePrinter()}, min_interval=1, max_interval=4, backoff=2)
+    assert [poller.poll('p').interval for _ in range(4)] == [1, 2, 4, 4]
@@ -0,0 +1,45 @@
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from pyzplcommander import ZplLabel, ZplRasterizer  # noqa: E402
+
+
+def _ink_box(bitmap):
+    rows, columns = np.nonzero(bitmap)
+    return rows.max() - rows.min() + 1, columns.max() - columns.min() + 1
+
+
+@pytest.mark.parametrize('font, orientation, hand_written', [
+    ('0', None, '^XA^FO10,10^A0,60,20^FDAB^FS^XZ'),
+    ('0', 'N', '^XA^FO10,10^A0N,60,20^FDAB^FS^XZ'),
+    ('D', 'N', '^XA^FO10,10^ADN,60,20^FDAB^FS^XZ'),
+])
+def test_label_font_matches_hand_written_zpl(font, orientation, hand_written):
+    label = ZplLabel(None)
+    label.draw_text('AB', 10, 10, font=font, height=60, width=20, orientation=orientation)
+    rasterizer = ZplRasterizer()
+
+    from_label = rasterizer.render(label)
+    from_zpl = rasterizer.render(hand_written)
+
+    assert _ink_box(from_label) == _ink_box(from_zpl)
+    assert rasterizer.diff(from_label, from_zpl) == 0
+
+
+def test_label_font_orientation_only_uses_default_size():
+    label = ZplLabel(None)
+    label.draw_text('AB', 10, 10, font='0', orientation='R')
+    rasterizer = ZplRasterizer()
+    assert rasterizer.diff(rasterizer.render(label), rasterizer.render('^XA^FO10,10^A0R^FDAB^FS^XZ')) == 0
+
+
+@pytest.mark.parametrize('kwargs, expected', [
+    ({'font': '0', 'orientation': 'N', 'height': 60, 'width': 20}, '^A0N,60,20'),
+    ({'font': '0', 'height': 60, 'width': 20}, '^A0,60,20'),
+    ({'font': 'D', 'orientation': 'R'}, '^ADR^FD'),
+])
+def test_label_font_is_emitted_in_printer_form(kwargs, expected):
+    label = ZplLabel(None)
+    label.draw_text('AB', 10, 10, **kwargs)
+    assert expected in label.dump_zpl(break_lines=False)
@@ -0,0 +1,37 @@
+import os
+
+from pyzplcommander.senders import ZplFileSender
+
+_LABEL = b'^XA^FDlabel^FS^XZ\r\n'
+
+
+def _contents(sender: ZplFileSender) -> list[bytes]:
+    contents = []
+    for name in sender.files:
+        with open(name, 'rb') as file:
+            contents.append(file.read())
+    return contents
+
+
+def test_max_labels_splits_a_large_write(tmp_path):
+    sender = ZplFileSender(str(tmp_path), max_labels=2)
+    sender.send_command(_LABEL * 5)
+    sender.commit()
+    assert _contents(sender) == [_LABEL * 2, _LABEL * 2, _LABEL]
+
+
+def test_max_bytes_splits_at_label_end(tmp_path):
+    sender = ZplFileSender(str(tmp_path), max_bytes=len(_LABEL) * 2 - 5)
+    sender.send_commands([_LABEL * 3, b'^XA^FDpart', b'ial^FS^XZ'])
+    sender.commit()
+    assert _contents(sender) == [_LABEL * 2, _LABEL + b'^XA^FDpartial^FS^XZ']
+
+
+def test_limits_across_writes(tmp_path):
+    sender = ZplFileSender(str(tmp_path), max_labels=3)
+    for _ in range(4):
+        sender.send_command(_LABEL)
+    assert _contents(sender) == [_LABEL * 3]
+    sender.commit()
+    assert _contents(sender)[1:] == [_LABEL]
+    assert not [name for name in os.listdir(tmp_path) if name.endswith('.tmp')]
@@ -0,0 +1,74 @@
+import os
+import threading
+import time
+
+import pytest
+
+from pyzplcommander import ZebraSerialPrinter
+
+pty = pytest.importorskip('pty')
+
+
+@pytest.fixture
+def port():
+    master, slave = pty.openpty()
+    yield master, os.ttyname(slave)
+    os.close(slave)
+    os.close(master)
+
+
+def _read_all(fd: int, size: int) -> bytes:
+    data = b''
+    while len(data) < size:
+        data += os.read(fd, size - len(data))
+    return data
+
+
+def test_write_waits_for_xon_longer_than_response_timeout(port):
+    master, device = port
+    printer = ZebraSerialPrinter(device, timeout=0.05)
+    printer.connect()
+    os.write(master, b'\x13')  # XOFF
+    time.sleep(0.05)
+
+    def resume():
+        time.sleep(0.3)
+        os.write(master, b'\x11')  # XON
+
+    payload = b'^XA^FDlabel^FS^XZ' * 4096
+    received = []
+    thread = threading.Thread(target=resume, daemon=True)
+    thread.start()
+    reader = threading.Thread(target=lambda: received.append(_read_all(master, len(payload))), daemon=True)
+    reader.start()
+    printer.send_command(payload.decode())
+    reader.join(5)
+    printer.disconnect()
+    assert received == [payload]
+
+
+def test_write_timeout_raises_while_flow_is_held(port):
+    master, device = port
+    printer = ZebraSerialPrinter(device, write_timeout=0.1)
+    printer.connect()
+    os.write(master, b'\x13')  # XOFF
+    time.sleep(0.05)
+    with pytest.raises(TimeoutError):
+        printer.send_command('^XA^FDlabel^FS^XZ' * 4096)
+    printer.disconnect()
+
+
+def test_frame_gap_is_configurable(port):
+    master, device = port
+    printer = ZebraSerialPrinter(device, timeout=1, handshake=None, frame_gap=0.5)
+
+    def respond():
+        _read_all(master, len('~HS'))
+        os.write(master, b'\x02first\x03')
+        time.sleep(0.2)
+        os.write(master, b'\x02second\x03')
+
+    thread = threading.Thread(target=respond, daemon=True)
+    thread.start()
+    assert printer.send_command('~HS', get_response=True) == '\x02first\x03\x02second\x03'
+    printer.disconnect()
@@ -0,0 +1,40 @@
+import io
+
+from pyzplcommander.core import ZplCommandSender
+from pyzplcommander.trace import TRACE_SEND, ZplTraceRecorder, ZplTraceReplayer, read_trace
+
+
+class _Sender(ZplCommandSender):
+    def __init__(self):
+        self.sent = []
+
+    def send_command(self, command, get_response=False):
+        self.sent.append(command)
+        return 'ok' if get_response else None
+
+    def send_commands(self, commands, get_response=False):
+        self.sent.extend(commands)
+
+
+def _record(*commands) -> io.BytesIO:
+    trace = io.BytesIO()
+    recorder = ZplTraceRecorder(_Sender(), trace)
+    for command in commands:
+        recorder.send_command(command)
+    recorder.flush()
+    trace.seek(0)
+    return trace
+
+
+def test_bytes_commands_are_replayed_as_bytes():
+    trace = _record(b'\xff\x00', '^XA^XZ')
+    records = list(read_trace(trace))
+    assert [(record.kind, record.data, record.binary) for record in records] == [
+        (TRACE_SEND, b'\xff\x00', True), (TRACE_SEND, b'^XA^XZ', False)]
+
+    for speed in (None, 1000):
+        trace.seek(0)
+        printer = _Sender()
+        result = ZplTraceReplayer(trace, speed).replay(printer)
+        assert printer.sent == [b'\xff\x00', '^XA^XZ']
+        assert result.sent_bytes == 8